@@ -1,14 +1,16 @@
 """Configuration management for OpenCode Monitor."""
 
-import json
+import math
 import os
+import time
 import warnings
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-import toml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, ValidationError, field_validator
+
+from .utils import json_utils
 
 
 def opencode_storage_path(path: Optional[str] = None) -> str:
@@ -128,6 +130,10 @@ class Config(BaseModel):
     currency: CurrencyConfig = Field(default_factory=CurrencyConfig)
 
 
+# Decimal places kept by the integer per-token rates (1e-12 USD units)
+INT_RATE_SCALE = 12
+
+
 class ModelPricing(BaseModel):
     """Model for pricing information."""
     input: Decimal = Field(description="Cost per 1M input tokens")
@@ -137,6 +143,194 @@ class ModelPricing(BaseModel):
     context_window: int = Field(alias="contextWindow", description="Maximum context window size")
     session_quota: Decimal = Field(alias="sessionQuota", description="Maximum session cost quota")
 
+    _per_token_rates: Tuple[Decimal, Decimal, Decimal, Decimal] = PrivateAttr()
+    _int_token_rates: Optional[Tuple[int, int, int, int]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute per-token prices from the per-million prices."""
+        million = Decimal(1_000_000)
+        self._per_token_rates = (
+            self.input / million,
+            self.output / million,
+            self.cache_write / million,
+            self.cache_read / million,
+        )
+
+        int_rates = []
+        for rate in self._per_token_rates:
+            scaled = rate.scaleb(INT_RATE_SCALE)
+            if scaled != scaled.to_integral_value():
+                int_rates = None
+                break
+            int_rates.append(int(scaled))
+        self._int_token_rates = tuple(int_rates) if int_rates is not None else None
+
+    @property
+    def per_token_rates(self) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Get (input, output, cache_write, cache_read) cost per single token."""
+        return self._per_token_rates
+
+    @property
+    def int_token_rates(self) -> Optional[Tuple[int, int, int, int]]:
+        """Get per-token rates as integers in units of 10**-INT_RATE_SCALE USD.
+
+        None when a rate has more precision than the scale can hold exactly.
+        """
+        return self._int_token_rates
+
+
+# Raw pricing JSON keys mapped to ModelPricing field names
+_PRICING_FIELD_ALIASES = {
+    "input": "input",
+    "output": "output",
+    "cacheWrite": "cache_write",
+    "cacheRead": "cache_read",
+    "contextWindow": "context_window",
+    "sessionQuota": "session_quota",
+}
+
+
+# Single validator for whole pricing dicts, built on first use
+_PRICING_ADAPTER: Optional[TypeAdapter] = None
+
+
+def _get_pricing_adapter() -> TypeAdapter:
+    """Return the shared pricing-dict validator, building it on first use.
+
+    Building a TypeAdapter generates a Pydantic core schema, so it is
+    deferred until pricing data actually needs validating.
+
+    Returns:
+        TypeAdapter for ``Dict[str, ModelPricing]``
+    """
+    global _PRICING_ADAPTER
+    if _PRICING_ADAPTER is None:
+        _PRICING_ADAPTER = TypeAdapter(Dict[str, ModelPricing])
+    return _PRICING_ADAPTER
+
+
+def _construct_model_pricing(model_data: Any) -> Optional[ModelPricing]:
+    """Build a ModelPricing object from a well-formed raw pricing dict.
+
+    Entries with a plain JSON number for every field are coerced directly
+    and passed to ``ModelPricing.model_construct``, skipping Pydantic
+    validation.
+
+    Args:
+        model_data: Raw pricing dict using the JSON (alias) field names
+
+    Returns:
+        ModelPricing object, or None if the entry needs full validation
+    """
+    if not isinstance(model_data, dict):
+        return None
+
+    values: Dict[str, Any] = {}
+    for key, field_name in _PRICING_FIELD_ALIASES.items():
+        value = model_data.get(key)
+        value_type = type(value)
+        if field_name == "context_window":
+            if value_type is not int:
+                return None
+            values[field_name] = value
+        else:
+            if value_type is not int and (value_type is not float or not math.isfinite(value)):
+                return None
+            values[field_name] = Decimal(str(value))
+    return ModelPricing.model_construct(**values)
+
+
+def _validate_pricing_entries(raw_entries: Dict[str, Any]) -> Dict[str, ModelPricing]:
+    """Validate raw pricing entries into ModelPricing objects.
+
+    All entries are validated in one pass. If any entry is invalid, entries
+    are validated one by one so only the invalid ones are skipped, each
+    with a warning.
+
+    Args:
+        raw_entries: Dict mapping model names to raw pricing dicts
+
+    Returns:
+        Dict mapping model names to ModelPricing objects
+    """
+    if not raw_entries:
+        return {}
+
+    adapter = _get_pricing_adapter()
+    try:
+        return adapter.validate_python(raw_entries)
+    except ValidationError:
+        pass
+
+    pricing_data = {}
+    for model_name, model_data in raw_entries.items():
+        try:
+            pricing_data[model_name] = adapter.validate_python({model_name: model_data})[model_name]
+        except ValidationError as e:
+            # Skip invalid entries with warning
+            warnings.warn(
+                f"Skipping invalid pricing data for model '{model_name}': {e}",
+                UserWarning,
+                stacklevel=4,
+            )
+    return pricing_data
+
+
+class PricingTable(dict):
+    """Loaded model pricing, keyed by model name.
+
+    Also memoizes which pricing key a model ID without an exact entry
+    resolves to. The memo lives and dies with the table, so loading or
+    reloading pricing starts a fresh one, and any change to the table's
+    entries clears it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.key_memo: Dict[str, Optional[str]] = {}
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.key_memo.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.key_memo.clear()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "PricingTable":
+        self.key_memo.clear()
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self.key_memo.clear()
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self.key_memo.clear()
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        self.key_memo.clear()
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.key_memo.clear()
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.key_memo.clear()
+        super().update(*args, **kwargs)
+
+
+# Parsed pricing files keyed by (absolute path, mtime_ns, size). Entries are
+# shared between ConfigManager instances and must be treated as read-only.
+_RAW_PRICING_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Mapped models.dev pricing keyed by (remote_url, cache_path), stored with the
+# time.monotonic() it was loaded. Shared across ConfigManager instances;
+# entries expire after the configured remote cache TTL or on reload().
+_REMOTE_PRICING_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
 
 def merge_model_prices(
     local_raw: Dict[str, Any],
@@ -149,7 +343,11 @@ def merge_model_prices(
     1. User override file (user_raw)
     2. Project/local models.json (local_raw)
     3. models.dev fallback (remote_raw) - fill-only
-    
+
+    Entries found in a single source are shared with that source rather
+    than copied, so neither the sources nor the result may be mutated.
+    Only models present in several sources get a new, merged dict.
+
     Args:
         local_raw: Raw pricing dict from local models.json
         user_raw: Raw pricing dict from user override file
@@ -158,29 +356,18 @@ def merge_model_prices(
     Returns:
         Merged raw pricing dict
     """
-    merged = {}
-    
-    # Start with remote data (lowest precedence - fill-only)
-    if remote_raw:
-        for model_name, model_data in remote_raw.items():
-            merged[model_name] = model_data.copy()
-    
-    # Overlay local data (middle precedence)
-    for model_name, model_data in local_raw.items():
-        if model_name in merged:
-            # Field-level merge: local overwrites remote for existing model
-            merged[model_name].update(model_data)
-        else:
-            merged[model_name] = model_data.copy()
-    
-    # Overlay user data (highest precedence)
-    for model_name, model_data in user_raw.items():
-        if model_name in merged:
-            # Field-level merge: user overwrites everything for existing model
-            merged[model_name].update(model_data)
-        else:
-            merged[model_name] = model_data.copy()
-    
+    merged: Dict[str, Any] = {}
+
+    # Remote first (fill-only), then local, then user overrides
+    for source in (remote_raw or {}, local_raw, user_raw):
+        for model_name, model_data in source.items():
+            existing = merged.get(model_name)
+            if existing is None:
+                merged[model_name] = model_data
+            else:
+                # Field-level merge: later sources overwrite earlier ones
+                merged[model_name] = {**existing, **model_data}
+
     return merged
 
 
@@ -234,10 +421,15 @@ class ConfigManager:
             return Config()
 
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = toml.load(f)
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+
+        try:
+            with open(self.config_path, 'rb') as f:
+                config_data = tomllib.load(f)
             return Config(**config_data)
-        except (toml.TomlDecodeError, ValueError) as e:
+        except (tomllib.TOMLDecodeError, ValueError) as e:
             raise ValueError(f"Invalid configuration file {self.config_path}: {e}")
 
     def load_pricing_data(self, no_remote: bool = False) -> Dict[str, ModelPricing]:
@@ -263,58 +455,118 @@ class ConfigManager:
             Dict mapping model names to ModelPricing objects
         """
         models_config = self.config.models
-        
-        # Load local project pricing file (with package fallback for default models)
-        local_raw = self._load_raw_pricing_file(models_config.config_file, use_package_fallback=True)
-        
-        # Load user override file if it exists
-        user_raw = {}
-        if models_config.user_file:
-            user_path = Path(models_config.user_file)
-            if user_path.exists():
-                user_raw = self._load_raw_pricing_file(str(user_path))
-        
-        # Load remote pricing if enabled and not disabled by CLI flag
-        remote_raw = {}
+
+        # Use memoized remote pricing (if enabled and not disabled by CLI
+        # flag); otherwise fetch it in a worker thread so network and
+        # cache-file I/O overlap the local loads
+        executor = None
+        remote_future = None
+        remote_raw: Optional[Dict[str, Any]] = None
         if not no_remote and models_config.remote_fallback:
-            try:
-                from .services.price_fetcher import get_remote_payload, map_models_dev_to_local
-                
-                cache_path = Path(models_config.remote_cache_path)
-                payload = get_remote_payload(
-                    url=models_config.remote_url,
-                    timeout=models_config.remote_timeout_seconds,
-                    cache_path=cache_path,
-                    cache_ttl_hours=models_config.remote_cache_ttl_hours,
-                    allow_stale_on_error=models_config.allow_stale_cache_on_error,
-                )
-                
-                if payload is not None:
-                    remote_raw = map_models_dev_to_local(payload)
-            except Exception:
-                # Remote fetch failed, continue with local-only pricing
-                # Don't fail the entire operation due to remote issues
-                pass
+            remote_raw = self._get_memoized_remote_pricing(models_config)
+            if remote_raw is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                executor = ThreadPoolExecutor(max_workers=1)
+                remote_future = executor.submit(self._load_remote_pricing, models_config)
+
+        try:
+            # Load local project pricing file (with package fallback for default models)
+            local_raw = self._load_raw_pricing_file(models_config.config_file, use_package_fallback=True)
+
+            # Load user override file if it exists
+            user_raw = {}
+            if models_config.user_file:
+                user_path = Path(models_config.user_file)
+                if user_path.exists():
+                    user_raw = self._load_raw_pricing_file(str(user_path))
+
+            if remote_future is not None:
+                remote_raw = remote_future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
         
         # Merge all sources
-        merged_raw = merge_model_prices(local_raw, user_raw, remote_raw)
+        merged_raw = merge_model_prices(local_raw, user_raw, remote_raw or {})
         
-        # Validate each merged entry into ModelPricing objects
-        pricing_data = {}
+        # Build well-formed entries directly, validate the rest in one pass
+        constructed = {}
+        needs_validation = {}
         for model_name, model_data in merged_raw.items():
-            try:
-                pricing_data[model_name] = ModelPricing(**model_data)
-            except (ValueError, TypeError) as e:
-                # Skip invalid entries with warning
-                warnings.warn(
-                    f"Skipping invalid pricing data for model '{model_name}': {e}",
-                    UserWarning,
-                    stacklevel=2,
-                )
-                continue
-        
+            pricing = _construct_model_pricing(model_data)
+            if pricing is None:
+                needs_validation[model_name] = model_data
+            else:
+                constructed[model_name] = pricing
+        validated = _validate_pricing_entries(needs_validation)
+
+        # Keep merge order, which decides prefix-match precedence in lookups
+        pricing_data = PricingTable()
+        for model_name in merged_raw:
+            pricing = constructed.get(model_name) or validated.get(model_name)
+            if pricing is not None:
+                pricing_data[model_name] = pricing
+
         return pricing_data
 
+    @staticmethod
+    def _get_memoized_remote_pricing(models_config: ModelsConfig) -> Optional[Dict[str, Any]]:
+        """Get mapped remote pricing memoized within the cache TTL, if any.
+
+        Args:
+            models_config: Models configuration with the remote settings
+
+        Returns:
+            Raw pricing dict, or None if nothing fresh is memoized
+        """
+        cache_key = (models_config.remote_url, str(Path(models_config.remote_cache_path)))
+        cached = _REMOTE_PRICING_CACHE.get(cache_key)
+        ttl_seconds = models_config.remote_cache_ttl_hours * 3600
+        if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+            return cached[1]
+        return None
+
+    def _load_remote_pricing(self, models_config: ModelsConfig) -> Dict[str, Any]:
+        """Load raw pricing mapped from the models.dev payload.
+
+        Mapped pricing is memoized per (remote_url, cache_path) for the
+        configured cache TTL.
+
+        Args:
+            models_config: Models configuration with the remote settings
+
+        Returns:
+            Raw pricing dict, empty if the remote payload is unavailable
+        """
+        try:
+            from .services.price_fetcher import get_remote_payload, map_models_dev_to_local
+
+            memoized = self._get_memoized_remote_pricing(models_config)
+            if memoized is not None:
+                return memoized
+
+            cache_path = Path(models_config.remote_cache_path)
+            cache_key = (models_config.remote_url, str(cache_path))
+
+            payload = get_remote_payload(
+                url=models_config.remote_url,
+                timeout=models_config.remote_timeout_seconds,
+                cache_path=cache_path,
+                cache_ttl_hours=models_config.remote_cache_ttl_hours,
+                allow_stale_on_error=models_config.allow_stale_cache_on_error,
+            )
+
+            if payload is not None:
+                remote_raw = map_models_dev_to_local(payload)
+                _REMOTE_PRICING_CACHE[cache_key] = (time.monotonic(), remote_raw)
+                return remote_raw
+        except Exception:
+            # Remote fetch failed, continue with local-only pricing
+            # Don't fail the entire operation due to remote issues
+            pass
+        return {}
+
     def _load_raw_pricing_file(self, file_path: str, use_package_fallback: bool = False) -> Dict[str, Any]:
         """Load raw pricing data from a JSON file.
         
@@ -345,15 +597,26 @@ class ConfigManager:
             if os.path.exists(package_models):
                 file_path = package_models
         
-        if not os.path.exists(file_path):
+        try:
+            file_path = os.path.abspath(file_path)
+            st = os.stat(file_path)
+        except OSError:
             return {}
-        
+
+        cache_key = (file_path, st.st_mtime_ns, st.st_size)
+        cached = _RAW_PRICING_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(file_path, 'rb') as f:
+                raw_data = json_utils.loads(f.read())
+        except (ValueError, IOError):
             return {}
 
+        _RAW_PRICING_CACHE[cache_key] = raw_data
+        return raw_data
+
     def get_model_pricing(self, model_name: str, no_remote: bool = False) -> Optional[ModelPricing]:
         """Get pricing information for a specific model.
         
@@ -371,6 +634,8 @@ class ConfigManager:
         """Reload configuration and pricing data."""
         self._config = None
         self._pricing_data = None
+        _RAW_PRICING_CACHE.clear()
+        _REMOTE_PRICING_CACHE.clear()
 
 
 # Global configuration manager instance
@@ -1,10 +1,12 @@
 """Session data models for OpenCode Monitor."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Literal
+from typing import Iterable, List, Optional, Dict, Any, Literal, Tuple
 from pathlib import Path
 from decimal import Decimal
-from pydantic import BaseModel, Field, computed_field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator, ConfigDict
+
+from ..config import INT_RATE_SCALE
 
 
 class TokenUsage(BaseModel):
@@ -20,13 +22,41 @@ class TokenUsage(BaseModel):
         """Calculate total tokens."""
         return self.input + self.output + self.cache_write + self.cache_read
 
+    @classmethod
+    def from_counts(
+        cls, input: Any = 0, output: Any = 0, cache_write: Any = 0, cache_read: Any = 0
+    ) -> "TokenUsage":
+        """Build a TokenUsage from raw token counts.
+
+        Non-negative plain ints skip validation via ``model_construct``;
+        anything else goes through the validating constructor.
+
+        Args:
+            input: Input token count
+            output: Output token count
+            cache_write: Cache write token count
+            cache_read: Cache read token count
+
+        Returns:
+            TokenUsage object
+        """
+        if (
+            type(input) is int and input >= 0
+            and type(output) is int and output >= 0
+            and type(cache_write) is int and cache_write >= 0
+            and type(cache_read) is int and cache_read >= 0
+        ):
+            return cls.model_construct(
+                input=input, output=output, cache_write=cache_write, cache_read=cache_read
+            )
+        return cls(input=input, output=output, cache_write=cache_write, cache_read=cache_read)
+
 
 class TimeData(BaseModel):
     """Model for timing information."""
     created: Optional[int] = Field(default=None, description="Creation timestamp in milliseconds")
     completed: Optional[int] = Field(default=None, description="Completion timestamp in milliseconds")
 
-    @computed_field
     @property
     def duration_ms(self) -> Optional[int]:
         """Calculate duration in milliseconds."""
@@ -34,7 +64,6 @@ class TimeData(BaseModel):
             return self.completed - self.created
         return None
 
-    @computed_field
     @property
     def created_datetime(self) -> Optional[datetime]:
         """Get creation time as datetime object."""
@@ -42,7 +71,6 @@ class TimeData(BaseModel):
             return datetime.fromtimestamp(self.created / 1000)
         return None
 
-    @computed_field
     @property
     def completed_datetime(self) -> Optional[datetime]:
         """Get completion time as datetime object."""
@@ -50,6 +78,118 @@ class TimeData(BaseModel):
             return datetime.fromtimestamp(self.completed / 1000)
         return None
 
+    @classmethod
+    def from_timestamps(cls, created: Any = None, completed: Any = None) -> "TimeData":
+        """Build a TimeData from raw millisecond timestamps.
+
+        Plain ints or None skip validation via ``model_construct``;
+        anything else goes through the validating constructor.
+
+        Args:
+            created: Creation timestamp in milliseconds
+            completed: Completion timestamp in milliseconds
+
+        Returns:
+            TimeData object
+        """
+        if (created is None or type(created) is int) and (completed is None or type(completed) is int):
+            return cls.model_construct(created=created, completed=completed)
+        return cls(created=created, completed=completed)
+
+
+def _find_pricing_key(model_id: str, pricing_data: Dict[str, Any]) -> Optional[str]:
+    """Find the pricing key for a model ID that has no exact match.
+
+    Args:
+        model_id: Model ID as recorded by OpenCode
+        pricing_data: Dictionary of model pricing information
+
+    Returns:
+        Matching key in pricing_data or None if not found
+    """
+    # Try prefix matching - extract base model name
+    # e.g., claude-opus-4.5-20251101 -> claude-opus-4.5
+    from ..utils.file_utils import FileProcessor
+    normalized = FileProcessor._normalize_model_name(model_id)
+
+    if normalized in pricing_data:
+        return normalized
+
+    # Try finding a matching key by prefix
+    for key in pricing_data.keys():
+        if normalized.startswith(key) or key.startswith(normalized):
+            # Check if they're similar (same model family)
+            # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
+            if key.replace('-extended', '') == normalized or \
+               normalized.replace('-extended', '') == key:
+                return key
+
+    return None
+
+
+def _resolve_pricing(model_id: str, pricing_data: Dict[str, Any]) -> Optional[Any]:
+    """Find pricing for a model ID with flexible model name matching.
+
+    Exact matches are a single dict lookup. When the pricing was loaded as
+    a PricingTable, fuzzy matches are memoized on the table per model ID,
+    so repeated lookups of the same model skip the normalization and
+    prefix scan.
+
+    Args:
+        model_id: Model ID as recorded by OpenCode
+        pricing_data: Dictionary of model pricing information
+
+    Returns:
+        Pricing entry for the model or None if not found
+    """
+    # First try exact match
+    if model_id in pricing_data:
+        return pricing_data[model_id]
+
+    memo = getattr(pricing_data, 'key_memo', None)
+    if memo is None:
+        key = _find_pricing_key(model_id, pricing_data)
+    elif model_id in memo:
+        key = memo[model_id]
+    else:
+        key = memo[model_id] = _find_pricing_key(model_id, pricing_data)
+
+    return pricing_data.get(key) if key is not None else None
+
+
+def _cost_from_token_counts(
+    input_tokens: int,
+    output_tokens: int,
+    cache_write_tokens: int,
+    cache_read_tokens: int,
+    pricing: Any,
+) -> Decimal:
+    """Price raw token counts against a single model's pricing entry.
+
+    Token counts may be summed across many interactions of the same model
+    before pricing; the result is identical because Decimal math is exact.
+    Uses the per-token rates precomputed by ModelPricing, multiplying in plain
+    integers when the rates are exact at INT_RATE_SCALE.
+    """
+    int_rates = pricing.int_token_rates
+    if int_rates is not None:
+        input_rate, output_rate, cache_write_rate, cache_read_rate = int_rates
+        scaled_total = (
+            input_tokens * input_rate
+            + output_tokens * output_rate
+            + cache_write_tokens * cache_write_rate
+            + cache_read_tokens * cache_read_rate
+        )
+        return Decimal(scaled_total).scaleb(-INT_RATE_SCALE)
+
+    input_rate, output_rate, cache_write_rate, cache_read_rate = pricing.per_token_rates
+    return (
+        input_tokens * input_rate
+        + output_tokens * output_rate
+        + cache_write_tokens * cache_write_rate
+        + cache_read_tokens * cache_read_rate
+    )
+
 
 class InteractionFile(BaseModel):
     """Model for a single OpenCode interaction file."""
@@ -65,25 +205,35 @@ class InteractionFile(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _mtime: Optional[float] = PrivateAttr(default=None)
+
     @field_validator('file_path')
     @classmethod
     def validate_file_path(cls, v):
         """Ensure file path is a Path object."""
         return Path(v) if not isinstance(v, Path) else v
 
-    @computed_field
     @property
     def file_name(self) -> str:
         """Get the file name."""
         return self.file_path.name
 
-    @computed_field
     @property
     def modification_time(self) -> datetime:
-        """Get file modification time."""
-        return datetime.fromtimestamp(self.file_path.stat().st_mtime)
+        """Get file modification time.
+
+        The file is stat'ed on first access only. Interactions are rebuilt
+        whenever their file is re-read, which refreshes the cached mtime.
+        """
+        return datetime.fromtimestamp(self.modification_timestamp)
+
+    @property
+    def modification_timestamp(self) -> float:
+        """Get file modification time as a Unix timestamp (stat'ed once)."""
+        if self._mtime is None:
+            self._mtime = self.file_path.stat().st_mtime
+        return self._mtime
 
-    @computed_field
     @property
     def project_name(self) -> str:
         """Get project name from project path."""
@@ -102,6 +252,13 @@ class InteractionFile(BaseModel):
                 and self.time_data.duration_ms is not None
                 and self.time_data.duration_ms > 0)
 
+    def _stored_cost(self) -> Optional[Decimal]:
+        """Get OpenCode's pre-computed cost for this interaction, if any."""
+        stored_cost = self.raw_data.get('cost')
+        if stored_cost is not None and stored_cost > 0:
+            return Decimal(str(stored_cost))
+        return None
+
     def _calculate_cost_from_tokens(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate cost from token usage using pricing data.
 
@@ -111,44 +268,17 @@ class InteractionFile(BaseModel):
         Returns:
             Calculated cost in USD
         """
-        pricing = None
-
-        # First try exact match
-        if self.model_id in pricing_data:
-            pricing = pricing_data[self.model_id]
-        else:
-            # Try prefix matching - extract base model name
-            # e.g., claude-opus-4.5-20251101 -> claude-opus-4.5
-            from ..utils.file_utils import FileProcessor
-            normalized = FileProcessor._normalize_model_name(self.model_id)
-
-            if normalized in pricing_data:
-                pricing = pricing_data[normalized]
-            else:
-                # Try finding a matching key by prefix
-                for key in pricing_data.keys():
-                    if normalized.startswith(key) or key.startswith(normalized):
-                        # Check if they're similar (same model family)
-                        # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
-                        if key.replace('-extended', '') == normalized or \
-                           normalized.replace('-extended', '') == key:
-                            pricing = pricing_data[key]
-                            break
-
+        pricing = _resolve_pricing(self.model_id, pricing_data)
         if pricing is None:
             return Decimal('0.0')
 
-        cost = Decimal('0.0')
-
-        # Convert to cost per million tokens
-        million = Decimal('1000000')
-
-        cost += (Decimal(self.tokens.input) / million) * Decimal(str(pricing.input))
-        cost += (Decimal(self.tokens.output) / million) * Decimal(str(pricing.output))
-        cost += (Decimal(self.tokens.cache_write) / million) * Decimal(str(pricing.cache_write))
-        cost += (Decimal(self.tokens.cache_read) / million) * Decimal(str(pricing.cache_read))
-
-        return cost
+        return _cost_from_token_counts(
+            self.tokens.input,
+            self.tokens.output,
+            self.tokens.cache_write,
+            self.tokens.cache_read,
+            pricing,
+        )
 
     def calculate_cost(self, pricing_data: Dict[str, Any], force_recalculate: bool = False) -> Decimal:
         """Calculate cost for this interaction with flexible model name matching.
@@ -164,13 +294,64 @@ class InteractionFile(BaseModel):
             Calculated cost in USD
         """
         if not force_recalculate:
-            stored_cost = self.raw_data.get('cost')
-            if stored_cost is not None and stored_cost > 0:
-                return Decimal(str(stored_cost))
+            stored_cost = self._stored_cost()
+            if stored_cost is not None:
+                return stored_cost
 
         return self._calculate_cost_from_tokens(pricing_data)
 
 
+def _tokens_and_costs_by_model(
+    files: Iterable[InteractionFile], pricing_data: Dict[str, Any], force_recalculate: bool
+) -> Tuple[Dict[str, int], Dict[str, Decimal]]:
+    """Total the tokens and cost of each model's interactions in one pass.
+
+    Stored costs are added per file. Token counts of the remaining files
+    are summed per model and priced once per model instead of running the
+    Decimal pricing math for every interaction file.
+
+    Args:
+        files: Interaction files, possibly spanning several sessions
+        pricing_data: Dictionary of model pricing information
+        force_recalculate: If True, ignore stored costs and recalculate from pricing data
+
+    Returns:
+        Tuple of (total tokens per model, cost per model), both in first-use order
+    """
+    tokens_by_model: Dict[str, int] = {}
+    costs: Dict[str, Decimal] = {}
+    token_counts: Dict[str, List[int]] = {}
+    for file in files:
+        model_id = file.model_id
+        tokens = file.tokens
+        if model_id in tokens_by_model:
+            tokens_by_model[model_id] += tokens.total
+        else:
+            tokens_by_model[model_id] = tokens.total
+            costs[model_id] = Decimal('0.0')
+
+        if not force_recalculate:
+            stored_cost = file._stored_cost()
+            if stored_cost is not None:
+                costs[model_id] += stored_cost
+                continue
+
+        counts = token_counts.get(model_id)
+        if counts is None:
+            counts = token_counts[model_id] = [0, 0, 0, 0]
+        counts[0] += tokens.input
+        counts[1] += tokens.output
+        counts[2] += tokens.cache_write
+        counts[3] += tokens.cache_read
+
+    for model_id, counts in token_counts.items():
+        pricing = _resolve_pricing(model_id, pricing_data)
+        if pricing is not None:
+            costs[model_id] += _cost_from_token_counts(*counts, pricing)
+
+    return tokens_by_model, costs
+
+
 class SessionData(BaseModel):
     """Model for a complete OpenCode session."""
     session_id: str
@@ -184,6 +365,8 @@ class SessionData(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _aggregates_cache: Optional[Tuple[List[InteractionFile], int, Dict[str, Any]]] = PrivateAttr(default=None)
+
     @field_validator('session_path')
     @classmethod
     def validate_session_path(cls, v):
@@ -192,41 +375,116 @@ class SessionData(BaseModel):
             return None
         return Path(v) if not isinstance(v, Path) else v
 
-    @computed_field
+    def _aggregates(self) -> Dict[str, Any]:
+        """Compute per-file aggregates in a single pass over the files.
+
+        The result is memoized against the files list and its length, so
+        assigning a new list or adding and removing files recomputes it.
+        Holding the list keeps its identity from being reused. Replacing a
+        file at the same index is not detected; call invalidate_aggregates
+        after doing so.
+        """
+        files = self.files
+        cached = self._aggregates_cache
+        if cached is not None and cached[0] is files and cached[1] == len(files):
+            return cached[2]
+
+        input_tokens = output_tokens = cache_write = cache_read = 0
+        processing_time_ms = 0
+        first_created: Optional[int] = None
+        last_completed: Optional[int] = None
+        # Per-model file groups and [input, output, cache_write, cache_read, duration_ms] sums
+        model_files: Dict[str, List[InteractionFile]] = {}
+        model_totals: Dict[str, List[int]] = {}
+        # Per-model output rates of rate-eligible interactions (see is_rate_eligible)
+        model_rates: Dict[str, List[float]] = {}
+        project_path_counts: Dict[str, int] = {}
+
+        for file in files:
+            tokens = file.tokens
+            input_tokens += tokens.input
+            output_tokens += tokens.output
+            cache_write += tokens.cache_write
+            cache_read += tokens.cache_read
+            if file.project_path:
+                project_path_counts[file.project_path] = project_path_counts.get(file.project_path, 0) + 1
+
+            duration_ms = 0
+            time_data = file.time_data
+            if time_data:
+                created = time_data.created
+                completed = time_data.completed
+                if created is not None and (first_created is None or created < first_created):
+                    first_created = created
+                if completed is not None and (last_completed is None or completed > last_completed):
+                    last_completed = completed
+                if created is not None and completed is not None:
+                    duration_ms = completed - created
+                    processing_time_ms += duration_ms
+
+            totals = model_totals.get(file.model_id)
+            if totals is None:
+                totals = model_totals[file.model_id] = [0, 0, 0, 0, 0]
+                model_files[file.model_id] = []
+                model_rates[file.model_id] = []
+            model_files[file.model_id].append(file)
+            output = tokens.output
+            if output > 0 and duration_ms > 0 and not (output < 100 and file.finish_reason == "tool-calls"):
+                model_rates[file.model_id].append(output / (duration_ms / 1000))
+            totals[0] += tokens.input
+            totals[1] += tokens.output
+            totals[2] += tokens.cache_write
+            totals[3] += tokens.cache_read
+            totals[4] += duration_ms
+
+        # max() keeps the first-seen path among equally common ones
+        most_common_path = (
+            max(project_path_counts, key=project_path_counts.get) if project_path_counts else None
+        )
+
+        aggregates = {
+            'tokens': (input_tokens, output_tokens, cache_write, cache_read),
+            'start_time': datetime.fromtimestamp(first_created / 1000) if first_created is not None else None,
+            'end_time': datetime.fromtimestamp(last_completed / 1000) if last_completed is not None else None,
+            'processing_time_ms': processing_time_ms,
+            'model_files': model_files,
+            'model_totals': model_totals,
+            'model_rates': model_rates,
+            'project_name': Path(most_common_path).name if most_common_path else "Unknown",
+        }
+        self._aggregates_cache = (files, len(files), aggregates)
+        return aggregates
+
+    def invalidate_aggregates(self) -> None:
+        """Drop the memoized aggregates after files were replaced in place."""
+        self._aggregates_cache = None
+
     @property
     def models_used(self) -> List[str]:
         """Get list of unique models used in this session."""
-        return list(set(file.model_id for file in self.files))
+        return list(self._aggregates()['model_files'])
 
-    @computed_field
     @property
     def total_tokens(self) -> TokenUsage:
         """Calculate total token usage for the session."""
-        total = TokenUsage()
-        for file in self.files:
-            total.input += file.tokens.input
-            total.output += file.tokens.output
-            total.cache_write += file.tokens.cache_write
-            total.cache_read += file.tokens.cache_read
-        return total
+        input_tokens, output_tokens, cache_write, cache_read = self._aggregates()['tokens']
+        return TokenUsage.model_construct(
+            input=input_tokens,
+            output=output_tokens,
+            cache_write=cache_write,
+            cache_read=cache_read,
+        )
 
-    @computed_field
     @property
     def start_time(self) -> Optional[datetime]:
         """Get session start time (earliest file creation time)."""
-        times = [file.time_data.created_datetime for file in self.files
-                if file.time_data and file.time_data.created_datetime]
-        return min(times) if times else None
+        return self._aggregates()['start_time']
 
-    @computed_field
     @property
     def end_time(self) -> Optional[datetime]:
         """Get session end time (latest file completion time)."""
-        times = [file.time_data.completed_datetime for file in self.files
-                if file.time_data and file.time_data.completed_datetime]
-        return max(times) if times else None
+        return self._aggregates()['end_time']
 
-    @computed_field
     @property
     def duration_ms(self) -> Optional[int]:
         """Calculate total session duration in milliseconds."""
@@ -234,7 +492,6 @@ class SessionData(BaseModel):
             return int((self.end_time - self.start_time).total_seconds() * 1000)
         return None
 
-    @computed_field
     @property
     def duration_hours(self) -> float:
         """Calculate session duration in hours."""
@@ -242,22 +499,28 @@ class SessionData(BaseModel):
             return self.duration_ms / (1000 * 60 * 60)
         return 0.0
 
-    @computed_field
     @property
     def duration_percentage(self) -> float:
         """Calculate session duration as percentage of 5-hour maximum."""
         max_hours = 5.0
         return min(100.0, (self.duration_hours / max_hours) * 100.0)
 
-    @computed_field
     @property
     def total_processing_time_ms(self) -> int:
         """Calculate total processing time across all files."""
-        total = 0
-        for file in self.files:
-            if file.time_data and file.time_data.duration_ms:
-                total += file.time_data.duration_ms
-        return total
+        return self._aggregates()['processing_time_ms']
+
+    def _costs_by_model(self, pricing_data: Dict[str, Any], force_recalculate: bool) -> Dict[str, Decimal]:
+        """Calculate the cost of each model's interactions in one pass.
+
+        Args:
+            pricing_data: Dictionary of model pricing information
+            force_recalculate: If True, ignore stored costs and recalculate from pricing data
+
+        Returns:
+            Dict mapping model IDs to their total cost, in first-use order
+        """
+        return _tokens_and_costs_by_model(self.files, pricing_data, force_recalculate)[1]
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any], force_recalculate: bool = False) -> Decimal:
         """Calculate total cost for the session.
@@ -266,8 +529,7 @@ class SessionData(BaseModel):
             pricing_data: Dictionary of model pricing information
             force_recalculate: If True, ignore stored costs and recalculate from pricing data
         """
-        costs = [file.calculate_cost(pricing_data, force_recalculate) for file in self.files]
-        return Decimal(sum(costs))
+        return sum(self._costs_by_model(pricing_data, force_recalculate).values(), Decimal('0.0'))
 
     def get_model_breakdown(self, pricing_data: Dict[str, Any], force_recalculate: bool = False) -> Dict[str, Dict[str, Any]]:
         """Get breakdown of usage and cost by model.
@@ -276,38 +538,29 @@ class SessionData(BaseModel):
             pricing_data: Dictionary of model pricing information
             force_recalculate: If True, ignore stored costs and recalculate from pricing data
         """
+        aggregates = self._aggregates()
+        costs = self._costs_by_model(pricing_data, force_recalculate)
         breakdown = {}
 
-        for model in self.models_used:
-            model_files = [f for f in self.files if f.model_id == model]
-            model_tokens = TokenUsage()
-            model_cost = Decimal('0.0')
-            model_duration_ms = 0
-            interaction_rates: list[float] = []
-
-            for file in model_files:
-                model_tokens.input += file.tokens.input
-                model_tokens.output += file.tokens.output
-                model_tokens.cache_write += file.tokens.cache_write
-                model_tokens.cache_read += file.tokens.cache_read
-                model_cost += file.calculate_cost(pricing_data, force_recalculate)
-                if file.time_data and file.time_data.duration_ms:
-                    model_duration_ms += file.time_data.duration_ms
-                if file.is_rate_eligible:
-                    rate = file.tokens.output / (file.time_data.duration_ms / 1000)
-                    interaction_rates.append(rate)
+        for model, model_files in aggregates['model_files'].items():
+            input_tokens, output_tokens, cache_write, cache_read, model_duration_ms = \
+                aggregates['model_totals'][model]
 
             breakdown[model] = {
                 'files': len(model_files),
-                'tokens': model_tokens,
-                'cost': model_cost,
+                'tokens': TokenUsage.model_construct(
+                    input=input_tokens,
+                    output=output_tokens,
+                    cache_write=cache_write,
+                    cache_read=cache_read,
+                ),
+                'cost': costs[model],
                 'duration_ms': model_duration_ms,
-                'interaction_rates': interaction_rates,
+                'interaction_rates': list(aggregates['model_rates'][model]),
             }
 
         return breakdown
 
-    @computed_field
     @property
     def interaction_count(self) -> int:
         """Get number of interactions (files) in this session."""
@@ -318,26 +571,11 @@ class SessionData(BaseModel):
         """Get files with non-zero token usage."""
         return [file for file in self.files if file.tokens.total > 0]
 
-    @computed_field
     @property
     def project_name(self) -> str:
         """Get project name for this session based on most common project path."""
-        if not self.files:
-            return "Unknown"
-        
-        # Get project paths from files that have them
-        project_paths = [f.project_path for f in self.files if f.project_path]
-        
-        if not project_paths:
-            return "Unknown"
-        
-        # Use the most common project path (in case there are mixed paths)
-        from collections import Counter
-        most_common_path = Counter(project_paths).most_common(1)[0][0]
-        
-        return Path(most_common_path).name if most_common_path else "Unknown"
+        return self._aggregates()['project_name']
 
-    @computed_field
     @property
     def display_title(self) -> str:
         """Get display-friendly session title, with fallback to session ID."""
@@ -1,7 +1,7 @@
 """Tool usage models for OpenCode Monitor."""
 
-from typing import List
-from pydantic import BaseModel, computed_field
+from typing import Any, List
+from pydantic import BaseModel
 
 
 class ToolUsageStats(BaseModel):
@@ -11,7 +11,6 @@ class ToolUsageStats(BaseModel):
     success_count: int = 0
     failure_count: int = 0
 
-    @computed_field
     @property
     def success_rate(self) -> float:
         """Calculate success rate as percentage."""
@@ -19,30 +18,64 @@ class ToolUsageStats(BaseModel):
             return 0.0
         return (self.success_count / self.total_calls) * 100.0
 
+    @classmethod
+    def from_counts(
+        cls, tool_name: Any, total_calls: Any, success_count: Any, failure_count: Any
+    ) -> "ToolUsageStats":
+        """Build a ToolUsageStats from raw call counts.
+
+        A str name with plain int counts skips validation via
+        ``model_construct``; anything else goes through the validating
+        constructor.
+
+        Args:
+            tool_name: Name of the tool
+            total_calls: Total number of calls
+            success_count: Number of successful calls
+            failure_count: Number of failed calls
+
+        Returns:
+            ToolUsageStats object
+        """
+        if (
+            type(tool_name) is str
+            and type(total_calls) is int
+            and type(success_count) is int
+            and type(failure_count) is int
+        ):
+            return cls.model_construct(
+                tool_name=tool_name,
+                total_calls=total_calls,
+                success_count=success_count,
+                failure_count=failure_count,
+            )
+        return cls(
+            tool_name=tool_name,
+            total_calls=total_calls,
+            success_count=success_count,
+            failure_count=failure_count,
+        )
+
 
 class ToolUsageSummary(BaseModel):
     """Summary of all tool usage across sessions."""
     tool_stats: List[ToolUsageStats] = []
 
-    @computed_field
     @property
     def total_calls(self) -> int:
         """Total calls across all tools."""
         return sum(t.total_calls for t in self.tool_stats)
 
-    @computed_field
     @property
     def total_success(self) -> int:
         """Total successful calls across all tools."""
         return sum(t.success_count for t in self.tool_stats)
 
-    @computed_field
     @property
     def total_failures(self) -> int:
         """Total failed calls across all tools."""
         return sum(t.failure_count for t in self.tool_stats)
 
-    @computed_field
     @property
     def overall_success_rate(self) -> float:
         """Overall success rate across all tools."""
@@ -56,7 +89,6 @@ class ModelToolUsage(BaseModel):
     model_name: str
     tool_stats: List[ToolUsageStats] = []
 
-    @computed_field
     @property
     def total_calls(self) -> int:
         """Total tool calls for this model."""
@@ -1,11 +1,42 @@
 """Workflow models for grouping related sessions."""
 
 from datetime import datetime
-from typing import List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from decimal import Decimal
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, PrivateAttr, computed_field
 
-from .session import SessionData, TokenUsage
+from .session import SessionData, TokenUsage, _tokens_and_costs_by_model
+
+
+_DATETIME_MIN = datetime.min
+_ZERO = Decimal('0.0')
+
+
+def _same_objects(left: Tuple[Any, ...], right: Tuple[Any, ...]) -> bool:
+    """Check whether two tuples hold the very same objects, in order."""
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
+def _session_start_key(session: SessionData) -> datetime:
+    """Sort key placing sessions without a start time first."""
+    return session.start_time or _DATETIME_MIN
+
+
+def _order_sessions(main_session: SessionData, sub_agent_sessions: List[SessionData]) -> Tuple[SessionData, ...]:
+    """Order the main session and sub-agents chronologically.
+
+    Sub-agents are normally grouped in start order, in which case the main
+    session is merged in with a linear scan; otherwise fall back to a sort.
+    Ties place the main session first, matching a stable sort.
+    """
+    keys = [_session_start_key(session) for session in sub_agent_sessions]
+    if any(later < earlier for earlier, later in zip(keys, keys[1:])):
+        return tuple(sorted(chain((main_session,), sub_agent_sessions), key=_session_start_key))
+
+    main_key = _session_start_key(main_session)
+    index = next((i for i, key in enumerate(keys) if key >= main_key), len(keys))
+    return (*sub_agent_sessions[:index], main_session, *sub_agent_sessions[index:])
 
 
 class SessionWorkflow(BaseModel):
@@ -15,7 +46,58 @@ class SessionWorkflow(BaseModel):
     main_session: SessionData
     sub_agent_sessions: List[SessionData] = []
 
-    @computed_field
+    _aggregates_cache: Optional[
+        Tuple[Tuple[SessionData, ...], Tuple[Dict[str, Any], ...], Dict[str, Any]]
+    ] = PrivateAttr(default=None)
+
+    def _iter_sessions(self) -> Iterator[SessionData]:
+        """Iterate the main session followed by the sub-agent sessions."""
+        return chain((self.main_session,), self.sub_agent_sessions)
+
+    def _aggregates(self) -> Dict[str, Any]:
+        """Compute time and token aggregates across main + sub-agent sessions.
+
+        The result is keyed on the sessions themselves and on each session's
+        own memoized aggregates, both compared by identity, so it is
+        recomputed whenever a session is added or replaced, or the files
+        inside any session change. Holding the sessions keeps their
+        identities from being reused.
+        """
+        sessions = tuple(self._iter_sessions())
+        session_aggregates = tuple(session._aggregates() for session in sessions)
+        cached = self._aggregates_cache
+        if (
+            cached is not None
+            and _same_objects(cached[0], sessions)
+            and _same_objects(cached[1], session_aggregates)
+        ):
+            return cached[2]
+
+        start_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None
+        input_tokens = output_tokens = cache_write = cache_read = 0
+        for session_totals in session_aggregates:
+            session_start = session_totals['start_time']
+            if session_start is not None and (start_time is None or session_start < start_time):
+                start_time = session_start
+            session_end = session_totals['end_time']
+            if session_end is not None and (end_time is None or session_end > end_time):
+                end_time = session_end
+
+            session_input, session_output, session_cache_write, session_cache_read = session_totals['tokens']
+            input_tokens += session_input
+            output_tokens += session_output
+            cache_write += session_cache_write
+            cache_read += session_cache_read
+
+        aggregates = {
+            'start_time': start_time,
+            'end_time': end_time,
+            'tokens': (input_tokens, output_tokens, cache_write, cache_read),
+        }
+        self._aggregates_cache = (sessions, session_aggregates, aggregates)
+        return aggregates
+
     @property
     def project_name(self) -> str:
         """Get project name from main session."""
@@ -25,36 +107,37 @@ class SessionWorkflow(BaseModel):
     @property
     def start_time(self) -> Optional[datetime]:
         """Get earliest start time across all sessions."""
-        times = [self.main_session.start_time] + [s.start_time for s in self.sub_agent_sessions]
-        valid_times = [t for t in times if t is not None]
-        return min(valid_times) if valid_times else None
+        if not self.sub_agent_sessions:
+            return self.main_session.start_time
+        return self._aggregates()['start_time']
 
     @computed_field
     @property
     def end_time(self) -> Optional[datetime]:
         """Get latest end time across all sessions."""
-        times = [self.main_session.end_time] + [s.end_time for s in self.sub_agent_sessions]
-        valid_times = [t for t in times if t is not None]
-        return max(valid_times) if valid_times else None
+        if not self.sub_agent_sessions:
+            return self.main_session.end_time
+        return self._aggregates()['end_time']
 
     @computed_field
     @property
     def total_tokens(self) -> TokenUsage:
         """Aggregate tokens across main + all sub-agents."""
-        all_sessions = [self.main_session] + self.sub_agent_sessions
-        return TokenUsage(
-            input=sum(s.total_tokens.input for s in all_sessions),
-            output=sum(s.total_tokens.output for s in all_sessions),
-            cache_read=sum(s.total_tokens.cache_read for s in all_sessions),
-            cache_write=sum(s.total_tokens.cache_write for s in all_sessions),
+        if not self.sub_agent_sessions:
+            return self.main_session.total_tokens
+        input_tokens, output_tokens, cache_write, cache_read = self._aggregates()['tokens']
+        return TokenUsage.model_construct(
+            input=input_tokens,
+            output=output_tokens,
+            cache_write=cache_write,
+            cache_read=cache_read,
         )
 
-    @computed_field
     @property
     def total_cost(self) -> Decimal:
         """Placeholder for total cost - actual calculation requires pricing data."""
         # Note: Actual cost calculation happens in report generator with pricing data
-        return Decimal('0.0')
+        return _ZERO
 
     @computed_field
     @property
@@ -64,9 +147,18 @@ class SessionWorkflow(BaseModel):
 
     @property
     def all_sessions(self) -> List[SessionData]:
-        """Get all sessions (main + sub-agents) in chronological order."""
-        all_sess = [self.main_session] + self.sub_agent_sessions
-        return sorted(all_sess, key=lambda s: s.start_time or datetime.min)
+        """Get all sessions (main + sub-agents) in chronological order.
+
+        The order is computed on first use and memoized with the other
+        aggregates; each call returns a new list.
+        """
+        if not self.sub_agent_sessions:
+            return [self.main_session]
+        aggregates = self._aggregates()
+        ordered = aggregates.get('all_sessions')
+        if ordered is None:
+            ordered = aggregates['all_sessions'] = _order_sessions(self.main_session, self.sub_agent_sessions)
+        return list(ordered)
 
     @property
     def session_title(self) -> str:
@@ -88,16 +180,44 @@ class SessionWorkflow(BaseModel):
         Returns:
             Total cost in USD
         """
-        all_sessions = [self.main_session] + self.sub_agent_sessions
-        return sum(s.calculate_total_cost(pricing_data, force_recalculate) for s in all_sessions)
+        total = self.main_session.calculate_total_cost(pricing_data, force_recalculate)
+        for session in self.sub_agent_sessions:
+            total += session.calculate_total_cost(pricing_data, force_recalculate)
+        return total
+
+    def aggregated_model_breakdown(
+        self, pricing_data: Dict[str, Any], force_recalculate: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get token totals and cost per model across all sessions.
+
+        Walks every interaction once, instead of building a full breakdown
+        per session and merging them. Token counts without a stored cost are
+        summed per model and priced once per model for the whole workflow.
+
+        Args:
+            pricing_data: Dictionary of model pricing information
+            force_recalculate: If True, ignore stored costs and recalculate from pricing data
+
+        Returns:
+            Dict mapping model IDs, in first-use order, to a dict with the
+            model's total token count ('tokens') and cost ('cost')
+        """
+        tokens_by_model, costs = _tokens_and_costs_by_model(
+            chain.from_iterable(session.files for session in self.all_sessions),
+            pricing_data,
+            force_recalculate,
+        )
+
+        return {
+            model_id: {'tokens': tokens_by_model[model_id], 'cost': costs[model_id]}
+            for model_id in tokens_by_model
+        }
 
-    @computed_field
     @property
     def has_sub_agents(self) -> bool:
         """Check if workflow has any sub-agent sessions."""
         return len(self.sub_agent_sessions) > 0
 
-    @computed_field
     @property
     def sub_agent_count(self) -> int:
         """Get number of sub-agent sessions."""
@@ -1,15 +1,110 @@
 """Agent registry for detecting main vs sub-agent types."""
 
+import os
+import re
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, FrozenSet, Optional
+
+
+# Top-level `mode: value` line in the frontmatter, optionally quoted
+_MODE_PATTERN = re.compile(r"""^mode[ \t]*:[ \t]+(["']?)([\w-]+)\1[ \t]*(?:#[^\n]*)?\r?$""", re.MULTILINE)
+
+
+# Distinct agent names memoized by classify() before the memo is reset
+_CLASSIFY_CACHE_SIZE = 1024
+
+# Bytes read up front; agent frontmatter normally fits well within this
+_FRONTMATTER_READ_SIZE = 1024
+
+
+def _read_frontmatter(path: str) -> Optional[str]:
+    """Read the text between the opening and closing ``---`` markers.
+
+    Only the head of the file is read unless the closing marker lies
+    beyond it, so long agent prompts are not loaded.
+
+    Args:
+        path: Path to the agent markdown file
+
+    Returns:
+        Frontmatter text, or None if the file has no frontmatter
+    """
+    with open(path, 'rb') as f:
+        data = f.read(_FRONTMATTER_READ_SIZE)
+        if not data.startswith(b'---'):
+            return None
+        end = data.find(b'---', 3)
+        if end == -1:
+            data += f.read()
+            end = data.find(b'---', 3)
+            if end == -1:
+                return None
+    return data[3:end].decode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _get_yaml():
+    """Import PyYAML on first use.
+
+    YAML is only needed for frontmatter the mode regex cannot read, so the
+    import is deferred and resolved once rather than on every parse.
+    """
+    import yaml
+    return yaml
+
+
+@lru_cache(maxsize=256)
+def _parse_frontmatter(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Extract the frontmatter fields the registry uses from an agent file.
+
+    Only ``mode`` is needed, so it is read with a regex. Frontmatter that
+    mentions ``mode`` in a form the regex does not handle falls back to a
+    full YAML parse.
+
+    Cached per (path, mtime_ns), so unchanged files are not re-read or
+    re-parsed on reload. The returned dict is shared and must not be
+    mutated.
+
+    Args:
+        path: Path to the agent markdown file
+        mtime_ns: File modification time, used only as part of the cache key
+
+    Returns:
+        Dictionary of frontmatter fields, or empty dict if parsing fails
+    """
+    try:
+        frontmatter = _read_frontmatter(path)
+        if frontmatter is None:
+            return {}
+
+        match = _MODE_PATTERN.search(frontmatter)
+        if match:
+            return {'mode': match.group(2)}
+        if 'mode' not in frontmatter:
+            return {}
+
+        data = _get_yaml().safe_load(frontmatter)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        pass
+    return {}
+
+
+class AgentKind(IntEnum):
+    """How an agent's sessions are grouped into workflows."""
+
+    MAIN = 0
+    SUB = 1
 
 
 class AgentRegistry:
     """Discovers and manages agent definitions from OpenCode config."""
 
     # Built-in agents (fallback if no config directory exists)
-    BUILTIN_MAIN_AGENTS = {'plan', 'build'}
-    BUILTIN_SUB_AGENTS = {'explore'}
+    BUILTIN_MAIN_AGENTS = frozenset({'plan', 'build'})
+    BUILTIN_SUB_AGENTS = frozenset({'explore'})
 
     def __init__(self, agents_dir: Optional[Path] = None):
         """Initialize the agent registry.
@@ -19,51 +114,76 @@ class AgentRegistry:
                        Defaults to ~/.config/opencode/agent
         """
         self.agents_dir = agents_dir or Path.home() / ".config" / "opencode" / "agent"
-        self._sub_agents: Set[str] = set()
-        self._main_agents: Set[str] = set()
+        self._sub_agents: FrozenSet[str] = frozenset()
+        self._main_agents: FrozenSet[str] = frozenset()
+        self._classify_cache: Dict[str, AgentKind] = {}
+        self._dir_mtime_ns: Optional[int] = None
         self._load_agents()
 
     def _load_agents(self):
-        """Scan ~/.config/opencode/agent/ for agent definitions."""
+        """Scan ~/.config/opencode/agent/ for agent definitions.
+
+        The registries are frozen once loaded and only replaced by reload.
+        """
+        self._classify_cache = {}
+        # Recorded before scanning so changes made during the scan trigger the next maybe_reload
+        self._dir_mtime_ns = self._stat_agents_dir()
+
         # Start with built-in agents
-        self._main_agents = self.BUILTIN_MAIN_AGENTS.copy()
-        self._sub_agents = self.BUILTIN_SUB_AGENTS.copy()
+        self._main_agents = self.BUILTIN_MAIN_AGENTS
+        self._sub_agents = self.BUILTIN_SUB_AGENTS
 
-        if not self.agents_dir.exists():
+        agent_files = []
+        try:
+            with os.scandir(self.agents_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.md'):
+                        continue
+                    try:
+                        if entry.is_file():
+                            # Name without .md, path and mtime for the parse cache
+                            agent_files.append((entry.name[:-3], entry.path, entry.stat().st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
             return
 
-        for md_file in self.agents_dir.glob("*.md"):
-            agent_name = md_file.stem  # filename without .md
-            agent_config = self._parse_agent_file(md_file)
+        main_agents = set(self.BUILTIN_MAIN_AGENTS)
+        sub_agents = set(self.BUILTIN_SUB_AGENTS)
+        for agent_name, path, mtime_ns in agent_files:
+            agent_config = _parse_frontmatter(path, mtime_ns)
 
             mode = agent_config.get('mode', '').lower()
             if mode == 'subagent':
-                self._sub_agents.add(agent_name.lower())
+                sub_agents.add(agent_name.lower())
             elif mode == 'primary':
-                self._main_agents.add(agent_name.lower())
+                main_agents.add(agent_name.lower())
             # If no mode specified, agent is treated as main (default behavior)
 
-    def _parse_agent_file(self, file_path: Path) -> Dict[str, Any]:
-        """Parse YAML frontmatter from markdown agent file.
+        self._main_agents = frozenset(main_agents)
+        self._sub_agents = frozenset(sub_agents)
+
+    def classify(self, agent_name: Optional[str]) -> AgentKind:
+        """Classify an agent with a single registry lookup.
+
+        Unknown agents and sessions without an agent count as main. Results
+        are memoized per agent name until the registry is reloaded.
 
         Args:
-            file_path: Path to the agent markdown file
+            agent_name: Name of the agent to classify
 
         Returns:
-            Dictionary of parsed YAML frontmatter, or empty dict if parsing fails
+            AgentKind.SUB for registered sub-agents, AgentKind.MAIN otherwise
         """
-        try:
-            content = file_path.read_text()
-
-            # Extract YAML frontmatter between --- markers
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    import yaml
-                    return yaml.safe_load(parts[1]) or {}
-        except Exception:
-            pass
-        return {}
+        if agent_name is None:
+            return AgentKind.MAIN
+        kind = self._classify_cache.get(agent_name)
+        if kind is None:
+            if len(self._classify_cache) >= _CLASSIFY_CACHE_SIZE:
+                self._classify_cache.clear()
+            kind = AgentKind.SUB if agent_name.lower() in self._sub_agents else AgentKind.MAIN
+            self._classify_cache[agent_name] = kind
+        return kind
 
     def is_sub_agent(self, agent_name: Optional[str]) -> bool:
         """Check if an agent is a sub-agent.
@@ -74,9 +194,7 @@ class AgentRegistry:
         Returns:
             True if the agent is a sub-agent, False otherwise
         """
-        if agent_name is None:
-            return False
-        return agent_name.lower() in self._sub_agents
+        return self.classify(agent_name) is AgentKind.SUB
 
     def is_main_agent(self, agent_name: Optional[str]) -> bool:
         """Check if an agent is a main agent.
@@ -92,24 +210,44 @@ class AgentRegistry:
         agent_lower = agent_name.lower()
         return agent_lower in self._main_agents or agent_lower not in self._sub_agents
 
-    def get_all_sub_agents(self) -> Set[str]:
+    def get_all_sub_agents(self) -> FrozenSet[str]:
         """Get all registered sub-agent names.
 
         Returns:
-            Set of sub-agent names
+            Frozen set of sub-agent names
         """
-        return self._sub_agents.copy()
+        return self._sub_agents
 
-    def get_all_main_agents(self) -> Set[str]:
+    def get_all_main_agents(self) -> FrozenSet[str]:
         """Get all registered main agent names.
 
         Returns:
-            Set of main agent names
+            Frozen set of main agent names
         """
-        return self._main_agents.copy()
+        return self._main_agents
 
     def reload(self):
         """Reload agent definitions (for when user adds new agents)."""
-        self._sub_agents.clear()
-        self._main_agents.clear()
         self._load_agents()
+
+    def maybe_reload(self) -> bool:
+        """Reload agent definitions only if the agent directory has changed.
+
+        Costs a single stat() when nothing changed. The directory mtime moves
+        when agent files are added, removed or replaced; use reload() to pick
+        up in-place edits to an existing file.
+
+        Returns:
+            True if the agents were reloaded, False otherwise
+        """
+        if self._stat_agents_dir() == self._dir_mtime_ns:
+            return False
+        self._load_agents()
+        return True
+
+    def _stat_agents_dir(self) -> Optional[int]:
+        """Get the agent directory mtime in nanoseconds, or None if missing."""
+        try:
+            return os.stat(self.agents_dir).st_mtime_ns
+        except OSError:
+            return None
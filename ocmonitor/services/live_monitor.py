@@ -2,12 +2,16 @@
 
 import os
 import select
+import sqlite3
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, cast
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple, cast
 
 from rich.console import Console
 from rich.layout import Layout
@@ -22,12 +26,48 @@ from ..models.workflow import SessionWorkflow
 from ..ui.dashboard import DashboardUI
 from ..ui.tables import TableFormatter
 from ..utils.data_loader import DataLoader
-from ..utils.file_utils import FileProcessor
+from ..utils.file_utils import FileProcessor, InteractionFileCache
 from ..utils.sqlite_utils import SQLiteProcessor
-from ..utils.time_utils import compute_p50_output_rate
+from ..utils.time_utils import (
+    compute_p50_output_rate,
+    compute_p50_output_rates_and_recent_by_model,
+    compute_p50_output_rates_by_model,
+)
 from .session_grouper import SessionGrouper
 
 
+_BY_MODIFICATION_TIME = attrgetter("modification_timestamp")
+_BY_LAST_ACTIVITY = itemgetter("last_activity_ts")
+
+# Seconds between database change checks while waiting for the next refresh;
+# also coalesces bursts of writes into a single refresh
+_CHANGE_CHECK_INTERVAL = 0.2
+# Longest time to trust an unchanged database before re-querying, so
+# workflows still age out of the active window
+_RESYNC_INTERVAL = 60.0
+# Seconds a data source probe from validate_monitoring_setup stays valid
+# while neither the database nor the sessions directory changes
+_VALIDATION_TTL = 5.0
+
+
+@lru_cache(maxsize=128)
+def _context_usage_percentage(context_size: int, context_window: int) -> float:
+    """Get the share of a context window in use, capped at 100%.
+
+    Memoized because the same most-recent interaction is re-evaluated on every
+    refresh until a new one arrives.
+
+    Args:
+        context_size: Input plus cache read/write tokens of an interaction
+        context_window: Context window size of the interaction's model
+
+    Returns:
+        Usage percentage between 0 and 100
+    """
+    usage_pct = (context_size / context_window) * 100 if context_window > 0 else 0
+    return min(100.0, usage_pct)
+
+
 class NoWorkflowsError(Exception):
     """Raised when no workflows are available for selection."""
 
@@ -35,6 +75,27 @@ class NoWorkflowsError(Exception):
 class WorkflowWrapper:
     """Wrapper for SQLite workflow data that mimics SessionWorkflow interface."""
 
+    # One wrapper is built per dashboard refresh; slots avoid a per-instance dict
+    __slots__ = (
+        "main_session",
+        "sub_agents",
+        "all_sessions",
+        "project_name",
+        "display_title",
+        "session_count",
+        "sub_agent_count",
+        "has_sub_agents",
+        "workflow_id",
+        "_pricing_data",
+        "total_tokens",
+        "start_time",
+        "end_time",
+        "duration_ms",
+        "duration_hours",
+        "duration_percentage",
+        "_cost_cache",
+    )
+
     def __init__(
         self, workflow_dict: Dict[str, Any], pricing_data: Dict[str, ModelPricing]
     ):
@@ -48,27 +109,31 @@ class WorkflowWrapper:
         self.has_sub_agents: bool = workflow_dict["has_sub_agents"]
         self.workflow_id: str = workflow_dict["workflow_id"]
         self._pricing_data = pricing_data
+        self._cost_cache: Optional[Tuple[Tuple[int, ...], Decimal]] = None
 
-        # Calculate total tokens across all sessions
-        self.total_tokens = TokenUsage()
+        # Aggregate tokens and time span across all sessions in one pass
+        input_tokens = output_tokens = cache_write = cache_read = 0
+        start_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None
         for session in self.all_sessions:
             tokens = session.total_tokens
-            self.total_tokens.input += tokens.input
-            self.total_tokens.output += tokens.output
-            self.total_tokens.cache_write += tokens.cache_write
-            self.total_tokens.cache_read += tokens.cache_read
-
-        # Calculate time properties across all sessions
-        start_times = []
-        end_times = []
-        for session in self.all_sessions:
-            if session.start_time:
-                start_times.append(session.start_time)
-            if session.end_time:
-                end_times.append(session.end_time)
-
-        self.start_time: Optional[datetime] = min(start_times) if start_times else None
-        self.end_time: Optional[datetime] = max(end_times) if end_times else None
+            input_tokens += tokens.input
+            output_tokens += tokens.output
+            cache_write += tokens.cache_write
+            cache_read += tokens.cache_read
+
+            session_start = session.start_time
+            if session_start and (start_time is None or session_start < start_time):
+                start_time = session_start
+            session_end = session.end_time
+            if session_end and (end_time is None or session_end > end_time):
+                end_time = session_end
+
+        self.total_tokens = TokenUsage.from_counts(
+            input_tokens, output_tokens, cache_write, cache_read
+        )
+        self.start_time: Optional[datetime] = start_time
+        self.end_time: Optional[datetime] = end_time
 
         # Calculate duration
         if self.start_time and self.end_time:
@@ -87,11 +152,28 @@ class WorkflowWrapper:
     def calculate_total_cost(
         self, pricing_data: Optional[Dict[str, ModelPricing]] = None
     ) -> Decimal:
-        """Calculate total cost across all sessions in workflow."""
+        """Calculate total cost across all sessions in workflow.
+
+        The result is memoized per pricing table and token totals, since the
+        dashboard asks for it more than once per render.
+        """
         pricing = pricing_data or self._pricing_data
+        tokens = self.total_tokens
+        cache_key = (
+            id(pricing),
+            tokens.input,
+            tokens.output,
+            tokens.cache_write,
+            tokens.cache_read,
+        )
+        cached = self._cost_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
         total = Decimal("0.0")
         for session in self.all_sessions:
             total += session.calculate_total_cost(pricing)
+        self._cost_cache = (cache_key, total)
         return total
 
 
@@ -121,6 +203,7 @@ class LiveMonitor:
         self.dashboard_ui = DashboardUI(console, currency_converter)
         self.session_grouper = SessionGrouper()
         self.data_loader = DataLoader()
+        self._file_cache = InteractionFileCache()
         self._active_workflows: Dict[str, Any] = {}
         self._displayed_workflow_id: Optional[str] = None
         self.prev_tracked: set = set()
@@ -128,6 +211,13 @@ class LiveMonitor:
         self._stdin_termios_state: Optional[Any] = None
         self._input_buffer: str = ""
         self._live_status_line: Optional[str] = None
+        self._last_render_key: Optional[Tuple[Any, ...]] = None
+        self._latest_activity_cache: Dict[str, Tuple[Any, float]] = {}
+        self._db_conn: Optional[sqlite3.Connection] = None
+        self._db_conn_path: Optional[Path] = None
+        self._validation_cache: Optional[
+            Tuple[Tuple[Any, ...], float, Dict[str, Any], List[str]]
+        ] = None
         if init_from_db:
             self._initialize_active_workflows()
 
@@ -148,6 +238,55 @@ class LiveMonitor:
                     s.session_id for s in most_recent["all_sessions"]
                 )
 
+    def _track_sessions(self, sessions: List[SessionData]) -> None:
+        """Add session IDs to prev_tracked in place.
+
+        Updates the existing set directly instead of building a temporary set
+        per refresh; IDs that are already tracked cost one hash lookup each.
+        """
+        self.prev_tracked.update(s.session_id for s in sessions)
+
+    def _should_render(
+        self,
+        workflow_id: str,
+        sessions: List[SessionData],
+        controls_hint: Optional[str],
+        refresh_interval: float,
+    ) -> bool:
+        """Check whether a periodic refresh would change the dashboard.
+
+        The key covers the workflow, its sessions, interaction and token
+        counts, the controls hint and the current refresh period, so the
+        header clock and elapsed-time panels still advance every refresh
+        while a workflow is idle.
+
+        Args:
+            workflow_id: ID of the displayed workflow
+            sessions: All sessions of the displayed workflow
+            controls_hint: Controls hint shown in the header
+            refresh_interval: Update interval in seconds
+
+        Returns:
+            True if the dashboard should be regenerated, False otherwise
+        """
+        file_count = 0
+        token_total = 0
+        for session in sessions:
+            file_count += len(session.files)
+            token_total += session.total_tokens.total
+        render_key = (
+            workflow_id,
+            len(sessions),
+            file_count,
+            token_total,
+            controls_hint,
+            int(time.time() // max(refresh_interval, 1)),
+        )
+        if render_key == self._last_render_key:
+            return False
+        self._last_render_key = render_key
+        return True
+
     def _get_tracked_workflow_ids(self) -> Set[str]:
         """Return set of tracked workflow IDs (for testing)."""
         return set(self._active_workflows.keys())
@@ -161,14 +300,10 @@ class LiveMonitor:
     def _refresh_active_workflows(self, db_path: str):
         """Refresh active workflows from database (for testing)."""
         workflows = SQLiteProcessor.get_all_active_workflows(Path(db_path))
-        current_ids = set(self._active_workflows.keys())
-        new_ids = {wf["workflow_id"] for wf in workflows}
-        ended_ids = current_ids - new_ids
-        for ended_id in ended_ids:
-            if ended_id in self._active_workflows:
-                del self._active_workflows[ended_id]
-        for wf in workflows:
-            self._active_workflows[wf["workflow_id"]] = wf
+        refreshed = {wf["workflow_id"]: wf for wf in workflows}
+        for ended_id in self._active_workflows.keys() - refreshed.keys():
+            del self._active_workflows[ended_id]
+        self._active_workflows.update(refreshed)
         if self._active_workflows:
             most_recent = self._select_most_recent_workflow(
                 list(self._active_workflows.values())
@@ -188,10 +323,14 @@ class LiveMonitor:
         self, base_path: str, allow_fallback: bool = True
     ) -> List[SessionWorkflow]:
         """Load active file-based workflows, optionally falling back to most recent."""
-        sessions = FileProcessor.load_all_sessions(base_path, limit=50)
+        sessions = FileProcessor.load_all_sessions(
+            base_path, limit=50, file_cache=self._file_cache
+        )
         if not sessions:
             return []
 
+        # Pick up agents added while monitoring; a single stat when unchanged
+        self.session_grouper.refresh_agents()
         workflows = self.session_grouper.group_sessions(sessions)
         if not workflows:
             return []
@@ -201,6 +340,28 @@ class LiveMonitor:
             return active_workflows
         return workflows[:1] if allow_fallback else []
 
+    def _get_polling_connection(self, db_path: Path) -> sqlite3.Connection:
+        """Get the connection reused across refreshes, opening it on first use.
+
+        Args:
+            db_path: Path to the SQLite database
+
+        Returns:
+            Open connection to db_path
+        """
+        if self._db_conn is None or self._db_conn_path != db_path:
+            self._close_polling_connection()
+            self._db_conn = SQLiteProcessor.open_polling_connection(db_path)
+            self._db_conn_path = db_path
+        return self._db_conn
+
+    def _close_polling_connection(self) -> None:
+        """Close the reused SQLite connection, if one is open."""
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
+            self._db_conn_path = None
+
     def _get_sqlite_active_workflows(
         self, allow_fallback: bool = True
     ) -> List[Dict[str, Any]]:
@@ -209,41 +370,106 @@ class LiveMonitor:
         if not db_path:
             return []
 
-        active_workflows = SQLiteProcessor.get_all_active_workflows(db_path)
+        conn = self._get_polling_connection(db_path)
+        active_workflows = SQLiteProcessor.get_all_active_workflows(conn=conn)
         if active_workflows:
             return active_workflows
 
         if not allow_fallback:
             return []
 
-        workflow = SQLiteProcessor.get_most_recent_workflow(db_path)
+        workflow = SQLiteProcessor.get_most_recent_workflow(conn=conn)
         return [workflow] if workflow else []
 
+    def _cached_activity_ts(
+        self, workflow_id: str, main_session: Any
+    ) -> Tuple[Tuple[Any, ...], Optional[float]]:
+        """Look up a memoized latest-activity timestamp for a workflow.
+
+        Entries are keyed by workflow ID and only reused while the main
+        session keeps its interaction count and the very same first and last
+        interaction objects. File loads order interactions newest first and
+        rebuild a file's interaction only when its (mtime_ns, size) changes,
+        so a rewritten file moves to the front; SQLite loads append new
+        messages at the end. Only these two ends are compared, by identity,
+        so the check stays constant-time however many interactions a
+        session has.
+
+        Args:
+            workflow_id: ID of the workflow
+            main_session: Main session of the workflow, if any
+
+        Returns:
+            Tuple of (fingerprint, cached timestamp or None on a miss)
+        """
+        files = main_session.files if main_session else ()
+        fingerprint = (
+            main_session.session_id if main_session else None,
+            len(files),
+            files[0] if files else None,
+            files[-1] if files else None,
+        )
+        cached = self._latest_activity_cache.get(workflow_id)
+        if cached is not None:
+            previous = cached[0]
+            if (
+                previous[:2] == fingerprint[:2]
+                and previous[2] is fingerprint[2]
+                and previous[3] is fingerprint[3]
+            ):
+                return fingerprint, cached[1]
+        return fingerprint, None
+
+    def _store_activity_ts(
+        self, workflow_id: str, fingerprint: Tuple[Any, ...], latest: float
+    ) -> float:
+        """Memoize a latest-activity timestamp computed for a workflow."""
+        if len(self._latest_activity_cache) >= 256:
+            self._latest_activity_cache.clear()
+        self._latest_activity_cache[workflow_id] = (fingerprint, latest)
+        return latest
+
     def _get_latest_sqlite_activity_ts(self, workflow: Dict[str, Any]) -> float:
         """Get latest parent-session activity timestamp for SQLite workflow."""
-        latest = 0.0
         main_session = workflow.get("main_session")
+        workflow_id = workflow.get("workflow_id")
+        fingerprint, cached = self._cached_activity_ts(workflow_id, main_session)
+        if cached is not None:
+            return cached
+
+        # Compare raw millisecond timestamps and convert only the winner
+        latest = 0.0
         if main_session:
+            latest_ms = 0
             for f in main_session.files:
-                if f.time_data and f.time_data.created:
-                    latest = max(latest, f.time_data.created / 1000.0)
-        if (
-            latest == 0.0
-            and main_session
-            and isinstance(main_session.start_time, datetime)
-        ):
-            latest = main_session.start_time.timestamp()
-        return latest
+                time_data = f.time_data
+                if time_data is not None:
+                    created = time_data.created
+                    if created and created > latest_ms:
+                        latest_ms = created
+            latest = latest_ms / 1000.0
+        if latest == 0.0 and main_session:
+            start_time = main_session.start_time
+            if isinstance(start_time, datetime):
+                latest = start_time.timestamp()
+            elif isinstance(start_time, (int, float)):
+                latest = float(start_time)
+        return self._store_activity_ts(workflow_id, fingerprint, latest)
 
     def _get_latest_file_activity_ts(self, workflow: SessionWorkflow) -> float:
         """Get latest parent-session activity timestamp for file workflow."""
-        latest = 0.0
         main = workflow.main_session
+        fingerprint, cached = self._cached_activity_ts(workflow.workflow_id, main)
+        if cached is not None:
+            return cached
+
+        latest = 0.0
         if main:
             for f in main.files:
-                if f.modification_time:
-                    latest = max(latest, f.modification_time.timestamp())
-        return latest
+                mtime = f.modification_timestamp
+                if mtime > latest:
+                    latest = mtime
+        return self._store_activity_ts(workflow.workflow_id, fingerprint, latest)
 
     def _workflow_matches_selected_sqlite(
         self, workflow: Dict[str, Any], selected_session_id: str
@@ -321,7 +547,7 @@ class LiveMonitor:
                     "last_activity_ts": self._get_latest_sqlite_activity_ts(workflow),
                 }
             )
-        descriptors.sort(key=lambda d: d["last_activity_ts"], reverse=True)
+        descriptors.sort(key=_BY_LAST_ACTIVITY, reverse=True)
         return descriptors
 
     def _describe_file_workflows(
@@ -340,7 +566,7 @@ class LiveMonitor:
                     "last_activity_ts": self._get_latest_file_activity_ts(workflow),
                 }
             )
-        descriptors.sort(key=lambda d: d["last_activity_ts"], reverse=True)
+        descriptors.sort(key=_BY_LAST_ACTIVITY, reverse=True)
         return descriptors
 
     def _print_workflow_picker_table(
@@ -418,6 +644,51 @@ class LiveMonitor:
             descriptors, "Select Workflow (File Live Monitor)"
         )
 
+    @staticmethod
+    def _next_refresh_deadline(previous: float, refresh_interval: float) -> float:
+        """Advance a monotonic refresh deadline by one interval.
+
+        Stepping from the previous deadline rather than from the end of the
+        refresh keeps the cadence from drifting by the time each refresh
+        takes. If a refresh overran a whole interval, the schedule restarts
+        from now instead of firing a burst of catch-up refreshes.
+
+        Args:
+            previous: Deadline of the refresh that just ran (time.monotonic())
+            refresh_interval: Update interval in seconds
+
+        Returns:
+            Deadline for the next refresh
+        """
+        deadline = previous + refresh_interval
+        now = time.monotonic()
+        if deadline <= now:
+            deadline = now + refresh_interval
+        return deadline
+
+    @staticmethod
+    def _database_signature(db_path: Path) -> Tuple[Any, ...]:
+        """Get a cheap fingerprint of the SQLite database's on-disk state.
+
+        OpenCode writes through a WAL journal, so the -wal file is included
+        alongside the main database file.
+
+        Args:
+            db_path: Path to the SQLite database
+
+        Returns:
+            Tuple of (mtime_ns, size) per file, None for missing files
+        """
+        signature = []
+        for path in (str(db_path), f"{db_path}-wal"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
     def _controls_hint(self, interactive_switch: bool) -> Optional[str]:
         """Return optional controls hint shown in dashboard header."""
         if not interactive_switch:
@@ -702,7 +973,8 @@ class LiveMonitor:
             self.prev_tracked = set()
 
         current_workflow = immediate_current
-        self.prev_tracked |= set(s.session_id for s in current_workflow.all_sessions)
+        self._track_sessions(current_workflow.all_sessions)
+        self._last_render_key = None
 
         live.update(
             self._generate_workflow_dashboard(
@@ -892,7 +1164,7 @@ class LiveMonitor:
                 console=self.console,
             ) as live:
                 descriptors = self._describe_file_workflows(active_workflows)
-                next_refresh_at = time.time() + refresh_interval
+                next_refresh_at = time.monotonic() + refresh_interval
                 while True:
                     if interactive_switch:
                         command = self._poll_live_switch_command()
@@ -914,7 +1186,9 @@ class LiveMonitor:
                                     refresh_interval,
                                 )
                                 if current_workflow_id != prev_workflow_id:
-                                    next_refresh_at = time.time() + refresh_interval
+                                    next_refresh_at = (
+                                        time.monotonic() + refresh_interval
+                                    )
                                 continue
 
                             (
@@ -934,15 +1208,16 @@ class LiveMonitor:
                                 refresh_interval,
                             )
                             if current_workflow_id != prev_workflow_id:
-                                next_refresh_at = time.time() + refresh_interval
+                                next_refresh_at = time.monotonic() + refresh_interval
                             if should_quit:
                                 self.console.print(
                                     "\n[status.warning]Live monitoring stopped.[/status.warning]"
                                 )
                                 break
 
-                    if time.time() < next_refresh_at:
-                        time.sleep(0.05)
+                    remaining = next_refresh_at - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(min(0.05, remaining))
                         continue
 
                     active_workflows = self._get_file_active_workflows(
@@ -966,8 +1241,8 @@ class LiveMonitor:
                             )
                             break
                     else:
-                        new_current = self._select_most_recent_file_workflow(
-                            active_workflows
+                        new_current = self._select_described_workflow(
+                            active_workflows, descriptors
                         )
 
                     if new_current.workflow_id != current_workflow_id:
@@ -975,16 +1250,23 @@ class LiveMonitor:
                         self.prev_tracked = set()
                     current_workflow = new_current
 
-                    self.prev_tracked |= set(
-                        s.session_id for s in current_workflow.all_sessions
-                    )
-
-                    live.update(
-                        self._generate_workflow_dashboard(
-                            current_workflow, self._controls_hint(interactive_switch)
+                    self._track_sessions(current_workflow.all_sessions)
+
+                    controls_hint = self._controls_hint(interactive_switch)
+                    if self._should_render(
+                        current_workflow_id,
+                        current_workflow.all_sessions,
+                        controls_hint,
+                        refresh_interval,
+                    ):
+                        live.update(
+                            self._generate_workflow_dashboard(
+                                current_workflow, controls_hint
+                            )
                         )
+                    next_refresh_at = self._next_refresh_deadline(
+                        next_refresh_at, refresh_interval
                     )
-                    next_refresh_at = time.time() + refresh_interval
 
         except KeyboardInterrupt:
             self.console.print(
@@ -1003,18 +1285,17 @@ class LiveMonitor:
             Rich layout for the dashboard
         """
         # Get the most recent file (excluding zero-token files)
-        recent_file = None
-        if session.non_zero_token_files:
-            recent_file = max(
-                session.non_zero_token_files, key=lambda f: f.modification_time
-            )
-        elif session.files:
-            recent_file = max(session.files, key=lambda f: f.modification_time)
+        recent_file = max(
+            (f for f in session.files if f.tokens.total > 0),
+            key=_BY_MODIFICATION_TIME,
+            default=None,
+        )
+        if recent_file is None and session.files:
+            recent_file = max(session.files, key=_BY_MODIFICATION_TIME)
 
         # Get model pricing for quota
-        quota = None
-        if recent_file and recent_file.model_id in self.pricing_data:
-            quota = self.pricing_data[recent_file.model_id].session_quota
+        pricing = self.pricing_data.get(recent_file.model_id) if recent_file else None
+        quota = pricing.session_quota if pricing else None
 
         # Calculate per-model output rates for this session
         per_model_output_rates = self._calculate_session_output_rates(session)
@@ -1040,20 +1321,7 @@ class LiveMonitor:
         Returns:
             Dict mapping model_id to p50 output tokens per second
         """
-        if not session.files:
-            return {}
-
-        model_files: Dict[str, List[InteractionFile]] = {}
-        for f in session.non_zero_token_files:
-            if f.model_id not in model_files:
-                model_files[f.model_id] = []
-            model_files[f.model_id].append(f)
-
-        result = {}
-        for model_id, files in model_files.items():
-            result[model_id] = compute_p50_output_rate(files)
-
-        return result
+        return compute_p50_output_rates_by_model(session.files)
 
     def _get_session_context_usage(
         self, session: SessionData
@@ -1068,42 +1336,9 @@ class LiveMonitor:
         Returns:
             Dict mapping model_id to context usage info (context_size, context_window, usage_percentage)
         """
-        if not session.files:
-            return {}
-
-        model_most_recent: Dict[str, InteractionFile] = {}
-        for f in session.non_zero_token_files:
-            if f.model_id not in model_most_recent:
-                model_most_recent[f.model_id] = f
-            elif f.modification_time > model_most_recent[f.model_id].modification_time:
-                model_most_recent[f.model_id] = f
-
-        result = {}
-        default_context_window = 200000
-
-        for model_id, recent_file in model_most_recent.items():
-            if model_id in self.pricing_data:
-                context_window = self.pricing_data[model_id].context_window
-            else:
-                context_window = default_context_window
-
-            context_size = (
-                recent_file.tokens.input
-                + recent_file.tokens.cache_read
-                + recent_file.tokens.cache_write
-            )
-
-            usage_pct = (
-                (context_size / context_window) * 100 if context_window > 0 else 0
-            )
-
-            result[model_id] = {
-                "context_size": context_size,
-                "context_window": context_window,
-                "usage_percentage": min(100.0, usage_pct),
-            }
-
-        return result
+        return self._context_usage_by_model(
+            self._most_recent_file_by_model(session.files)
+        )
 
     def _generate_workflow_dashboard(
         self, workflow: SessionWorkflow, controls_hint: Optional[str] = None
@@ -1116,15 +1351,8 @@ class LiveMonitor:
         Returns:
             Rich layout for the dashboard
         """
-        # Get all files from all sessions in the workflow
-        all_files: List[InteractionFile] = []
-        for session in workflow.all_sessions:
-            all_files.extend(session.non_zero_token_files)
-
         # Get the most recent file across all sessions
-        recent_file = None
-        if all_files:
-            recent_file = max(all_files, key=lambda f: f.modification_time)
+        recent_file = self._find_recent_workflow_file(workflow)
 
         # Calculate per-model output rates
         per_model_output_rates = self._calculate_per_model_output_rates(workflow)
@@ -1133,9 +1361,8 @@ class LiveMonitor:
         per_model_context = self._get_per_model_context_usage(workflow)
 
         # Get model pricing for quota
-        quota = None
-        if recent_file and recent_file.model_id in self.pricing_data:
-            quota = self.pricing_data[recent_file.model_id].session_quota
+        pricing = self.pricing_data.get(recent_file.model_id) if recent_file else None
+        quota = pricing.session_quota if pricing else None
 
         # Load tool usage statistics (file mode - no SQLite fallback)
         tool_stats = self._load_tool_stats_for_workflow(
@@ -1160,6 +1387,32 @@ class LiveMonitor:
             controls_hint=controls_hint,
         )
 
+    def _find_recent_workflow_file(
+        self, workflow: SessionWorkflow
+    ) -> Optional[InteractionFile]:
+        """Find the most recently modified non-zero-token file in a workflow.
+
+        Scans each session's files in place with a running maximum instead of
+        concatenating them into one list first.
+
+        Args:
+            workflow: Workflow containing all sessions
+
+        Returns:
+            Most recent InteractionFile, or None if the workflow has none
+        """
+        recent_file = None
+        recent_mtime = None
+        for session in workflow.all_sessions:
+            for f in session.files:
+                if f.tokens.total <= 0:
+                    continue
+                mtime = f.modification_timestamp
+                if recent_mtime is None or mtime > recent_mtime:
+                    recent_file = f
+                    recent_mtime = mtime
+        return recent_file
+
     def _calculate_per_model_output_rates(
         self, workflow: SessionWorkflow
     ) -> Dict[str, float]:
@@ -1173,21 +1426,9 @@ class LiveMonitor:
         Returns:
             Dict mapping model_id to p50 output tokens per second
         """
-        model_files: Dict[str, List[InteractionFile]] = {}
-        for session in workflow.all_sessions:
-            for f in session.non_zero_token_files:
-                if f.model_id not in model_files:
-                    model_files[f.model_id] = []
-                model_files[f.model_id].append(f)
-
-        if not model_files:
-            return {}
-
-        result = {}
-        for model_id, files in model_files.items():
-            result[model_id] = compute_p50_output_rate(files)
-
-        return result
+        return compute_p50_output_rates_by_model(
+            chain.from_iterable(session.files for session in workflow.all_sessions)
+        )
 
     def _get_per_model_context_usage(
         self, workflow: SessionWorkflow
@@ -1202,46 +1443,40 @@ class LiveMonitor:
         Returns:
             Dict mapping model_id to context usage info (context_size, context_window, usage_percentage)
         """
-        all_files: List[InteractionFile] = []
-        for session in workflow.all_sessions:
-            all_files.extend(session.non_zero_token_files)
-
-        if not all_files:
-            return {}
-
-        model_most_recent: Dict[str, InteractionFile] = {}
-        for f in all_files:
-            if f.model_id not in model_most_recent:
-                model_most_recent[f.model_id] = f
-            elif f.modification_time > model_most_recent[f.model_id].modification_time:
-                model_most_recent[f.model_id] = f
-
-        result = {}
-        default_context_window = 200000
-
-        for model_id, recent_file in model_most_recent.items():
-            if model_id in self.pricing_data:
-                context_window = self.pricing_data[model_id].context_window
-            else:
-                context_window = default_context_window
-
-            context_size = (
-                recent_file.tokens.input
-                + recent_file.tokens.cache_read
-                + recent_file.tokens.cache_write
+        return self._context_usage_by_model(
+            self._most_recent_file_by_model(
+                chain.from_iterable(
+                    session.files for session in workflow.all_sessions
+                )
             )
+        )
 
-            usage_pct = (
-                (context_size / context_window) * 100 if context_window > 0 else 0
-            )
+    @staticmethod
+    def _most_recent_file_by_model(
+        files: Iterable[InteractionFile],
+    ) -> Dict[str, InteractionFile]:
+        """Find each model's most recently modified non-zero-token file.
 
-            result[model_id] = {
-                "context_size": context_size,
-                "context_window": context_window,
-                "usage_percentage": min(100.0, usage_pct),
-            }
+        Args:
+            files: Interaction files to scan; consumed once
 
-        return result
+        Returns:
+            Dict mapping model_id to its most recent file
+        """
+        model_most_recent: Dict[str, InteractionFile] = {}
+        model_recent_mtime: Dict[str, float] = {}
+        for f in files:
+            if f.tokens.total <= 0:
+                continue
+            model_id = f.model_id
+            mtime = f.modification_timestamp
+            if (
+                model_id not in model_most_recent
+                or mtime > model_recent_mtime[model_id]
+            ):
+                model_most_recent[model_id] = f
+                model_recent_mtime[model_id] = mtime
+        return model_most_recent
 
     def _calculate_output_rate(self, session: SessionData) -> float:
         """Calculate p50 output token rate over the last 5 minutes of activity.
@@ -1255,12 +1490,12 @@ class LiveMonitor:
         if not session.files:
             return 0.0
 
-        # Calculate the cutoff time (5 minutes ago)
-        cutoff_time = datetime.now() - timedelta(minutes=5)
+        # Calculate the cutoff time (5 minutes ago) as a Unix timestamp
+        cutoff_ts = time.time() - 300.0
 
         # Filter interactions from the last 5 minutes
         recent_interactions = [
-            f for f in session.files if f.modification_time >= cutoff_time
+            f for f in session.files if f.modification_timestamp >= cutoff_ts
         ]
 
         if not recent_interactions:
@@ -1271,22 +1506,20 @@ class LiveMonitor:
         if rate > 0:
             return rate
 
-        # Fallback: aggregate mean for the window if no eligible interactions
-        total_output_tokens = sum(f.tokens.output for f in recent_interactions)
-        if total_output_tokens == 0:
-            return 0.0
-
+        # Fallback: aggregate mean for the window if no eligible interactions,
+        # summing tokens and durations in a single pass
+        total_output_tokens = 0
         total_duration_ms = 0
         for f in recent_interactions:
-            if f.time_data and f.time_data.duration_ms:
-                total_duration_ms += f.time_data.duration_ms
-
-        total_duration_seconds = total_duration_ms / 1000
+            total_output_tokens += f.tokens.output
+            time_data = f.time_data
+            if time_data and time_data.duration_ms:
+                total_duration_ms += time_data.duration_ms
 
-        if total_duration_seconds > 0:
-            return total_output_tokens / total_duration_seconds
+        if total_output_tokens == 0 or total_duration_ms <= 0:
+            return 0.0
 
-        return 0.0
+        return total_output_tokens / (total_duration_ms / 1000)
 
     def _load_tool_stats_for_workflow(
         self,
@@ -1339,12 +1572,12 @@ class LiveMonitor:
 
         recent_file = None
         if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+            recent_file = max(recent_session.files, key=_BY_MODIFICATION_TIME)
 
         # Calculate how long ago the last activity was
         last_activity = None
         if recent_file:
-            last_activity = time.time() - recent_file.modification_time.timestamp()
+            last_activity = time.time() - recent_file.modification_timestamp
 
         # Determine activity status
         activity_status = "unknown"
@@ -1392,7 +1625,7 @@ class LiveMonitor:
 
         recent_file = None
         if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+            recent_file = max(recent_session.files, key=_BY_MODIFICATION_TIME)
 
         return {
             "timestamp": time.time(),
@@ -1448,14 +1681,10 @@ class LiveMonitor:
             + interaction_file.tokens.cache_write
         )
 
-        usage_percentage = (
-            (context_size / context_window) * 100 if context_window > 0 else 0
-        )
-
         return {
             "context_size": context_size,
             "context_window": context_window,
-            "usage_percentage": min(100.0, usage_percentage),
+            "usage_percentage": _context_usage_percentage(context_size, context_window),
         }
 
     def start_sqlite_workflow_monitoring(
@@ -1555,7 +1784,10 @@ class LiveMonitor:
                 console=self.console,
             ) as live:
                 descriptors = self._describe_sqlite_workflows(active_workflows)
-                next_refresh_at = time.time() + refresh_interval
+                db_signature = self._database_signature(db_path)
+                last_sync_at = time.monotonic()
+                next_change_check_at = last_sync_at + _CHANGE_CHECK_INTERVAL
+                next_refresh_at = last_sync_at + refresh_interval
                 while True:
                     if interactive_switch:
                         command = self._poll_live_switch_command()
@@ -1596,12 +1828,10 @@ class LiveMonitor:
                                                 ]
                                                 self.prev_tracked = set()
                                             current_workflow = immediate_current
-                                            self.prev_tracked |= set(
-                                                s.session_id
-                                                for s in current_workflow[
-                                                    "all_sessions"
-                                                ]
+                                            self._track_sessions(
+                                                current_workflow["all_sessions"]
                                             )
+                                            self._last_render_key = None
                                             live.update(
                                                 self._generate_sqlite_workflow_dashboard(
                                                     current_workflow,
@@ -1611,7 +1841,7 @@ class LiveMonitor:
                                                 )
                                             )
                                             next_refresh_at = (
-                                                time.time() + refresh_interval
+                                                time.monotonic() + refresh_interval
                                             )
                                 continue
 
@@ -1653,22 +1883,56 @@ class LiveMonitor:
                                         ]
                                         self.prev_tracked = set()
                                     current_workflow = immediate_current
-                                    self.prev_tracked |= set(
-                                        s.session_id
-                                        for s in current_workflow["all_sessions"]
+                                    self._track_sessions(
+                                        current_workflow["all_sessions"]
                                     )
+                                    self._last_render_key = None
                                     live.update(
                                         self._generate_sqlite_workflow_dashboard(
                                             current_workflow,
                                             self._controls_hint(interactive_switch),
                                         )
                                     )
-                                    next_refresh_at = time.time() + refresh_interval
+                                    next_refresh_at = (
+                                        time.monotonic() + refresh_interval
+                                    )
 
-                    if time.time() < next_refresh_at:
-                        time.sleep(0.05)
+                    now = time.monotonic()
+                    if now < next_refresh_at:
+                        # Between refreshes, wake early only if the database changed
+                        changed = False
+                        if now >= next_change_check_at:
+                            next_change_check_at = now + _CHANGE_CHECK_INTERVAL
+                            changed = (
+                                self._database_signature(db_path) != db_signature
+                            )
+                        if not changed:
+                            time.sleep(min(0.05, next_refresh_at - now))
+                            continue
+                    elif (
+                        now - last_sync_at < _RESYNC_INTERVAL
+                        and self._database_signature(db_path) == db_signature
+                    ):
+                        # Nothing new on disk; only let the clocks advance
+                        controls_hint = self._controls_hint(interactive_switch)
+                        if self._should_render(
+                            current_workflow_id,
+                            current_workflow["all_sessions"],
+                            controls_hint,
+                            refresh_interval,
+                        ):
+                            live.update(
+                                self._generate_sqlite_workflow_dashboard(
+                                    current_workflow, controls_hint
+                                )
+                            )
+                        next_refresh_at = self._next_refresh_deadline(
+                            next_refresh_at, refresh_interval
+                        )
                         continue
 
+                    db_signature = self._database_signature(db_path)
+                    last_sync_at = now
                     active_workflows = self._get_sqlite_active_workflows(
                         allow_fallback=not bool(selected_session_id)
                     )
@@ -1690,24 +1954,32 @@ class LiveMonitor:
                             )
                             break
                     else:
-                        new_current = self._select_most_recent_workflow(
-                            active_workflows
+                        new_current = self._select_described_workflow(
+                            active_workflows, descriptors
                         )
 
                     if new_current["workflow_id"] != current_workflow_id:
                         current_workflow_id = new_current["workflow_id"]
                         self.prev_tracked = set()
                     current_workflow = new_current
-                    self.prev_tracked |= set(
-                        s.session_id for s in current_workflow["all_sessions"]
-                    )
-
-                    live.update(
-                        self._generate_sqlite_workflow_dashboard(
-                            current_workflow, self._controls_hint(interactive_switch)
+                    self._track_sessions(current_workflow["all_sessions"])
+
+                    controls_hint = self._controls_hint(interactive_switch)
+                    if self._should_render(
+                        current_workflow_id,
+                        current_workflow["all_sessions"],
+                        controls_hint,
+                        refresh_interval,
+                    ):
+                        live.update(
+                            self._generate_sqlite_workflow_dashboard(
+                                current_workflow, controls_hint
+                            )
+                        )
+                    if now >= next_refresh_at:
+                        next_refresh_at = self._next_refresh_deadline(
+                            next_refresh_at, refresh_interval
                         )
-                    )
-                    next_refresh_at = time.time() + refresh_interval
 
         except KeyboardInterrupt:
             self.console.print(
@@ -1715,6 +1987,36 @@ class LiveMonitor:
             )
         finally:
             self._disable_raw_input_mode()
+            self._close_polling_connection()
+
+    def _select_described_workflow(
+        self, workflows: List[Any], descriptors: List[Dict[str, Any]]
+    ) -> Any:
+        """Select the most recently active workflow from sorted descriptors.
+
+        Descriptors already carry each workflow's activity timestamp, sorted
+        newest first, so the refresh loops reuse them instead of computing
+        activity a second time.
+
+        Args:
+            workflows: Workflow dicts or SessionWorkflow objects
+            descriptors: Output of _describe_sqlite_workflows/_describe_file_workflows
+
+        Returns:
+            The workflow matching the first descriptor
+        """
+        if not descriptors:
+            raise NoWorkflowsError()
+        most_recent_id = descriptors[0]["workflow_id"]
+        for workflow in workflows:
+            workflow_id = (
+                workflow["workflow_id"]
+                if isinstance(workflow, dict)
+                else workflow.workflow_id
+            )
+            if workflow_id == most_recent_id:
+                return workflow
+        raise NoWorkflowsError()
 
     def _select_most_recent_workflow(
         self, workflows: List[Dict[str, Any]]
@@ -1732,26 +2034,7 @@ class LiveMonitor:
         if len(workflows) == 1:
             return workflows[0]
 
-        def get_latest_activity(workflow: Dict[str, Any]) -> float:
-            latest = 0.0
-            has_file_activity = False
-            main_session = workflow.get("main_session")
-            if main_session:
-                for f in main_session.files:
-                    if f.time_data and f.time_data.created:
-                        latest = max(latest, f.time_data.created / 1000.0)
-                        has_file_activity = True
-            if not has_file_activity and main_session:
-                start_time = main_session.start_time
-                if isinstance(start_time, datetime):
-                    latest = start_time.timestamp()
-                elif isinstance(start_time, (int, float)):
-                    latest = float(start_time)
-                else:
-                    latest = 0.0
-            return latest
-
-        return max(workflows, key=get_latest_activity)
+        return max(workflows, key=self._get_latest_sqlite_activity_ts)
 
     def _select_most_recent_file_workflow(
         self, workflows: List[SessionWorkflow]
@@ -1769,16 +2052,7 @@ class LiveMonitor:
         if len(workflows) == 1:
             return workflows[0]
 
-        def get_latest_parent_activity(workflow: SessionWorkflow) -> float:
-            latest = 0.0
-            main = workflow.main_session
-            if main:
-                for f in main.files:
-                    if f.modification_time:
-                        latest = max(latest, f.modification_time.timestamp())
-            return latest
-
-        return max(workflows, key=get_latest_parent_activity)
+        return max(workflows, key=self._get_latest_file_activity_ts)
 
     def _generate_sqlite_workflow_dashboard(
         self, workflow: Dict[str, Any], controls_hint: Optional[str] = None
@@ -1791,34 +2065,20 @@ class LiveMonitor:
         Returns:
             Rich layout for the dashboard
         """
-        # Get all files from all sessions in the workflow
-        all_files = []
-        for session in workflow["all_sessions"]:
-            all_files.extend(session.non_zero_token_files)
-
-        # Get the most recent file across all sessions
-        recent_file = None
-        if all_files:
-            recent_file = max(
-                all_files,
-                key=lambda f: (
-                    f.time_data.created if f.time_data and f.time_data.created else 0
-                ),
-            )
-
-        # Calculate per-model output rates for SQLite workflow
-        per_model_output_rates = self._calculate_sqlite_per_model_output_rates(workflow)
-
-        # Calculate per-model context usage for SQLite workflow
-        per_model_context = self._get_sqlite_per_model_context_usage(workflow)
+        # One pass over the workflow's files yields the most recent file,
+        # per-model output rates and per-model context usage
+        recent_file, per_model_output_rates, model_most_recent = (
+            self._scan_sqlite_workflow(workflow)
+        )
+        pricing_data = self.pricing_data
+        per_model_context = self._context_usage_by_model(model_most_recent)
 
         # Get model pricing for quota
-        quota = None
-        if recent_file and recent_file.model_id in self.pricing_data:
-            quota = self.pricing_data[recent_file.model_id].session_quota
+        pricing = pricing_data.get(recent_file.model_id) if recent_file else None
+        quota = pricing.session_quota if pricing else None
 
         # Create a workflow wrapper for the dashboard UI
-        workflow_wrapper = WorkflowWrapper(workflow, self.pricing_data)
+        workflow_wrapper = WorkflowWrapper(workflow, pricing_data)
 
         # Load tool usage statistics (SQLite mode)
         tool_stats = self._load_tool_stats_for_workflow(
@@ -1834,7 +2094,7 @@ class LiveMonitor:
         return self.dashboard_ui.create_dashboard_layout(
             session=workflow["main_session"],
             recent_file=recent_file,
-            pricing_data=self.pricing_data,
+            pricing_data=pricing_data,
             quota=quota,
             per_model_output_rates=per_model_output_rates,
             per_model_context=per_model_context,
@@ -1844,77 +2104,59 @@ class LiveMonitor:
             controls_hint=controls_hint,
         )
 
-    def _calculate_sqlite_per_model_output_rates(
+    def _scan_sqlite_workflow(
         self, workflow: Dict[str, Any]
-    ) -> Dict[str, float]:
-        """Calculate p50 output token rate per model for SQLite workflow.
+    ) -> Tuple[Optional[InteractionFile], Dict[str, float], Dict[str, InteractionFile]]:
+        """Collect the per-tick dashboard inputs in a single pass over files.
 
-        For each model, collects eligible interactions and computes p50 rate.
+        Files without tokens are skipped. Recency is judged by creation time.
 
         Args:
             workflow: Workflow dict from SQLite
 
         Returns:
-            Dict mapping model_id to p50 output tokens per second
+            Tuple of (most recent file or None, p50 output rate per model,
+            most recent file per model)
         """
-        model_files: Dict[str, List[InteractionFile]] = {}
-        for session in workflow["all_sessions"]:
-            for f in session.non_zero_token_files:
-                if f.model_id not in model_files:
-                    model_files[f.model_id] = []
-                model_files[f.model_id].append(f)
-
-        if not model_files:
-            return {}
-
-        result = {}
-        for model_id, files in model_files.items():
-            result[model_id] = compute_p50_output_rate(files)
-
-        return result
+        files = chain.from_iterable(
+            session.files for session in workflow["all_sessions"]
+        )
+        per_model_output_rates, model_most_recent = (
+            compute_p50_output_rates_and_recent_by_model(files)
+        )
 
-    def _get_sqlite_per_model_context_usage(
-        self, workflow: Dict[str, Any]
+        # The newest file overall is the newest of the per-model winners
+        recent_file = None
+        recent_created = 0
+        for f in model_most_recent.values():
+            time_data = f.time_data
+            created = time_data.created if time_data and time_data.created else 0
+            if recent_file is None or created > recent_created:
+                recent_file = f
+                recent_created = created
+
+        return recent_file, per_model_output_rates, model_most_recent
+
+    def _context_usage_by_model(
+        self, model_most_recent: Dict[str, InteractionFile]
     ) -> Dict[str, Dict[str, Any]]:
-        """Get context window usage for each model in SQLite workflow.
-
-        For each model, finds the most recent interaction and calculates context usage.
+        """Build context usage info from each model's most recent interaction.
 
         Args:
-            workflow: Workflow dict from SQLite
+            model_most_recent: Dict mapping model_id to its most recent file
 
         Returns:
             Dict mapping model_id to context usage info
         """
-        all_files = []
-        for session in workflow["all_sessions"]:
-            all_files.extend(session.non_zero_token_files)
-
-        if not all_files:
-            return {}
-
-        model_most_recent: Dict[str, Any] = {}
-        for f in all_files:
-            if f.model_id not in model_most_recent:
-                model_most_recent[f.model_id] = f
-            elif f.time_data and f.time_data.created:
-                existing = model_most_recent[f.model_id]
-                existing_time = (
-                    existing.time_data.created
-                    if existing.time_data and existing.time_data.created
-                    else 0
-                )
-                if f.time_data.created > existing_time:
-                    model_most_recent[f.model_id] = f
-
         result = {}
         default_context_window = 200000
+        get_pricing = self.pricing_data.get
 
         for model_id, recent_file in model_most_recent.items():
-            if model_id in self.pricing_data:
-                context_window = self.pricing_data[model_id].context_window
-            else:
-                context_window = default_context_window
+            pricing = get_pricing(model_id)
+            context_window = (
+                pricing.context_window if pricing else default_context_window
+            )
 
             context_size = (
                 recent_file.tokens.input
@@ -1922,18 +2164,44 @@ class LiveMonitor:
                 + recent_file.tokens.cache_write
             )
 
-            usage_pct = (
-                (context_size / context_window) * 100 if context_window > 0 else 0
-            )
-
             result[model_id] = {
                 "context_size": context_size,
                 "context_window": context_window,
-                "usage_percentage": min(100.0, usage_pct),
+                "usage_percentage": _context_usage_percentage(
+                    context_size, context_window
+                ),
             }
 
         return result
 
+    def _calculate_sqlite_per_model_output_rates(
+        self, workflow: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Calculate p50 output token rate per model for SQLite workflow.
+
+        Args:
+            workflow: Workflow dict from SQLite
+
+        Returns:
+            Dict mapping model_id to p50 output tokens per second
+        """
+        return self._scan_sqlite_workflow(workflow)[1]
+
+    def _get_sqlite_per_model_context_usage(
+        self, workflow: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get context window usage for each model in SQLite workflow.
+
+        For each model, finds the most recent interaction and calculates context usage.
+
+        Args:
+            workflow: Workflow dict from SQLite
+
+        Returns:
+            Dict mapping model_id to context usage info
+        """
+        return self._context_usage_by_model(self._scan_sqlite_workflow(workflow)[2])
+
     def validate_monitoring_setup(
         self, base_path: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -1946,11 +2214,87 @@ class LiveMonitor:
             Validation results
         """
         issues = []
-        warnings = []
-        info = {}
 
-        # First check for SQLite database (v1.2.0+)
         db_path = SQLiteProcessor.find_database_path()
+        base_path = base_path or (
+            self.paths_config.messages_dir if self.paths_config else None
+        )
+        info, warnings = self._probe_data_sources(db_path, base_path)
+
+        # Check pricing data
+        if not self.pricing_data:
+            zero_cost = (
+                self.currency_converter.format(Decimal("0"))
+                if self.currency_converter
+                else "$0.00"
+            )
+            warnings.append(
+                f"No pricing data available - costs will show as {zero_cost}"
+            )
+
+        # Determine if at least one source is available
+        if not info["sqlite"]["available"] and not info["files"].get("available"):
+            issues.append(
+                "No session data source found. Expected SQLite database or file storage."
+            )
+
+        return {
+            "valid": len(issues) == 0,
+            "issues": issues,
+            "warnings": warnings,
+            "info": info,
+        }
+
+    def _probe_data_sources(
+        self, db_path: Optional[Path], base_path: Optional[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Describe the available session data sources.
+
+        Reading database stats and listing session directories are the slow
+        parts of validation, so results are reused for a few seconds while
+        neither the database nor the sessions directory has changed.
+
+        Args:
+            db_path: Path to the SQLite database, if one was found
+            base_path: Path to directory containing sessions, if any
+
+        Returns:
+            Tuple of (info dict per source, warnings)
+        """
+        key = (
+            str(db_path) if db_path else None,
+            self._database_signature(db_path) if db_path else None,
+            base_path,
+            self._directory_mtime(base_path) if base_path else None,
+        )
+        now = time.monotonic()
+        cached = self._validation_cache
+        if cached and cached[0] == key and now - cached[1] < _VALIDATION_TTL:
+            info, warnings = cached[2], cached[3]
+        else:
+            info, warnings = self._read_data_sources(db_path, base_path)
+            self._validation_cache = (key, now, info, warnings)
+
+        # Hand out copies; the caller appends its own warnings
+        return {name: dict(source) for name, source in info.items()}, list(warnings)
+
+    @staticmethod
+    def _read_data_sources(
+        db_path: Optional[Path], base_path: Optional[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Read database stats and count session directories.
+
+        Args:
+            db_path: Path to the SQLite database, if one was found
+            base_path: Path to directory containing sessions, if any
+
+        Returns:
+            Tuple of (info dict per source, warnings)
+        """
+        info: Dict[str, Any] = {}
+        warnings: List[str] = []
+
+        # First check for SQLite database (v1.2.0+)
         if db_path:
             stats = SQLiteProcessor.get_database_stats(db_path)
             if stats.get("exists"):
@@ -1966,9 +2310,6 @@ class LiveMonitor:
             info["sqlite"] = {"available": False}
 
         # Check for file-based storage (legacy)
-        base_path = base_path or (
-            self.paths_config.messages_dir if self.paths_config else None
-        )
         if base_path:
             base_path_obj = Path(base_path)
             if base_path_obj.exists() and base_path_obj.is_dir():
@@ -1990,26 +2331,12 @@ class LiveMonitor:
         else:
             info["files"] = {"available": False}
 
-        # Check pricing data
-        if not self.pricing_data:
-            zero_cost = (
-                self.currency_converter.format(Decimal("0"))
-                if self.currency_converter
-                else "$0.00"
-            )
-            warnings.append(
-                f"No pricing data available - costs will show as {zero_cost}"
-            )
-
-        # Determine if at least one source is available
-        if not info["sqlite"]["available"] and not info["files"].get("available"):
-            issues.append(
-                "No session data source found. Expected SQLite database or file storage."
-            )
+        return info, warnings
 
-        return {
-            "valid": len(issues) == 0,
-            "issues": issues,
-            "warnings": warnings,
-            "info": info,
-        }
+    @staticmethod
+    def _directory_mtime(path: str) -> Optional[int]:
+        """Get a directory's mtime in nanoseconds, or None if it is missing."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
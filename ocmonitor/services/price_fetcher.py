@@ -1,7 +1,8 @@
 """Service for fetching remote model pricing from models.dev with caching."""
 
-import json
+import gzip
 import os
+import sys
 import threading
 import time
 from datetime import datetime, timedelta, timezone
@@ -10,32 +11,81 @@ from typing import Any, Dict, Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from ..utils import json_utils
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 # Lock for thread-safe cache operations
 _cache_lock = threading.Lock()
 
+# Descriptors of lock files held by this process, keyed by lock path
+_held_locks: Dict[str, int] = {}
+_held_locks_guard = threading.Lock()
+
+# Returned by fetch_models_dev_json when the server answers 304 Not Modified
+NOT_MODIFIED = object()
 
-def fetch_models_dev_json(url: str, timeout: int) -> Optional[dict]:
+# Cache envelope keys holding HTTP validators, mapped to response headers
+_VALIDATOR_HEADERS = {
+    'etag': 'ETag',
+    'last_modified': 'Last-Modified',
+}
+
+
+def fetch_models_dev_json(
+    url: str, timeout: int, validators: Optional[Dict[str, str]] = None
+) -> Any:
     """Fetch models.dev API JSON with timeout and error handling.
     
+    When validators are given the request is conditional, and the dict is
+    updated in place with the validators of a fresh response.
+    
     Args:
         url: The models.dev API URL
         timeout: Request timeout in seconds
+        validators: Optional 'etag'/'last_modified' values from a previous fetch
         
     Returns:
-        Parsed JSON dict or None if fetch fails
+        Parsed JSON dict, NOT_MODIFIED if the cached copy is still current,
+        or None if fetch fails
     """
     try:
-        req = Request(
-            url,
-            headers={
-                'User-Agent': 'ocmonitor/1.0',
-                'Accept': 'application/json',
-            }
-        )
+        headers = {
+            'User-Agent': 'ocmonitor/1.0',
+            'Accept': 'application/json',
+            # The payload is large, highly compressible JSON
+            'Accept-Encoding': 'gzip',
+        }
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        req = Request(url, headers=headers)
         with urlopen(req, timeout=timeout) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except (HTTPError, URLError, TimeoutError, json.JSONDecodeError) as e:
+            body = response.read()
+            encoding = response.headers.get('Content-Encoding')
+            if isinstance(encoding, str) and encoding.strip().lower() == 'gzip':
+                body = gzip.decompress(body)
+            # Parse the raw bytes directly; no intermediate decoded str
+            payload = json_utils.loads(body)
+            if validators is not None:
+                validators.clear()
+                for key, header in _VALIDATOR_HEADERS.items():
+                    value = response.headers.get(header)
+                    if isinstance(value, str):
+                        validators[key] = value
+            return payload
+    except HTTPError as e:
+        if e.code == 304:
+            return NOT_MODIFIED
+        return None
+    except (URLError, TimeoutError, ValueError) as e:
         # Return None on any fetch/parse error - caller handles fallback
         return None
     except Exception:
@@ -56,16 +106,32 @@ def load_cached_payload(cache_path: Path) -> Optional[dict]:
         if not cache_path.exists():
             return None
         
-        with open(cache_path, 'r') as f:
-            envelope = json.load(f)
+        with open(cache_path, 'rb') as f:
+            envelope = json_utils.loads(f.read())
         
         # Validate envelope structure
         if not isinstance(envelope, dict) or 'payload' not in envelope:
             return None
         
         return envelope
-    except (json.JSONDecodeError, IOError, OSError):
+    except (ValueError, IOError, OSError):
+        return None
+
+
+def _cache_signature(cache_path: Path) -> Optional[tuple]:
+    """Return a cheap change signature for the cache file.
+    
+    Args:
+        cache_path: Path to cache file
+        
+    Returns:
+        (mtime_ns, size) tuple, or None if the file cannot be stat'ed
+    """
+    try:
+        stat = cache_path.stat()
+    except OSError:
         return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 def save_cached_payload_atomic(cache_path: Path, envelope: dict) -> bool:
@@ -84,8 +150,8 @@ def save_cached_payload_atomic(cache_path: Path, envelope: dict) -> bool:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write to temp file in same directory
-        with open(temp_path, 'w') as f:
-            json.dump(envelope, f, indent=2)
+        with open(temp_path, 'wb') as f:
+            f.write(json_utils.dumps(envelope, indent=True))
         
         # Atomic rename
         os.replace(temp_path, cache_path)
@@ -100,9 +166,50 @@ def save_cached_payload_atomic(cache_path: Path, envelope: dict) -> bool:
         return False
 
 
+def _try_lock_fd(fd: int) -> bool:
+    """Try to take an exclusive OS lock on an open file without blocking."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock_fd(fd: int) -> None:
+    """Drop the OS lock on an open file."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+def _is_current_lock_file(fd: int, lock_path: Path) -> bool:
+    """Check that a locked descriptor still refers to the file at lock_path.
+
+    A releasing holder unlinks the lock file, so a waiter may end up locking
+    an orphaned inode while a newcomer creates a fresh file at the same path.
+    """
+    try:
+        path_stat = os.stat(lock_path)
+    except OSError:
+        return False
+    fd_stat = os.fstat(fd)
+    return (path_stat.st_dev, path_stat.st_ino) == (fd_stat.st_dev, fd_stat.st_ino)
+
+
 def acquire_lock(lock_path: Path, timeout: float = 30.0) -> bool:
     """Acquire file lock with timeout for concurrent access safety.
     
+    Uses an OS advisory lock (flock, or msvcrt.locking on Windows) on the
+    lock file, so the lock is released by the kernel if the holder dies and
+    a leftover lock file never blocks later runs.
+    
     Args:
         lock_path: Path to lock file
         timeout: Maximum time to wait for lock in seconds
@@ -110,22 +217,26 @@ def acquire_lock(lock_path: Path, timeout: float = 30.0) -> bool:
     Returns:
         True if lock acquired, False if timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
         try:
-            # Use O_EXCL to create file exclusively (fails if exists)
-            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            os.close(fd)
-            return True
-        except FileExistsError:
-            # Lock held by another process, wait and retry
-            time.sleep(0.1)
-            continue
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
         except OSError:
-            # Other OS error, wait and retry
-            time.sleep(0.1)
-            continue
-    return False
+            fd = None
+        
+        if fd is not None:
+            if _try_lock_fd(fd) and _is_current_lock_file(fd, lock_path):
+                with _held_locks_guard:
+                    _held_locks[str(lock_path)] = fd
+                return True
+            # Held elsewhere, or we locked a file that was just unlinked
+            os.close(fd)
+        
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
 
 
 def release_lock(lock_path: Path) -> None:
@@ -134,11 +245,18 @@ def release_lock(lock_path: Path) -> None:
     Args:
         lock_path: Path to lock file
     """
+    with _held_locks_guard:
+        fd = _held_locks.pop(str(lock_path), None)
+    if fd is None:
+        return
+    
+    # Unlink while still holding the lock so waiters re-check the path
     try:
-        if lock_path.exists():
-            lock_path.unlink()
+        lock_path.unlink()
     except OSError:
         pass
+    _unlock_fd(fd)
+    os.close(fd)
 
 
 def get_remote_payload(
@@ -167,7 +285,8 @@ def get_remote_payload(
     now = datetime.now(timezone.utc)
     
     with _cache_lock:
-        # Try to load existing cache
+        # Try to load existing cache, noting which version of the file was read
+        signature = _cache_signature(cache_path)
         envelope = load_cached_payload(cache_path)
         
         if envelope:
@@ -190,18 +309,36 @@ def get_remote_payload(
             return None
         
         try:
-            # Double-check cache after acquiring lock (another process may have updated)
-            envelope = load_cached_payload(cache_path)
+            # Double-check cache after acquiring lock (another process may have
+            # updated it); an unchanged file holds the stale envelope read above
+            if signature is None or _cache_signature(cache_path) != signature:
+                envelope = load_cached_payload(cache_path)
+                if envelope:
+                    try:
+                        expires_at = datetime.fromisoformat(envelope.get('expires_at', ''))
+                        if now < expires_at:
+                            return envelope.get('payload')
+                    except (ValueError, TypeError):
+                        pass
+            
+            # Fetch fresh data, conditionally if the cache has validators
+            validators = {}
             if envelope:
-                try:
-                    expires_at = datetime.fromisoformat(envelope.get('expires_at', ''))
-                    if now < expires_at:
-                        return envelope.get('payload')
-                except (ValueError, TypeError):
-                    pass
+                for key in _VALIDATOR_HEADERS:
+                    if isinstance(envelope.get(key), str):
+                        validators[key] = envelope[key]
+            payload = fetch_models_dev_json(url, timeout, validators)
+            expires_at = (now + timedelta(hours=cache_ttl_hours)).isoformat()
             
-            # Fetch fresh data
-            payload = fetch_models_dev_json(url, timeout)
+            if payload is NOT_MODIFIED:
+                if envelope:
+                    # Remote data is unchanged; extend the cached copy's TTL
+                    save_cached_payload_atomic(
+                        cache_path,
+                        {**envelope, 'fetched_at': now.isoformat(), 'expires_at': expires_at},
+                    )
+                    return envelope.get('payload')
+                return None
             
             if payload is not None:
                 # Create new envelope
@@ -209,8 +346,9 @@ def get_remote_payload(
                     'schema_version': 1,
                     'source_url': url,
                     'fetched_at': now.isoformat(),
-                    'expires_at': (now + timedelta(hours=cache_ttl_hours)).isoformat(),
+                    'expires_at': expires_at,
                     'payload': payload,
+                    **validators,
                 }
                 
                 # Save atomically
@@ -239,6 +377,8 @@ def map_models_dev_to_local(payload: dict) -> Dict[str, Dict[str, Any]]:
     - sessionQuota is not provided, defaults to 0.0
     
     Generates both bare model IDs and provider-prefixed IDs for compatibility.
+    Both keys share one pricing dict, so the result must be treated as
+    read-only (as merge_model_prices does).
     
     Args:
         payload: Raw models.dev API response
@@ -262,37 +402,33 @@ def map_models_dev_to_local(payload: dict) -> Dict[str, Dict[str, Any]]:
         models = provider_data.get('models', {})
         if not isinstance(models, dict):
             continue
+        provider_id_lower = provider_id.lower()
         
         for model_id, model_data in models.items():
             if not isinstance(model_data, dict):
                 continue
             
             # Extract cost and limit data
-            cost = model_data.get('cost', {}) or {}
-            limit = model_data.get('limit', {}) or {}
+            cost_get = (model_data.get('cost') or {}).get
+            limit = model_data.get('limit') or {}
             
-            # Build pricing entry
+            # Build pricing entry once; both keys below share it
             pricing = {
-                'input': cost.get('prompt', 0.0) or 0.0,
-                'output': cost.get('completion', 0.0) or 0.0,
-                'cacheWrite': cost.get('input_cache_write', 0.0) or 0.0,
-                'cacheRead': cost.get('input_cache_read', 0.0) or 0.0,
-                'contextWindow': limit.get('context', 0) or 0,
+                'input': cost_get('prompt') or 0.0,
+                'output': cost_get('completion') or 0.0,
+                'cacheWrite': cost_get('input_cache_write') or 0.0,
+                'cacheRead': cost_get('input_cache_read') or 0.0,
+                'contextWindow': limit.get('context') or 0,
                 'sessionQuota': 0.0,  # Not provided by models.dev
             }
             
-            # Generate keys
-            provider_id_lower = provider_id.lower()
+            # Bare model ID (lowercase, interned for cheap repeated lookups)
             model_id_lower = model_id.lower()
-            
-            # Bare model ID (lowercase)
-            bare_key = model_id_lower
-            if bare_key not in result:
-                result[bare_key] = pricing.copy()
+            result.setdefault(sys.intern(model_id_lower), pricing)
             
             # Provider-prefixed model ID (lowercase)
-            prefixed_key = f"{provider_id_lower}/{model_id_lower}"
-            if prefixed_key not in result:
-                result[prefixed_key] = pricing.copy()
+            result.setdefault(
+                sys.intern(f"{provider_id_lower}/{model_id_lower}"), pricing
+            )
     
     return result
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from ..models.analytics import (
     DailyUsage,
@@ -17,6 +18,7 @@ from ..models.session import SessionData
 from ..services.session_analyzer import SessionAnalyzer
 from ..services.session_grouper import SessionGrouper
 from ..ui.tables import TableFormatter
+from ..utils.time_utils import WEEKDAY_NAMES, TimeUtils
 
 
 class ReportGenerator:
@@ -221,8 +223,6 @@ class ReportGenerator:
         """
         sessions = self.analyzer.analyze_all_sessions(base_path)
 
-        from ..utils.time_utils import TimeUtils
-
         if month:
             month_data = TimeUtils.parse_month_string(month)
             if month_data:
@@ -309,8 +309,6 @@ class ReportGenerator:
         """
         sessions = self.analyzer.analyze_all_sessions(base_path)
 
-        from ..utils.time_utils import TimeUtils
-
         if month:
             month_data = TimeUtils.parse_month_string(month)
             if month_data:
@@ -395,8 +393,6 @@ class ReportGenerator:
         """
         sessions = self.analyzer.analyze_all_sessions(base_path)
 
-        from ..utils.time_utils import TimeUtils
-
         if year:
             start_date, end_date = TimeUtils.get_year_range(year)
             sessions = self.analyzer.filter_sessions_by_date(
@@ -471,8 +467,6 @@ class ReportGenerator:
         sessions = self.analyzer.analyze_all_sessions(base_path)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -586,8 +580,6 @@ class ReportGenerator:
 
     def _display_model_detail(self, stats):
         """Display model detail panel and tool table."""
-        from ..models.analytics import ModelDetailStats
-
         panel = self.table_formatter.create_model_detail_panel(stats)
         self.console.print(panel)
 
@@ -715,8 +707,6 @@ class ReportGenerator:
         sessions = self.analyzer.analyze_all_sessions(base_path)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
-
         parsed_start_date = (
             TimeUtils.parse_date_string(start_date) if start_date else None
         )
@@ -819,8 +809,6 @@ class ReportGenerator:
         force_recalculate: bool = False,
     ):
         """Display sessions grouped by workflow using semantic theme tags."""
-        from rich.table import Table
-
         # Group sessions into workflows
         grouper = SessionGrouper()
         workflows = grouper.group_sessions(sessions)
@@ -999,8 +987,6 @@ class ReportGenerator:
 
         # Additional workflow info
         if total_with_subs > 0:
-            from rich.panel import Panel
-
             workflow_info = (
                 f"{total_workflows} workflows ({total_with_subs} with sub-agents)"
             )
@@ -1018,8 +1004,6 @@ class ReportGenerator:
     ):
         """Display daily breakdown as table using semantic theme tags."""
         if breakdown:
-            from rich.table import Table
-
             table = Table(
                 title="Daily Usage Breakdown",
                 show_header=True,
@@ -1085,10 +1069,6 @@ class ReportGenerator:
         force_recalculate: bool = False,
     ):
         """Display weekly breakdown as table using semantic theme tags."""
-        from rich.table import Table
-
-        from ..utils.time_utils import WEEKDAY_NAMES, TimeUtils
-
         title = "Weekly Usage Breakdown"
         if week_start_day != 0:
             day_name = WEEKDAY_NAMES[week_start_day]
@@ -1152,8 +1132,6 @@ class ReportGenerator:
         force_recalculate: bool = False,
     ):
         """Display monthly breakdown as table using semantic theme tags."""
-        from rich.table import Table
-
         table = Table(
             title="Monthly Usage Breakdown",
             show_header=True,
@@ -1211,8 +1189,6 @@ class ReportGenerator:
         self, project_breakdown: ProjectBreakdownReport
     ):
         """Display projects breakdown as table using semantic theme tags."""
-        from rich.table import Table
-
         table = Table(
             title="Project Usage Breakdown",
             show_header=True,
@@ -1245,8 +1221,6 @@ class ReportGenerator:
         self.console.print(table)
 
         # Add summary
-        from rich.panel import Panel
-
         summary_text = (
             f"[metric.important]Total:[/metric.important] [metric.value]{len(project_breakdown.project_stats)}[/metric.value] projects, "
             f"[metric.value]{sum(p.total_sessions for p in project_breakdown.project_stats)}[/metric.value] sessions, "
@@ -342,30 +342,31 @@ class SessionAnalyzer:
         if not json_files:
             return 0.0
 
-        # Get current time and timeframe
+        # Filter files within timeframe against a raw Unix-time cutoff,
+        # tracking the oldest match as we go
         now = time.time()
-        timeframe_seconds = timeframe_minutes * 60
-
-        # Filter files within timeframe
+        cutoff = now - timeframe_minutes * 60
         recent_files = []
+        oldest_time = now
         for json_file in json_files:
             mod_time = json_file.stat().st_mtime
-            if (now - mod_time) <= timeframe_seconds:
-                recent_files.append((json_file, mod_time))
+            if mod_time >= cutoff:
+                recent_files.append(json_file)
+                if mod_time < oldest_time:
+                    oldest_time = mod_time
 
         if not recent_files:
             return 0.0
 
         # Calculate total tokens in recent files
         total_tokens = 0
-        for json_file, _ in recent_files:
+        for json_file in recent_files:
             interaction = FileProcessor.parse_interaction_file(json_file, path.name)
             if interaction:
                 total_tokens += interaction.tokens.total
 
         # Calculate time span
         if len(recent_files) > 1:
-            oldest_time = min([mod_time for _, mod_time in recent_files])
             time_span_minutes = (now - oldest_time) / 60
             if time_span_minutes > 0:
                 return total_tokens / time_span_minutes
@@ -1,11 +1,18 @@
 """Session grouper for creating workflow groups."""
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Optional, Dict
+from operator import itemgetter
+from typing import Any, List, Optional, Dict, Tuple
 
 from ..models.session import SessionData
 from ..models.workflow import SessionWorkflow
-from .agent_registry import AgentRegistry
+from .agent_registry import AgentKind, AgentRegistry
+
+
+def _start_time_key(item: Any) -> datetime:
+    """Sort key for sessions and workflows; missing start times sort first."""
+    return item.start_time or datetime.min
 
 
 class SessionGrouper:
@@ -33,40 +40,38 @@ class SessionGrouper:
         Returns:
             List of SessionWorkflow objects, sorted by start time (most recent first)
         """
-        # Separate main and sub-agent sessions
+        # Sort once by start time (oldest first for matching), then split into
+        # main and sub-agent sessions; the stable sort keeps both in order
         sub_agents: List[SessionData] = []
         main_sessions: List[SessionData] = []
 
-        for session in sessions:
-            if self._is_sub_agent(session):
+        # The registry memoizes classification per agent name, so bind its
+        # lookup once instead of going through _is_sub_agent per session
+        classify = self.agent_registry.classify
+        for session in sorted(sessions, key=_start_time_key):
+            if classify(session.agent) is AgentKind.SUB:
                 sub_agents.append(session)
             else:
                 main_sessions.append(session)
 
-        # Sort main sessions by start time (oldest first for matching)
-        main_sessions = sorted(
-            main_sessions,
-            key=lambda s: s.start_time or datetime.min
-        )
-
-        # Sort sub-agents by start time
-        sub_agents = sorted(
-            sub_agents,
-            key=lambda s: s.start_time or datetime.min
-        )
-
-        # Build workflows - each main session becomes a workflow
+        # Build workflows - each main session becomes a workflow. A workflow
+        # starts when its main session does, since sub-agents are only linked
+        # to mains that started before them, so record the sort key up front
+        # rather than re-deriving it from SessionWorkflow.start_time
         workflows: Dict[str, SessionWorkflow] = {}
+        start_times: Dict[str, datetime] = {}
         for main in main_sessions:
             workflows[main.session_id] = SessionWorkflow(
                 workflow_id=main.session_id,
                 main_session=main,
                 sub_agent_sessions=[]
             )
+            start_times[main.session_id] = _start_time_key(main)
 
         # Link each sub-agent to the most recent main session on same project
+        mains_by_project = self._index_main_sessions(main_sessions)
         for sub in sub_agents:
-            parent = self._find_parent_session(sub, main_sessions)
+            parent = self._find_parent_session(sub, mains_by_project)
             if parent and parent.session_id in workflows:
                 workflows[parent.session_id].sub_agent_sessions.append(sub)
             else:
@@ -76,38 +81,69 @@ class SessionGrouper:
                     main_session=sub,  # Treat as main for display
                     sub_agent_sessions=[]
                 )
+                start_times[sub.session_id] = _start_time_key(sub)
 
         # Return workflows sorted by start time (most recent first)
-        return sorted(
-            workflows.values(),
-            key=lambda w: w.start_time or datetime.min,
-            reverse=True
-        )
+        decorated = [
+            (start_times[workflow_id], workflow)
+            for workflow_id, workflow in workflows.items()
+        ]
+        decorated.sort(key=itemgetter(0), reverse=True)
+        return [workflow for _, workflow in decorated]
 
     def _is_sub_agent(self, session: SessionData) -> bool:
         """Check if session is a sub-agent session.
 
+        Classification is memoized per agent name by the registry and reset
+        whenever its agents are reloaded.
+
         Args:
             session: Session to check
 
         Returns:
             True if the session is from a sub-agent
         """
-        return self.agent_registry.is_sub_agent(session.agent)
+        return self.agent_registry.classify(session.agent) is AgentKind.SUB
+
+    @staticmethod
+    def _index_main_sessions(
+        main_sessions: List[SessionData]
+    ) -> Dict[str, Tuple[List[datetime], List[SessionData]]]:
+        """Index main sessions by project for parent lookups.
+
+        Args:
+            main_sessions: Main sessions sorted by start time (oldest first)
+
+        Returns:
+            Dict mapping project name to parallel lists of start times and
+            sessions, in start time order. Sessions without a start time are
+            left out since they can never be a parent.
+        """
+        index: Dict[str, Tuple[List[datetime], List[SessionData]]] = {}
+        for main in main_sessions:
+            if main.start_time is None:
+                continue
+            entry = index.get(main.project_name)
+            if entry is None:
+                entry = index[main.project_name] = ([], [])
+            entry[0].append(main.start_time)
+            entry[1].append(main)
+        return index
 
     def _find_parent_session(
         self,
         sub_agent: SessionData,
-        main_sessions: List[SessionData]
+        mains_by_project: Dict[str, Tuple[List[datetime], List[SessionData]]]
     ) -> Optional[SessionData]:
         """Find the parent main session for a sub-agent.
 
         Returns the most recent main session on the same project
-        that started BEFORE the sub-agent.
+        that started BEFORE the sub-agent. Of several mains with that same
+        start time, the first one in sort order is returned.
 
         Args:
             sub_agent: Sub-agent session to find parent for
-            main_sessions: List of main sessions to search
+            mains_by_project: Main session index from _index_main_sessions
 
         Returns:
             Parent SessionData or None if no match found
@@ -115,26 +151,27 @@ class SessionGrouper:
         if sub_agent.start_time is None:
             return None
 
-        candidates: List[SessionData] = []
-        for main in main_sessions:
-            # Must be same project
-            if main.project_name != sub_agent.project_name:
-                continue
-
-            # Main must have started before sub-agent
-            if main.start_time is None:
-                continue
-            if main.start_time > sub_agent.start_time:
-                continue
-
-            candidates.append(main)
-
-        if not candidates:
+        entry = mains_by_project.get(sub_agent.project_name)
+        if entry is None:
             return None
+        start_times, mains = entry
 
-        # Return the most recent candidate (closest in time to sub-agent)
-        return max(candidates, key=lambda s: s.start_time or datetime.min)
+        # Latest main that started at or before the sub-agent
+        idx = bisect_right(start_times, sub_agent.start_time) - 1
+        if idx < 0:
+            return None
+        return mains[bisect_left(start_times, start_times[idx])]
 
     def reload_agents(self):
         """Reload agent definitions."""
         self.agent_registry.reload()
+
+    def refresh_agents(self) -> bool:
+        """Reload agent definitions if the agent directory changed.
+
+        Intended for polling loops; a no-op stat when nothing changed.
+
+        Returns:
+            True if the agents were reloaded, False otherwise
+        """
+        return self.agent_registry.maybe_reload()
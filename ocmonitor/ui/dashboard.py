@@ -1,9 +1,10 @@
 """Live dashboard UI components for OpenCode Monitor."""
 
 import os
+from functools import lru_cache
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.layout import Layout
@@ -17,6 +18,99 @@ from ..models.workflow import SessionWorkflow
 from ..utils.formatting import ColorFormatter
 from ..utils.time_utils import TimeUtils
 
+# Header markup, filled with format_map once per refresh
+_HEADER_WORKFLOW_TMPL = (
+    "[dashboard.header]OpenCode Live Dashboard[/dashboard.header]  "
+    "[metric.label]Project:[/metric.label] [dashboard.project]{project}[/dashboard.project]  "
+    "[metric.label]Session:[/metric.label] [dashboard.session]{title}[/dashboard.session]  "
+    "[metric.label]Updated:[/metric.label] [metric.value]{updated}[/metric.value]  "
+    "[metric.label]Workflow:[/metric.label] [dashboard.info]{session_count} sessions[/dashboard.info] "
+    "[metric.label]([/metric.label][metric.value]1 main + {sub_agent_count} sub[/metric.value][metric.label])[/metric.label]"
+)
+_HEADER_SESSION_TMPL = (
+    "[dashboard.header]OpenCode Live Dashboard[/dashboard.header]  "
+    "[metric.label]Project:[/metric.label] [dashboard.project]{project}[/dashboard.project]  "
+    "[metric.label]Session:[/metric.label] [dashboard.session]{title}[/dashboard.session]  "
+    "[metric.label]Updated:[/metric.label] [metric.value]{updated}[/metric.value]  "
+    "[metric.label]Interactions:[/metric.label] [metric.value]{interaction_count}[/metric.value]"
+)
+
+# Token panel markup, filled with one %-format per section: the recent
+# section takes input, cache write, output and cache read; the totals
+# section takes its heading followed by those four and the total
+_RECENT_TOKENS_TMPL = (
+    "[dashboard.header]Recent Interaction[/dashboard.header]\n"
+    "[metric.label]Input:[/metric.label] [metric.value]%s[/metric.value]    "
+    "[metric.label]Cache W:[/metric.label] [metric.value]%s[/metric.value]\n"
+    "[metric.label]Output:[/metric.label] [metric.value]%s[/metric.value]   "
+    "[metric.label]Cache R:[/metric.label] [metric.value]%s[/metric.value]\n\n"
+)
+_TOKEN_TOTALS_TMPL = (
+    "%s\n"
+    "[metric.label]Input:[/metric.label] [metric.value]%s[/metric.value]    "
+    "[metric.label]Cache W:[/metric.label] [metric.value]%s[/metric.value]\n"
+    "[metric.label]Output:[/metric.label] [metric.value]%s[/metric.value]   "
+    "[metric.label]Cache R:[/metric.label] [metric.value]%s[/metric.value]\n"
+    "[metric.label]Total:[/metric.label] [metric.tokens]%s[/metric.tokens]"
+)
+
+# Formatted numbers kept between refreshes before the caches are reset
+_FORMAT_CACHE_SIZE = 1024
+
+
+# Full-width runs of bar cells, sliced to size for bars up to this wide
+_BAR_MAX_WIDTH = 30
+_BAR_FILLED = "█" * _BAR_MAX_WIDTH
+_BAR_EMPTY = "░" * _BAR_MAX_WIDTH
+
+
+def _bar_cells(filled: int, width: int) -> str:
+    """Get the filled and empty cells of a progress bar."""
+    if 0 <= filled <= width <= _BAR_MAX_WIDTH:
+        return _BAR_FILLED[:filled] + _BAR_EMPTY[filled:width]
+    return "█" * filled + "░" * (width - filled)
+
+
+def _build_compact_bar(percentage: float, width: int) -> str:
+    """Render a compact progress bar with its rounded percentage."""
+    bar = _bar_cells(int(width * percentage / 100), width)
+    return f"{bar} {percentage:.0f}%"
+
+
+# Compact bars for every whole percentage at the widths the dashboard uses;
+# float percentages with a whole value hit these entries too
+_COMPACT_BARS: Dict[Tuple[int, float], str] = {
+    (width, pct): _build_compact_bar(pct, width)
+    for width in (8, 10, 12, 20)
+    for pct in range(101)
+}
+
+
+# Semantic colors indexed by whole percentage 0-100; all thresholds are
+# whole numbers, so flooring a percentage never changes its color
+_USAGE_COLORS = tuple(ColorFormatter.get_color_by_percentage(pct) for pct in range(101))
+_TOOL_COLORS = tuple(
+    "status.success" if pct >= 90 else "status.warning" if pct >= 70 else "status.error"
+    for pct in range(101)
+)
+
+
+@lru_cache(maxsize=512)
+def _trunc(text: str, width: int) -> str:
+    """Cut text to at most width characters, ending in "..." when shortened."""
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+@lru_cache(maxsize=512)
+def _trunc_left(text: str, width: int) -> str:
+    """Cut text to at most width characters, starting with "..." when shortened."""
+    return text if len(text) <= width else "..." + text[3 - width :]
+
+
+def _token_counts(tokens: Any) -> Tuple[int, int, int, int]:
+    """Get the displayed token counts of a TokenUsage as a cache key."""
+    return (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read)
+
 
 class DashboardUI:
     """UI components for the live dashboard."""
@@ -30,40 +124,137 @@ class DashboardUI:
         """
         self.console = console or Console()
         self.currency_converter = currency_converter
+        # Last panel built per slot, with the inputs it was built from
+        self._panel_cache: Dict[str, Tuple[Tuple[Any, ...], Panel]] = {}
+        # Persistent layout tree, its (controls, grid) shape and named leaves
+        self._layout_skeleton: Optional[Layout] = None
+        self._layout_shape: Optional[Tuple[bool, bool]] = None
+        self._layout_slots: Dict[str, Layout] = {}
+        self._fmt_int_cache: Dict[int, str] = {}
+        self._fmt_cost_cache: Dict[Decimal, str] = {}
+
+    def _get_cached_panel(self, slot: str, key: Tuple[Any, ...]) -> Optional[Panel]:
+        """Get the panel last built for a slot if it was built from the same key."""
+        cached = self._panel_cache.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+
+    def _store_panel(self, slot: str, key: Tuple[Any, ...], panel: Panel) -> Panel:
+        """Remember a freshly built panel for its slot and return it."""
+        self._panel_cache[slot] = (key, panel)
+        return panel
+
+    def _get_layout_skeleton(self, show_controls: bool, use_grid: bool) -> Layout:
+        """Get the persistent layout tree, rebuilding it only when its shape changes.
+
+        Args:
+            show_controls: Whether the bottom controls row is shown
+            use_grid: Whether tools are shown as a per-model grid
+
+        Returns:
+            Layout whose named leaves are filled in by _set_layout_slot
+        """
+        shape = (show_controls, use_grid)
+        if self._layout_skeleton is not None and self._layout_shape == shape:
+            return self._layout_skeleton
+
+        layout = Layout()
+        # 3-4 section layout: Header, Metrics, Models+Tools, optional Controls (bottom)
+        rows = [
+            Layout(name="header", size=3),  # Compact header
+            Layout(name="metrics", size=12),  # Tokens + Status + Recent (single row)
+            Layout(name="models_tools", minimum_size=4),  # Model + Tool breakdown
+        ]
+        if show_controls:
+            rows.append(Layout(name="controls", size=3))  # Persistent keybind visibility
+        layout.split_column(*rows)
+
+        # Metrics section: 3-column layout (Tokens 50% | Status 25% | Recent 25%)
+        layout["metrics"].split_row(
+            Layout(name="token", ratio=2),  # 50% - token data (most content)
+            Layout(name="status", ratio=1),  # 25% - cost + time combined
+            Layout(name="recent", ratio=1),  # 25% - recent file info
+        )
+
+        # Models + Tools section: Full width to tools when using grid (model info embedded in tool panels)
+        if use_grid:
+            layout["models_tools"].split_column(Layout(name="tools"))
+        else:
+            layout["models_tools"].split_row(
+                Layout(name="model", ratio=3),
+                Layout(name="tools", ratio=2),
+            )
+
+        self._layout_skeleton = layout
+        self._layout_shape = shape
+        self._layout_slots = {
+            name: layout[name]
+            for name in ("header", "token", "status", "recent", "model", "tools", "controls")
+            if layout.get(name) is not None
+        }
+        return layout
+
+    def _set_layout_slot(self, name: str, renderable: Any) -> None:
+        """Put a renderable into a named leaf unless it is already there."""
+        slot = self._layout_slots[name]
+        if slot.renderable is not renderable:
+            slot.update(renderable)
 
     def _fmt_cost(self, amount: Decimal) -> str:
-        """Format cost amount using currency converter."""
-        if self.currency_converter:
-            return self.currency_converter.format(amount)
-        return f"${amount:.2f}"
+        """Format cost amount using currency converter.
+
+        Most costs repeat from one refresh to the next, so formatted strings
+        are cached by amount.
+        """
+        cache = self._fmt_cost_cache
+        text = cache.get(amount)
+        if text is None:
+            if len(cache) >= _FORMAT_CACHE_SIZE:
+                cache.clear()
+            if self.currency_converter:
+                text = self.currency_converter.format(amount)
+            else:
+                text = f"${amount:.2f}"
+            cache[amount] = text
+        return text
+
+    def _fmt_int(self, value: int) -> str:
+        """Format an integer with thousands separators, cached by value."""
+        cache = self._fmt_int_cache
+        text = cache.get(value)
+        if text is None:
+            if len(cache) >= _FORMAT_CACHE_SIZE:
+                cache.clear()
+            text = cache[value] = f"{value:,}"
+        return text
 
     def create_header(
         self,
         session: SessionData,
         workflow: Optional[SessionWorkflow] = None,
         controls_hint: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> Panel:
         """Create header panel with session info."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = (now or datetime.now()).isoformat(" ", "seconds")
 
         if workflow and workflow.has_sub_agents:
             # Show workflow info with sub-agent count
-            header_text = (
-                f"[dashboard.header]OpenCode Live Dashboard[/dashboard.header]  "
-                f"[metric.label]Project:[/metric.label] [dashboard.project]{workflow.project_name}[/dashboard.project]  "
-                f"[metric.label]Session:[/metric.label] [dashboard.session]{workflow.display_title}[/dashboard.session]  "
-                f"[metric.label]Updated:[/metric.label] [metric.value]{current_time}[/metric.value]  "
-                f"[metric.label]Workflow:[/metric.label] [dashboard.info]{workflow.session_count} sessions[/dashboard.info] "
-                f"[metric.label]([/metric.label][metric.value]1 main + {workflow.sub_agent_count} sub[/metric.value][metric.label])[/metric.label]"
-            )
+            header_text = _HEADER_WORKFLOW_TMPL.format_map({
+                "project": workflow.project_name,
+                "title": workflow.display_title,
+                "updated": current_time,
+                "session_count": workflow.session_count,
+                "sub_agent_count": workflow.sub_agent_count,
+            })
         else:
-            header_text = (
-                f"[dashboard.header]OpenCode Live Dashboard[/dashboard.header]  "
-                f"[metric.label]Project:[/metric.label] [dashboard.project]{session.project_name}[/dashboard.project]  "
-                f"[metric.label]Session:[/metric.label] [dashboard.session]{session.display_title}[/dashboard.session]  "
-                f"[metric.label]Updated:[/metric.label] [metric.value]{current_time}[/metric.value]  "
-                f"[metric.label]Interactions:[/metric.label] [metric.value]{session.interaction_count}[/metric.value]"
-            )
+            header_text = _HEADER_SESSION_TMPL.format_map({
+                "project": session.project_name,
+                "title": session.display_title,
+                "updated": current_time,
+                "interaction_count": session.interaction_count,
+            })
 
         return Panel(
             header_text,
@@ -72,6 +263,38 @@ class DashboardUI:
             border_style="dashboard.border",
         )
 
+    def _format_token_text(
+        self, heading: str, totals: Any, recent_file: Optional[Any]
+    ) -> str:
+        """Fill the token panel templates for a totals heading and optional recent file.
+
+        Args:
+            heading: Markup for the totals section heading
+            totals: TokenUsage shown in the totals section
+            recent_file: Interaction shown in the recent section, if any
+
+        Returns:
+            Rich markup for the token panel body
+        """
+        fmt_int = self._fmt_int
+        text = _TOKEN_TOTALS_TMPL % (
+            heading,
+            fmt_int(totals.input),
+            fmt_int(totals.cache_write),
+            fmt_int(totals.output),
+            fmt_int(totals.cache_read),
+            fmt_int(totals.total),
+        )
+        if recent_file:
+            tokens = recent_file.tokens
+            text = _RECENT_TOKENS_TMPL % (
+                fmt_int(tokens.input),
+                fmt_int(tokens.cache_write),
+                fmt_int(tokens.output),
+                fmt_int(tokens.cache_read),
+            ) + text
+        return text
+
     def create_controls_panel(self, controls_hint: str) -> Panel:
         """Create dedicated controls panel for live keybind hints."""
         controls_text = f"[dim]{controls_hint}[/dim]"
@@ -87,38 +310,25 @@ class DashboardUI:
     ) -> Panel:
         """Create token consumption panel."""
         session_tokens = session.total_tokens
+        key = (
+            _token_counts(session_tokens),
+            _token_counts(recent_file.tokens) if recent_file else None,
+        )
+        panel = self._get_cached_panel("token", key)
+        if panel is not None:
+            return panel
 
         # Create compact horizontal layout
-        if recent_file:
-            token_text = (
-                f"[dashboard.header]Recent Interaction[/dashboard.header]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{recent_file.tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{recent_file.tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{recent_file.tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{recent_file.tokens.cache_read:,}[/metric.value]\n\n"
-                f"[dashboard.header]Session Totals[/dashboard.header]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{session_tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{session_tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{session_tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{session_tokens.cache_read:,}[/metric.value]\n"
-                f"[metric.label]Total:[/metric.label] [metric.tokens]{session_tokens.total:,}[/metric.tokens]"
-            )
-        else:
-            token_text = (
-                f"[dashboard.header]Session Totals[/dashboard.header]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{session_tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{session_tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{session_tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{session_tokens.cache_read:,}[/metric.value]\n"
-                f"[metric.label]Total:[/metric.label] [metric.tokens]{session_tokens.total:,}[/metric.tokens]"
-            )
+        token_text = self._format_token_text(
+            "[dashboard.header]Session Totals[/dashboard.header]", session_tokens, recent_file
+        )
 
-        return Panel(
+        return self._store_panel("token", key, Panel(
             token_text,
             title=Text("Tokens", style="dashboard.title"),
             title_align="left",
             border_style="dashboard.border",
-        )
+        ))
 
     def create_cost_panel(
         self,
@@ -130,7 +340,7 @@ class DashboardUI:
         total_cost = session.calculate_total_cost(pricing_data)
 
         if quota:
-            percentage = min(100, float(total_cost / quota) * 100)
+            percentage = self._pct(total_cost, quota)
             progress_bar = self.create_compact_progress_bar(percentage)
             cost_color = self.get_cost_color(percentage)
 
@@ -173,23 +383,42 @@ class DashboardUI:
                 border_style="dashboard.border",
             )
 
+        rows = [
+            (
+                model,
+                stats["tokens"].total,
+                stats["cost"],
+                per_model_output_rates.get(model, 0.0),
+                per_model_context.get(model, {}).get("usage_percentage", 0.0),
+            )
+            for model, stats in model_breakdown.items()
+        ]
+        key = tuple(rows)
+        panel = self._get_cached_panel("model", key)
+        if panel is not None:
+            return panel
+
+        return self._store_panel("model", key, self._build_model_panel(rows))
+
+    def _build_model_panel(self, rows: List[Tuple[str, int, Decimal, float, float]]) -> Panel:
+        """Build the models panel from (model, tokens, cost, output rate, context %) rows."""
+        compact_bar = self.create_compact_progress_bar
+        fmt_int = self._fmt_int
+        fmt_cost = self._fmt_cost
         model_lines = []
-        for model, stats in model_breakdown.items():
-            model_name = model[:35] + "..." if len(model) > 38 else model
+        for model, total_tokens, cost, output_rate, context_pct in rows:
+            model_name = _trunc(model, 38)
             
-            # Get context usage for this model
-            context_info = per_model_context.get(model, {})
-            context_pct = context_info.get("usage_percentage", 0.0)
-            context_bar = self.create_compact_progress_bar(context_pct, 8)
+            # Context usage for this model
+            context_bar = compact_bar(context_pct, 8)
             
-            # Get output rate for this model
-            output_rate = per_model_output_rates.get(model, 0.0)
+            # Output rate for this model
             rate_str = f" - {output_rate:.1f} tok/s" if output_rate > 0 else ""
             
             model_lines.append(
                 f"[metric.label]{model_name}[/metric.label]  -  "
-                f"[metric.value]{stats['tokens'].total:,}[/metric.value] [metric.tokens]tok[/metric.tokens]  "
-                f"[metric.cost]{self._fmt_cost(stats['cost'])}[/metric.cost]  -  "
+                f"[metric.value]{fmt_int(total_tokens)}[/metric.value] [metric.tokens]tok[/metric.tokens]  "
+                f"[metric.cost]{fmt_cost(cost)}[/metric.cost]  -  "
                 f"context {context_bar}{rate_str}"
             )
 
@@ -220,13 +449,13 @@ class DashboardUI:
             + recent_file.tokens.cache_write
         )
 
-        percentage = min(100, (context_size / context_window) * 100)
+        percentage = self._pct(context_size, context_window)
         progress_bar = self.create_compact_progress_bar(percentage, 12)
         context_color = self.get_context_color(percentage)
 
         context_text = (
-            f"[metric.label]Size:[/metric.label] [metric.value]{context_size:,}[/metric.value]\n"
-            f"[metric.label]Window:[/metric.label] [metric.value]{context_window:,}[/metric.value]\n"
+            f"[metric.label]Size:[/metric.label] [metric.value]{self._fmt_int(context_size)}[/metric.value]\n"
+            f"[metric.label]Window:[/metric.label] [metric.value]{self._fmt_int(context_window)}[/metric.value]\n"
             f"[{context_color}]{progress_bar}[/{context_color}]"
         )
 
@@ -264,7 +493,9 @@ class DashboardUI:
             border_style="dashboard.border",
         )
 
-    def create_session_time_panel(self, session: SessionData) -> Panel:
+    def create_session_time_panel(
+        self, session: SessionData, now: Optional[datetime] = None
+    ) -> Panel:
         """Create session time progress panel with 5-hour maximum."""
         if not session.start_time:
             return Panel(
@@ -274,14 +505,14 @@ class DashboardUI:
             )
 
         # Calculate duration from start_time to now (updates continuously even when idle)
-        current_time = datetime.now()
+        current_time = now or datetime.now()
         session_duration = current_time - session.start_time
         duration_ms = int(session_duration.total_seconds() * 1000)
 
         # Calculate percentage based on 5-hour maximum
         max_hours = 5.0
         duration_hours = session_duration.total_seconds() / 3600
-        percentage = min(100.0, (duration_hours / max_hours) * 100.0)
+        percentage = self._pct(duration_hours, max_hours)
 
         # Format duration display using hours and minutes format
         duration_display = TimeUtils.format_duration_hm(duration_ms)
@@ -308,13 +539,14 @@ class DashboardUI:
         session: SessionData,
         pricing_data: Dict[str, Any],
         quota: Optional[Decimal] = None,
+        now: Optional[datetime] = None,
     ) -> Panel:
         """Create combined status panel with Cost + Session Time."""
         # --- Cost section ---
         total_cost = session.calculate_total_cost(pricing_data)
 
         if quota:
-            percentage = min(100, float(total_cost / quota) * 100)
+            percentage = self._pct(total_cost, quota)
             progress_bar = self.create_compact_progress_bar(percentage, 10)
             cost_color = self.get_cost_color(percentage)
             cost_section = (
@@ -332,12 +564,12 @@ class DashboardUI:
 
         # --- Time section ---
         if session.start_time:
-            current_time = datetime.now()
+            current_time = now or datetime.now()
             session_duration = current_time - session.start_time
             duration_ms = int(session_duration.total_seconds() * 1000)
             max_hours = 5.0
             duration_hours = session_duration.total_seconds() / 3600
-            percentage = min(100.0, (duration_hours / max_hours) * 100.0)
+            percentage = self._pct(duration_hours, max_hours)
             duration_display = TimeUtils.format_duration_hm(duration_ms)
             progress_bar = self.create_compact_progress_bar(percentage, 10)
             time_color = self.get_time_color(percentage)
@@ -371,13 +603,14 @@ class DashboardUI:
         workflow: SessionWorkflow,
         pricing_data: Dict[str, Any],
         quota: Optional[Decimal] = None,
+        now: Optional[datetime] = None,
     ) -> Panel:
         """Create combined status panel with Workflow Cost + Workflow Time."""
         # --- Cost section ---
         total_cost = workflow.calculate_total_cost(pricing_data)
 
         if quota:
-            percentage = min(100, float(total_cost / quota) * 100)
+            percentage = self._pct(total_cost, quota)
             progress_bar = self.create_compact_progress_bar(percentage, 10)
             cost_color = self.get_cost_color(percentage)
             cost_section = (
@@ -395,12 +628,12 @@ class DashboardUI:
 
         # --- Time section ---
         if workflow.start_time:
-            current_time = datetime.now()
+            current_time = now or datetime.now()
             workflow_duration = current_time - workflow.start_time
             duration_ms = int(workflow_duration.total_seconds() * 1000)
             max_hours = 5.0
             duration_hours = workflow_duration.total_seconds() / 3600
-            percentage = min(100.0, (duration_hours / max_hours) * 100.0)
+            percentage = self._pct(duration_hours, max_hours)
             duration_display = TimeUtils.format_duration_hm(duration_ms)
             progress_bar = self.create_compact_progress_bar(percentage, 10)
             time_color = self.get_time_color(percentage)
@@ -438,26 +671,30 @@ class DashboardUI:
                 border_style="dashboard.border",
             )
 
+        duration_ms = recent_file.time_data.duration_ms if recent_file.time_data else None
+        key = (recent_file.file_name, recent_file.model_id, duration_ms)
+        panel = self._get_cached_panel("recent", key)
+        if panel is not None:
+            return panel
+
         # Truncate file name if too long
-        file_name = recent_file.file_name
-        if len(file_name) > 20:
-            file_name = "..." + file_name[-17:]
+        file_name = _trunc_left(recent_file.file_name, 20)
 
         file_text = (
             f"[metric.label]File:[/metric.label] [metric.value]{file_name}[/metric.value]\n"
             f"[metric.label]Model:[/metric.label] [metric.value]{recent_file.model_id[:35]}[/metric.value]"
         )
 
-        if recent_file.time_data and recent_file.time_data.duration_ms:
-            duration = self.format_duration(recent_file.time_data.duration_ms)
+        if duration_ms:
+            duration = self.format_duration(duration_ms)
             file_text += f"\n[metric.label]Duration:[/metric.label] [metric.value]{duration}[/metric.value]"
 
-        return Panel(
+        return self._store_panel("recent", key, Panel(
             file_text,
             title=Text("Recent", style="dashboard.title"),
             title_align="left",
             border_style="dashboard.border",
-        )
+        ))
 
     def create_tool_panel(
         self, tool_stats: List[ToolUsageStats], max_tools: int = 10
@@ -479,15 +716,23 @@ class DashboardUI:
                 border_style="dashboard.border",
             )
 
+        shown = tool_stats[:max_tools]
+        key = tuple(
+            (stat.tool_name, stat.total_calls, stat.success_rate) for stat in shown
+        )
+        panel = self._get_cached_panel("tools", key)
+        if panel is not None:
+            return panel
+
+        compact_bar = self.create_compact_progress_bar
+        tool_color = self.get_tool_color
         lines = []
-        for stat in tool_stats[:max_tools]:
-            tool_name = stat.tool_name
-            if len(tool_name) > 12:
-                tool_name = tool_name[:9] + "..."
+        for stat in shown:
+            tool_name = _trunc(stat.tool_name, 12)
 
             success_rate = stat.success_rate
-            bar = self.create_compact_progress_bar(success_rate, 10)
-            color = self.get_tool_color(success_rate)
+            bar = compact_bar(success_rate, 10)
+            color = tool_color(success_rate)
 
             lines.append(
                 f"[metric.label]{tool_name:<12}[/metric.label] "
@@ -497,12 +742,12 @@ class DashboardUI:
 
         tool_text = "\n".join(lines)
 
-        return Panel(
+        return self._store_panel("tools", key, Panel(
             tool_text,
             title=Text("Tools", style="dashboard.title"),
             title_align="left",
             border_style="dashboard.border",
-        )
+        ))
 
     def get_tool_color(self, success_rate: float) -> str:
         """Get color for tool success rate.
@@ -513,12 +758,7 @@ class DashboardUI:
         Returns:
             Color string for styling
         """
-        if success_rate >= 90:
-            return "status.success"
-        elif success_rate >= 70:
-            return "status.warning"
-        else:
-            return "status.error"
+        return _TOOL_COLORS[min(100, max(0, int(success_rate)))]
 
     def create_model_tool_panel(
         self,
@@ -542,11 +782,11 @@ class DashboardUI:
         Returns:
             Panel with tool usage information for this model
         """
-        model_name = model_tool_usage.model_name
-        if len(model_name) > 35:
-            model_name = model_name[:32] + "..."
+        model_name = _trunc(model_tool_usage.model_name, 35)
 
-        tool_stats = model_tool_usage.tool_stats[:max_tools]
+        tool_stats = model_tool_usage.tool_stats
+        if len(tool_stats) > max_tools:
+            tool_stats = tool_stats[:max_tools]
 
         if not tool_stats:
             return Panel(
@@ -572,18 +812,18 @@ class DashboardUI:
             extra_str = "  " + "  ".join(extra_info) if extra_info else ""
             
             lines.append(
-                f"[metric.value]{model_tokens:,}[/metric.value] [metric.tokens]tokens[/metric.tokens]{cost_str}{extra_str}"
+                f"[metric.value]{self._fmt_int(model_tokens)}[/metric.value] [metric.tokens]tokens[/metric.tokens]{cost_str}{extra_str}"
             )
             lines.append("[dashboard.border]────────────────────────[/dashboard.border]")
 
+        compact_bar = self.create_compact_progress_bar
+        tool_color = self.get_tool_color
         for stat in tool_stats:
-            tool_name = stat.tool_name
-            if len(tool_name) > 12:
-                tool_name = tool_name[:9] + "..."
+            tool_name = _trunc(stat.tool_name, 12)
 
             success_rate = stat.success_rate
-            bar = self.create_compact_progress_bar(success_rate, 8)
-            color = self.get_tool_color(success_rate)
+            bar = compact_bar(success_rate, 8)
+            color = tool_color(success_rate)
 
             lines.append(
                 f"[metric.label]{tool_name:<12}[/metric.label] "
@@ -611,7 +851,8 @@ class DashboardUI:
 
         Args:
             tool_stats_by_model: List of ModelToolUsage (one per model)
-            model_breakdown: Optional dict mapping model names to token/cost data
+            model_breakdown: Optional dict mapping model names to a dict with
+                the model's total token count ('tokens_total') and cost ('cost')
             per_model_output_rates: Optional dict mapping model to output rate
             per_model_context: Optional dict mapping model to context info
 
@@ -634,10 +875,9 @@ class DashboardUI:
         per_model_context = per_model_context or {}
 
         def get_model_info(model_name: str):
-            if model_name in model_breakdown:
-                stats = model_breakdown[model_name]
-                tokens = stats.get("tokens", {}).total if hasattr(stats.get("tokens", {}), "total") else stats.get("tokens", 0)
-                cost = stats.get("cost")
+            stats = model_breakdown.get(model_name)
+            if stats is not None:
+                tokens, cost = stats["tokens_total"], stats["cost"]
             else:
                 tokens, cost = None, None
             
@@ -647,29 +887,35 @@ class DashboardUI:
             
             return tokens, cost, context_pct, output_rate
 
-        left_models = []
-        right_models = []
-        for i, model_usage in enumerate(tool_stats_by_model):
-            if i % 2 == 0:
-                left_models.append(model_usage)
-            else:
-                right_models.append(model_usage)
-
-        left_panels = []
-        for model_usage in left_models:
-            model_tokens, model_cost, context_pct, output_rate = get_model_info(model_usage.model_name)
-            left_panels.append(self.create_model_tool_panel(
-                model_usage, model_tokens=model_tokens, model_cost=model_cost,
-                context_pct=context_pct, output_rate=output_rate
-            ))
+        infos = [
+            (model_usage, get_model_info(model_usage.model_name))
+            for model_usage in tool_stats_by_model
+        ]
+        key = tuple(
+            (
+                model_usage.model_name,
+                tuple(
+                    (stat.tool_name, stat.total_calls, stat.success_rate)
+                    for stat in model_usage.tool_stats
+                ),
+                info,
+            )
+            for model_usage, info in infos
+        )
+        panel = self._get_cached_panel("tool_grid", key)
+        if panel is not None:
+            return Layout(panel)
 
-        right_panels = []
-        for model_usage in right_models:
-            model_tokens, model_cost, context_pct, output_rate = get_model_info(model_usage.model_name)
-            right_panels.append(self.create_model_tool_panel(
+        panels = [
+            self.create_model_tool_panel(
                 model_usage, model_tokens=model_tokens, model_cost=model_cost,
                 context_pct=context_pct, output_rate=output_rate
-            ))
+            )
+            for model_usage, (model_tokens, model_cost, context_pct, output_rate) in infos
+        ]
+        # Alternate models between the left and right columns
+        left_panels = panels[::2]
+        right_panels = panels[1::2]
 
         left_column = Layout()
         if left_panels:
@@ -694,7 +940,7 @@ class DashboardUI:
             border_style="dashboard.border",
         )
 
-        return Layout(outer_panel)
+        return Layout(self._store_panel("tool_grid", key, outer_panel))
 
     def create_dashboard_layout(
         self,
@@ -709,8 +955,14 @@ class DashboardUI:
         tool_stats_by_model: Optional[List[ModelToolUsage]] = None,
         controls_hint: Optional[str] = None,
     ) -> Layout:
-        """Create the complete dashboard layout."""
-        layout = Layout()
+        """Create the complete dashboard layout.
+
+        The persistent layout is filled from freshly created or cached
+        panels; panels whose inputs are unchanged come from the per-slot
+        panel cache.
+        """
+        # One clock read per frame, shared by the header and time sections
+        frame_now = datetime.now()
 
         # Default empty dicts if not provided
         per_model_output_rates = per_model_output_rates or {}
@@ -719,17 +971,21 @@ class DashboardUI:
         # Use workflow data if available, otherwise use session data
         if workflow and workflow.has_sub_agents:
             # Create panels using workflow totals
-            header = self.create_header(session, workflow)
+            header = self.create_header(session, workflow, now=frame_now)
             token_panel = self.create_workflow_token_panel(workflow, recent_file)
-            status_panel = self.create_workflow_status_panel(workflow, pricing_data, quota)
+            status_panel = self.create_workflow_status_panel(
+                workflow, pricing_data, quota, now=frame_now
+            )
             model_panel = self.create_workflow_model_panel(
                 workflow, pricing_data, per_model_output_rates, per_model_context
             )
         else:
             # Create panels using single session data
-            header = self.create_header(session)
+            header = self.create_header(session, now=frame_now)
             token_panel = self.create_token_panel(session, recent_file)
-            status_panel = self.create_status_panel(session, pricing_data, quota)
+            status_panel = self.create_status_panel(
+                session, pricing_data, quota, now=frame_now
+            )
             model_panel = self.create_model_panel(
                 session, pricing_data, per_model_output_rates, per_model_context
             )
@@ -740,101 +996,72 @@ class DashboardUI:
         by_model = tool_stats_by_model or []
         use_grid = len(by_model) > 1
 
-        # Build model breakdown data for passing to tool grid panels
+        # Build model breakdown data for passing to tool grid panels, with
+        # token totals as plain ints whichever source they come from
         model_breakdown: Optional[Dict[str, Dict[str, Any]]] = None
         if use_grid:
             if workflow and workflow.has_sub_agents:
-                from collections import defaultdict
-                model_breakdown = defaultdict(lambda: {"tokens": 0, "cost": Decimal("0.0")})
-                for sess in workflow.all_sessions:
-                    sess_breakdown = sess.get_model_breakdown(pricing_data)
-                    for model, stats in sess_breakdown.items():
-                        model_breakdown[model]["tokens"] += stats["tokens"].total
-                        model_breakdown[model]["cost"] += stats["cost"]
-                model_breakdown = dict(model_breakdown)
+                model_breakdown = {
+                    model: {"tokens_total": stats["tokens"], "cost": stats["cost"]}
+                    for model, stats in workflow.aggregated_model_breakdown(pricing_data).items()
+                }
             else:
-                model_breakdown = session.get_model_breakdown(pricing_data)
-
-        # Initialize variables
-        tool_grid_panel: Optional[Layout] = None
-        tool_panel: Optional[Panel] = None
-        model_ratio = 3
-        tool_ratio = 2
+                model_breakdown = {
+                    model: {"tokens_total": stats["tokens"].total, "cost": stats["cost"]}
+                    for model, stats in session.get_model_breakdown(pricing_data).items()
+                }
 
         if use_grid:
-            tool_grid_panel = self.create_tool_grid_panel(
+            # The grid is a single-panel Layout; its panel fills the tools slot
+            tool_panel = self.create_tool_grid_panel(
                 by_model,
                 model_breakdown=model_breakdown,
                 per_model_output_rates=per_model_output_rates,
                 per_model_context=per_model_context,
-            )
-            model_ratio = 2
-            tool_ratio = 3
+            ).renderable
         else:
             flat_tool_stats = tool_stats or []
             if by_model and not tool_stats:
                 flat_tool_stats = by_model[0].tool_stats
             tool_panel = self.create_tool_panel(flat_tool_stats)
 
-        # 3-4 section layout: Header, Metrics, Models+Tools, optional Controls (bottom)
+        layout = self._get_layout_skeleton(bool(controls_hint), use_grid)
+        self._set_layout_slot("header", header)
+        self._set_layout_slot("token", token_panel)
+        self._set_layout_slot("status", status_panel)
+        self._set_layout_slot("recent", recent_file_panel)
+        self._set_layout_slot("tools", tool_panel)
+        if not use_grid:
+            self._set_layout_slot("model", model_panel)
         if controls_hint:
-            controls_panel = self.create_controls_panel(controls_hint)
-            layout.split_column(
-                Layout(header, size=3),  # Compact header
-                Layout(name="metrics", size=12),  # Tokens + Status + Recent (single row)
-                Layout(name="models_tools", minimum_size=4),  # Model + Tool breakdown
-                Layout(controls_panel, size=3),  # Persistent keybind visibility
-            )
-        else:
-            layout.split_column(
-                Layout(header, size=3),  # Compact header
-                Layout(name="metrics", size=12),  # Tokens + Status + Recent (single row)
-                Layout(name="models_tools", minimum_size=4),  # Model + Tool breakdown
-            )
-
-        # Metrics section: 3-column layout (Tokens 50% | Status 25% | Recent 25%)
-        layout["metrics"].split_row(
-            Layout(token_panel, ratio=2),  # 50% - token data (most content)
-            Layout(status_panel, ratio=1),  # 25% - cost + time combined
-            Layout(recent_file_panel, ratio=1),  # 25% - recent file info
-        )
-
-        # Models + Tools section: Full width to tools when using grid (model info embedded in tool panels)
-        if use_grid:
-            assert tool_grid_panel is not None
-            layout["models_tools"].split_column(tool_grid_panel)
-        else:
-            assert tool_panel is not None
-            layout["models_tools"].split_row(
-                Layout(model_panel, ratio=model_ratio),
-                Layout(tool_panel, ratio=tool_ratio),
-            )
+            self._set_layout_slot("controls", self.create_controls_panel(controls_hint))
 
         return layout
 
     def create_progress_bar(self, percentage: float, width: int = 30) -> str:
         """Create a text-based progress bar."""
-        filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
+        bar = _bar_cells(int(width * percentage / 100), width)
         return f"[{bar}] {percentage:.1f}%"
 
     def create_compact_progress_bar(self, percentage: float, width: int = 20) -> str:
         """Create a compact progress bar for space-efficient display."""
-        filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"{bar} {percentage:.0f}%"
+        bar = _COMPACT_BARS.get((width, percentage))
+        if bar is None:
+            bar = _build_compact_bar(percentage, width)
+        return bar
 
-    def get_cost_color(self, percentage: float) -> str:
-        """Get color for cost based on percentage."""
-        return ColorFormatter.get_color_by_percentage(percentage)
+    @staticmethod
+    def _pct(value: Any, maximum: Any) -> float:
+        """Get value as a percentage of maximum, capped at 100 and 0 for no maximum."""
+        return 0.0 if maximum <= 0 else min(100.0, float(value / maximum) * 100.0)
 
-    def get_context_color(self, percentage: float) -> str:
-        """Get color for context window based on percentage."""
-        return ColorFormatter.get_color_by_percentage(percentage)
+    @staticmethod
+    def get_cost_color(percentage: float) -> str:
+        """Get color for a cost, context or time percentage."""
+        return _USAGE_COLORS[min(100, max(0, int(percentage)))]
 
-    def get_time_color(self, percentage: float) -> str:
-        """Get color for session time based on percentage of 5-hour max."""
-        return ColorFormatter.get_color_by_percentage(percentage)
+    # Cost, context and time all share the same percentage thresholds
+    get_context_color = get_time_color = get_cost_color
 
     def format_duration(self, milliseconds: int) -> str:
         """Format duration in milliseconds to hours and minutes format."""
@@ -860,38 +1087,28 @@ class DashboardUI:
     ) -> Panel:
         """Create token consumption panel for workflow."""
         workflow_tokens = workflow.total_tokens
+        key = (
+            workflow.session_count,
+            _token_counts(workflow_tokens),
+            _token_counts(recent_file.tokens) if recent_file else None,
+        )
+        panel = self._get_cached_panel("workflow_token", key)
+        if panel is not None:
+            return panel
 
         # Create compact horizontal layout showing workflow totals
-        if recent_file:
-            token_text = (
-                f"[dashboard.header]Recent Interaction[/dashboard.header]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{recent_file.tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{recent_file.tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{recent_file.tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{recent_file.tokens.cache_read:,}[/metric.value]\n\n"
-                f"[dashboard.header]Workflow Totals[/dashboard.header] [metric.label]({workflow.session_count} sessions)[/metric.label]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{workflow_tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{workflow_tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{workflow_tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{workflow_tokens.cache_read:,}[/metric.value]\n"
-                f"[metric.label]Total:[/metric.label] [metric.tokens]{workflow_tokens.total:,}[/metric.tokens]"
-            )
-        else:
-            token_text = (
-                f"[dashboard.header]Workflow Totals[/dashboard.header] [metric.label]({workflow.session_count} sessions)[/metric.label]\n"
-                f"[metric.label]Input:[/metric.label] [metric.value]{workflow_tokens.input:,}[/metric.value]    "
-                f"[metric.label]Cache W:[/metric.label] [metric.value]{workflow_tokens.cache_write:,}[/metric.value]\n"
-                f"[metric.label]Output:[/metric.label] [metric.value]{workflow_tokens.output:,}[/metric.value]   "
-                f"[metric.label]Cache R:[/metric.label] [metric.value]{workflow_tokens.cache_read:,}[/metric.value]\n"
-                f"[metric.label]Total:[/metric.label] [metric.tokens]{workflow_tokens.total:,}[/metric.tokens]"
-            )
+        heading = (
+            "[dashboard.header]Workflow Totals[/dashboard.header] "
+            f"[metric.label]({workflow.session_count} sessions)[/metric.label]"
+        )
+        token_text = self._format_token_text(heading, workflow_tokens, recent_file)
 
-        return Panel(
+        return self._store_panel("workflow_token", key, Panel(
             token_text,
             title=Text("Tokens", style="dashboard.title"),
             title_align="left",
             border_style="dashboard.border",
-        )
+        ))
 
     def create_workflow_cost_panel(
         self,
@@ -903,7 +1120,7 @@ class DashboardUI:
         total_cost = workflow.calculate_total_cost(pricing_data)
 
         if quota:
-            percentage = min(100, float(total_cost / quota) * 100)
+            percentage = self._pct(total_cost, quota)
             progress_bar = self.create_compact_progress_bar(percentage)
             cost_color = self.get_cost_color(percentage)
 
@@ -935,21 +1152,11 @@ class DashboardUI:
         per_model_context: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Panel:
         """Create model usage panel for workflow."""
-        from collections import defaultdict
-
         per_model_output_rates = per_model_output_rates or {}
         per_model_context = per_model_context or {}
 
         # Aggregate model stats across all sessions
-        model_data: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {"tokens": 0, "cost": Decimal("0.0")}
-        )
-
-        for session in workflow.all_sessions:
-            model_breakdown = session.get_model_breakdown(pricing_data)
-            for model, stats in model_breakdown.items():
-                model_data[model]["tokens"] += stats["tokens"].total
-                model_data[model]["cost"] += stats["cost"]
+        model_data = workflow.aggregated_model_breakdown(pricing_data)
 
         if not model_data:
             return Panel(
@@ -958,38 +1165,28 @@ class DashboardUI:
                 border_style="dashboard.border",
             )
 
-        model_lines = []
-        for model, stats in sorted(
-            model_data.items(), key=lambda x: x[1]["cost"], reverse=True
-        ):
-            model_name = model[:35] + "..." if len(model) > 38 else model
-            
-            # Get context usage for this model
-            context_info = per_model_context.get(model, {})
-            context_pct = context_info.get("usage_percentage", 0.0)
-            context_bar = self.create_compact_progress_bar(context_pct, 8)
-            
-            # Get output rate for this model
-            output_rate = per_model_output_rates.get(model, 0.0)
-            rate_str = f" - {output_rate:.1f} tok/s" if output_rate > 0 else ""
-            
-            model_lines.append(
-                f"[metric.label]{model_name}[/metric.label]  -  "
-                f"[metric.value]{stats['tokens']:,}[/metric.value] [metric.tokens]tok[/metric.tokens]  "
-                f"[metric.cost]{self._fmt_cost(stats['cost'])}[/metric.cost]  -  "
-                f"context {context_bar}{rate_str}"
+        rows = [
+            (
+                model,
+                stats["tokens"],
+                stats["cost"],
+                per_model_output_rates.get(model, 0.0),
+                per_model_context.get(model, {}).get("usage_percentage", 0.0),
+            )
+            for model, stats in sorted(
+                model_data.items(), key=lambda x: x[1]["cost"], reverse=True
             )
+        ]
+        key = tuple(rows)
+        panel = self._get_cached_panel("workflow_model", key)
+        if panel is not None:
+            return panel
 
-        model_text = "\n".join(model_lines)
+        return self._store_panel("workflow_model", key, self._build_model_panel(rows))
 
-        return Panel(
-            model_text,
-            title=Text("Models", style="dashboard.title"),
-            title_align="left",
-            border_style="dashboard.border",
-        )
-
-    def create_workflow_time_panel(self, workflow: SessionWorkflow) -> Panel:
+    def create_workflow_time_panel(
+        self, workflow: SessionWorkflow, now: Optional[datetime] = None
+    ) -> Panel:
         """Create session time progress panel for workflow."""
         if not workflow.start_time:
             return Panel(
@@ -999,14 +1196,14 @@ class DashboardUI:
             )
 
         # Calculate duration from workflow start_time to now
-        current_time = datetime.now()
+        current_time = now or datetime.now()
         workflow_duration = current_time - workflow.start_time
         duration_ms = int(workflow_duration.total_seconds() * 1000)
 
         # Calculate percentage based on 5-hour maximum
         max_hours = 5.0
         duration_hours = workflow_duration.total_seconds() / 3600
-        percentage = min(100.0, (duration_hours / max_hours) * 100.0)
+        percentage = self._pct(duration_hours, max_hours)
 
         # Format duration display
         duration_display = TimeUtils.format_duration_hm(duration_ms)
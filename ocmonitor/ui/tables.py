@@ -1,5 +1,6 @@
 """Rich table formatting for OpenCode Monitor."""
 
+import statistics
 from typing import List, Dict, Any, Optional
 from decimal import Decimal
 from rich.console import Console
@@ -120,7 +121,6 @@ class TableFormatter:
                 rates = stats.get('interaction_rates', [])
                 all_interaction_rates.extend(rates)
                 if rates:
-                    import statistics
                     speed = statistics.median(rates)
                     speed_text = f"{speed:.1f} t/s"
                 else:
@@ -143,7 +143,6 @@ class TableFormatter:
         table.add_section()
         # Calculate p50 speed for totals
         if all_interaction_rates:
-            import statistics
             total_speed = statistics.median(all_interaction_rates)
             total_speed_text = f"{total_speed:.1f} t/s"
         else:
@@ -321,7 +320,7 @@ class TableFormatter:
         table.add_column("Cost %", justify="right", style="table.row.cost")
         table.add_column("Speed", justify="right", style="table.row.time")
 
-        total_cost = sum(model.total_cost for model in model_stats)
+        total_cost = sum((model.total_cost for model in model_stats), Decimal('0.0'))
 
         for model in model_stats:
             cost_percentage = self.format_percentage(float(model.total_cost), float(total_cost))
@@ -514,7 +513,7 @@ class TableFormatter:
             
             # Parent session
             session_cost = session.calculate_total_cost(pricing_data)
-            session_total_cost = session_cost + sum(sub_costs)
+            session_total_cost = sum(sub_costs, session_cost)
             title = session.display_title
             if len(title) > 40:
                 title = title[:37] + "..."
@@ -3,8 +3,9 @@
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Generator
+from typing import Dict, List, Optional, Any, Generator, Set, Tuple
 from datetime import datetime
 
 from ..models.session import SessionData, InteractionFile, TokenUsage, TimeData
@@ -85,6 +86,7 @@ class FileProcessor:
         return FileProcessor._normalize_model_name(model_id)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _normalize_model_name(model_id: str) -> str:
         """Normalize model name for flexible pricing lookup.
         
@@ -92,6 +94,9 @@ class FileProcessor:
         - Strips date suffixes (e.g., -20250514, -20251101)
         - Normalizes version separators (-X-Y to -X.Y)
         - Converts to lowercase
+
+        Results are cached since the same model IDs repeat across every
+        interaction file.
         
         Args:
             model_id: Raw model ID from OpenCode
@@ -221,7 +226,7 @@ class FileProcessor:
             tokens_data = data.get('tokens', {})
             cache_data = tokens_data.get('cache', {})
 
-            tokens = TokenUsage(
+            tokens = TokenUsage.from_counts(
                 input=tokens_data.get('input', 0),
                 output=tokens_data.get('output', 0),
                 cache_write=cache_data.get('write', 0),
@@ -232,7 +237,7 @@ class FileProcessor:
             time_data = None
             if 'time' in data:
                 time_info = data['time']
-                time_data = TimeData(
+                time_data = TimeData.from_timestamps(
                     created=time_info.get('created'),
                     completed=time_info.get('completed')
                 )
@@ -266,11 +271,15 @@ class FileProcessor:
             return None
 
     @staticmethod
-    def load_session_data(session_path: Path) -> Optional[SessionData]:
+    def load_session_data(
+        session_path: Path, file_cache: Optional["InteractionFileCache"] = None
+    ) -> Optional[SessionData]:
         """Load complete session data from a session directory.
 
         Args:
             session_path: Path to session directory
+            file_cache: Optional cache of previously parsed interaction files;
+                only files whose mtime or size changed are parsed again
 
         Returns:
             SessionData object or None if loading failed
@@ -279,14 +288,19 @@ class FileProcessor:
             return None
 
         session_id = session_path.name
-        json_files = FileProcessor.find_json_files(session_path)
-
-        if not json_files:
+        if file_cache is None:
+            interactions = [
+                FileProcessor.parse_interaction_file(json_file, session_id)
+                for json_file in FileProcessor.find_json_files(session_path)
+            ]
+        else:
+            interactions = file_cache.load_directory(session_path, session_id)
+
+        if not interactions:
             return None
 
         interaction_files = []
-        for json_file in json_files:
-            interaction = FileProcessor.parse_interaction_file(json_file, session_id)
+        for interaction in interactions:
             if interaction:
                 # Filter out interactions with zero token usage
                 if interaction.tokens.total > 0:
@@ -347,12 +361,18 @@ class FileProcessor:
         return FileProcessor.parse_interaction_file(json_files[0], session_id)
 
     @staticmethod
-    def load_all_sessions(base_path: str, limit: Optional[int] = None) -> List[SessionData]:
+    def load_all_sessions(
+        base_path: str,
+        limit: Optional[int] = None,
+        file_cache: Optional["InteractionFileCache"] = None,
+    ) -> List[SessionData]:
         """Load all sessions from the base path.
 
         Args:
             base_path: Path to search for sessions
             limit: Maximum number of sessions to load (None for all)
+            file_cache: Optional cache of previously parsed interaction files,
+                pruned to the files seen by this call
 
         Returns:
             List of SessionData objects
@@ -364,10 +384,13 @@ class FileProcessor:
 
         sessions = []
         for session_dir in session_dirs:
-            session_data = FileProcessor.load_session_data(session_dir)
+            session_data = FileProcessor.load_session_data(session_dir, file_cache)
             if session_data:
                 sessions.append(session_data)
 
+        if file_cache is not None:
+            file_cache.prune()
+
         return sessions
 
     @staticmethod
@@ -449,4 +472,68 @@ class FileProcessor:
                 except OSError:
                     pass
 
-        return stats
\ No newline at end of file
+        return stats
+
+
+class InteractionFileCache:
+    """Reuses parsed interaction files across repeated loads.
+
+    Entries are keyed by file path and remembered with the (mtime, size) they
+    were parsed at, so polling loaders only parse new or modified files.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], Optional[InteractionFile]]] = {}
+        self._seen: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_directory(self, directory: Path, session_id: str) -> List[Optional[InteractionFile]]:
+        """Load the JSON interaction files of a session directory.
+
+        Args:
+            directory: Session directory to scan
+            session_id: ID of the session the files belong to
+
+        Returns:
+            Parsed files (None where parsing failed), newest first
+        """
+        entries = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return []
+
+        # Match find_json_files ordering (most recent first)
+        entries.sort(key=lambda e: e[0], reverse=True)
+
+        interactions = []
+        for mtime_ns, size, path in entries:
+            self._seen.add(path)
+            signature = (mtime_ns, size)
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                interactions.append(cached[1])
+                continue
+            interaction = FileProcessor.parse_interaction_file(Path(path), session_id)
+            self._entries[path] = (signature, interaction)
+            interactions.append(interaction)
+
+        return interactions
+
+    def prune(self) -> None:
+        """Drop entries for files not loaded since the previous prune."""
+        for path in self._entries.keys() - self._seen:
+            del self._entries[path]
+        self._seen = set()
@@ -0,0 +1,43 @@
+"""JSON parsing helpers for OpenCode Monitor."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON document (UTF-8 bytes or str)
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        ValueError: If the document is not valid JSON. Both parsers raise a
+            subclass of json.JSONDecodeError; invalid UTF-8 raises
+            UnicodeDecodeError.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON-compatible data
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
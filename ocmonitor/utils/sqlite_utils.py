@@ -19,6 +19,17 @@ class SQLiteProcessor:
 
     DEFAULT_DB_PATH = Path.home() / ".local" / "share" / "opencode" / "opencode.db"
 
+    # Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999)
+    MAX_QUERY_PARAMS = 500
+
+    # Per-connection settings for long-lived connections that poll the database
+    POLLING_PRAGMAS = (
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-16000",
+        "PRAGMA busy_timeout=5000",
+    )
+
     @staticmethod
     def find_database_path(custom_path: Optional[Path] = None) -> Optional[Path]:
         """Find the OpenCode SQLite database.
@@ -76,6 +87,25 @@ class SQLiteProcessor:
         conn.row_factory = sqlite3.Row
         return conn
 
+    @classmethod
+    def open_polling_connection(cls, db_path: Path) -> sqlite3.Connection:
+        """Open a connection meant to be reused across repeated refreshes.
+
+        The caller owns the connection and must close it. Only per-connection
+        PRAGMAs are applied; the database's journal mode belongs to OpenCode
+        and is left untouched.
+
+        Args:
+            db_path: Path to the database file
+
+        Returns:
+            Connection tuned with POLLING_PRAGMAS
+        """
+        conn = cls._get_connection(db_path)
+        for pragma in cls.POLLING_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     @staticmethod
     def _extract_model_name(model_data: Any) -> str:
         """Extract model name from various possible locations in message data."""
@@ -94,7 +124,7 @@ class SQLiteProcessor:
         tokens_data = message_json.get("tokens", {})
         cache_data = tokens_data.get("cache", {})
 
-        return TokenUsage(
+        return TokenUsage.from_counts(
             input=max(0, tokens_data.get('input', 0)),
             output=max(0, tokens_data.get('output', 0)),
             cache_write=max(0, cache_data.get('write', 0)),
@@ -106,7 +136,7 @@ class SQLiteProcessor:
         """Extract timing information from message JSON data."""
         time_data = message_json.get("time", {})
         if time_data:
-            return TimeData(
+            return TimeData.from_timestamps(
                 created=time_data.get("created"), completed=time_data.get("completed")
             )
         return None
@@ -196,6 +226,39 @@ class SQLiteProcessor:
 
         return interactions
 
+    @classmethod
+    def load_messages_for_sessions(
+        cls, conn: sqlite3.Connection, session_ids: List[str]
+    ) -> Dict[str, List[InteractionFile]]:
+        """Load messages for several sessions with one query per batch of IDs.
+
+        Args:
+            conn: Database connection
+            session_ids: Session IDs to load messages for
+
+        Returns:
+            Dictionary mapping session ID to its InteractionFiles in creation order
+        """
+        interactions_by_session: Dict[str, List[InteractionFile]] = {
+            session_id: [] for session_id in session_ids
+        }
+        ids = list(interactions_by_session)
+        for start in range(0, len(ids), cls.MAX_QUERY_PARAMS):
+            batch = ids[start : start + cls.MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT session_id, data FROM message WHERE session_id IN ({placeholders}) "
+                "ORDER BY time_created",
+                batch,
+            )
+            for row in cursor:
+                session_id = row["session_id"]
+                interaction = cls.parse_message_data(row["data"], session_id)
+                if interaction:
+                    interactions_by_session[session_id].append(interaction)
+
+        return interactions_by_session
+
     @classmethod
     def load_session_data(
         cls, conn: sqlite3.Connection, session_row: sqlite3.Row
@@ -209,10 +272,23 @@ class SQLiteProcessor:
         Returns:
             SessionData object or None if loading failed
         """
-        session_id = session_row["id"]
+        interaction_files = cls.load_session_messages(conn, session_row["id"])
+        return cls._build_session_data(session_row, interaction_files)
+
+    @classmethod
+    def _build_session_data(
+        cls, session_row: sqlite3.Row, interaction_files: List[InteractionFile]
+    ) -> Optional[SessionData]:
+        """Build SessionData from a session row and its loaded messages.
+
+        Args:
+            session_row: Row from session table
+            interaction_files: Parsed messages for the session
 
-        # Load all messages/interactions for this session
-        interaction_files = cls.load_session_messages(conn, session_id)
+        Returns:
+            SessionData object or None if the session has no token usage
+        """
+        session_id = session_row["id"]
 
         # Filter out zero-token interactions (consistent with FileProcessor)
         interaction_files = [f for f in interaction_files if f.tokens.total > 0]
@@ -374,7 +450,9 @@ class SQLiteProcessor:
 
     @classmethod
     def get_most_recent_workflow(
-        cls, db_path: Optional[Path] = None
+        cls,
+        db_path: Optional[Path] = None,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get the most recent workflow (parent session + sub-agents).
 
@@ -383,6 +461,8 @@ class SQLiteProcessor:
 
         Args:
             db_path: Path to database (uses default if not provided)
+            conn: Open connection to reuse; it is left open. When given,
+                db_path is ignored.
 
         Returns:
             Dictionary with workflow data compatible with SessionWorkflow:
@@ -398,13 +478,15 @@ class SQLiteProcessor:
 
         Returns None if no sessions with data found.
         """
-        if db_path is None:
-            db_path = cls.find_database_path()
+        owns_conn = conn is None
+        if owns_conn:
+            if db_path is None:
+                db_path = cls.find_database_path()
 
-        if not db_path or not db_path.exists():
-            return None
+            if not db_path or not db_path.exists():
+                return None
 
-        conn = cls._get_connection(db_path)
+            conn = cls._get_connection(db_path)
         try:
             # Get recent parent sessions (no parent_id) and check which have messages
             # We check up to 10 recent parents to find one with actual data
@@ -433,29 +515,76 @@ class SQLiteProcessor:
 
             return cls._build_workflow_dict(conn, main_session)
         finally:
-            conn.close()
+            if owns_conn:
+                conn.close()
 
     @classmethod
     def _build_workflow_dict(
         cls, conn: sqlite3.Connection, main_session: SessionData
     ) -> Dict[str, Any]:
-        sub_agent_rows = conn.execute(
-            """
-            SELECT s.*, p.worktree as project_path, p.name as project_name
-            FROM session s
-            LEFT JOIN project p ON s.project_id = p.id
-            WHERE s.parent_id = ?
-            ORDER BY s.time_created ASC
-        """,
-            (main_session.session_id,),
-        ).fetchall()
-
-        sub_agents = []
-        for row in sub_agent_rows:
-            sub_session = cls.load_session_data(conn, row)
-            if sub_session:
-                sub_agents.append(sub_session)
+        return cls._build_workflow_dicts(conn, [main_session])[0]
+
+    @classmethod
+    def _build_workflow_dicts(
+        cls, conn: sqlite3.Connection, main_sessions: List[SessionData]
+    ) -> List[Dict[str, Any]]:
+        """Build workflow dicts for several main sessions.
+
+        Sub-agent rows and their messages are fetched in bulk rather than
+        with one query per parent and per sub-agent.
+
+        Args:
+            conn: Database connection
+            main_sessions: Loaded parent sessions
+
+        Returns:
+            List of workflow dictionaries in the order of main_sessions
+        """
+        sub_agent_rows_by_parent: Dict[str, List[sqlite3.Row]] = {
+            session.session_id: [] for session in main_sessions
+        }
+        parent_ids = list(sub_agent_rows_by_parent)
+        for start in range(0, len(parent_ids), cls.MAX_QUERY_PARAMS):
+            batch = parent_ids[start : start + cls.MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"""
+                SELECT s.*, p.worktree as project_path, p.name as project_name
+                FROM session s
+                LEFT JOIN project p ON s.project_id = p.id
+                WHERE s.parent_id IN ({placeholders})
+                ORDER BY s.time_created ASC
+            """,
+                batch,
+            ).fetchall()
+            for row in rows:
+                sub_agent_rows_by_parent[row["parent_id"]].append(row)
+
+        messages = cls.load_messages_for_sessions(
+            conn,
+            [
+                row["id"]
+                for rows in sub_agent_rows_by_parent.values()
+                for row in rows
+            ],
+        )
+
+        workflows = []
+        for main_session in main_sessions:
+            sub_agents = []
+            for row in sub_agent_rows_by_parent[main_session.session_id]:
+                sub_session = cls._build_session_data(row, messages[row["id"]])
+                if sub_session:
+                    sub_agents.append(sub_session)
+            workflows.append(cls._workflow_dict(main_session, sub_agents))
+
+        return workflows
 
+    @staticmethod
+    def _workflow_dict(
+        main_session: SessionData, sub_agents: List[SessionData]
+    ) -> Dict[str, Any]:
+        """Assemble the workflow dictionary for a main session and its sub-agents."""
         all_sessions = [main_session] + sub_agents
 
         return {
@@ -521,10 +650,13 @@ class SQLiteProcessor:
             params = [threshold_ms]
 
         sub_agent_rows = conn.execute(query, params).fetchall()
+        messages = cls.load_messages_for_sessions(
+            conn, [row["id"] for row in sub_agent_rows]
+        )
 
         sub_agents_by_parent: Dict[str, List[SessionData]] = {}
         for row in sub_agent_rows:
-            sub_session = cls.load_session_data(conn, row)
+            sub_session = cls._build_session_data(row, messages[row["id"]])
             if sub_session and sub_session.parent_id:
                 parent_id: str = sub_session.parent_id
                 if parent_id not in sub_agents_by_parent:
@@ -560,7 +692,10 @@ class SQLiteProcessor:
 
     @classmethod
     def get_all_active_workflows(
-        cls, db_path: Optional[Path] = None, active_threshold_minutes: int = 30
+        cls,
+        db_path: Optional[Path] = None,
+        active_threshold_minutes: int = 30,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
         """Get all active workflows (parent sessions that are still ongoing).
 
@@ -574,18 +709,22 @@ class SQLiteProcessor:
         Args:
             db_path: Path to database (uses default if not provided)
             active_threshold_minutes: Consider session active if activity within this window
+            conn: Open connection to reuse; it is left open. When given,
+                db_path is ignored.
 
         Returns:
             List of workflow dictionaries, sorted by most recent activity first.
             Each dict has the same structure as get_most_recent_workflow().
         """
-        if db_path is None:
-            db_path = cls.find_database_path()
+        owns_conn = conn is None
+        if owns_conn:
+            if db_path is None:
+                db_path = cls.find_database_path()
 
-        if not db_path or not db_path.exists():
-            return []
+            if not db_path or not db_path.exists():
+                return []
 
-        conn = cls._get_connection(db_path)
+            conn = cls._get_connection(db_path)
         try:
             threshold_ms = int(time.time() * 1000) - (
                 active_threshold_minutes * 60 * 1000
@@ -607,23 +746,36 @@ class SQLiteProcessor:
                 (threshold_ms,),
             ).fetchall()
 
-            active_workflows = []
+            max_workflows = 10
+            parent_messages = cls.load_messages_for_sessions(
+                conn, [row["id"] for row in parent_rows]
+            )
+            main_sessions = []
             loaded_parent_ids = set()
 
             for parent_row in parent_rows:
-                session = cls.load_session_data(conn, parent_row)
+                session = cls._build_session_data(
+                    parent_row, parent_messages[parent_row["id"]]
+                )
                 if session and session.files:
                     loaded_parent_ids.add(session.session_id)
-                    active_workflows.append(cls._build_workflow_dict(conn, session))
+                    main_sessions.append(session)
 
-            orphan_workflows = cls._find_orphan_subagent_workflows(
-                conn, threshold_ms, loaded_parent_ids
+            # Workflows past the limit are dropped, so skip loading their sub-agents
+            active_workflows = cls._build_workflow_dicts(
+                conn, main_sessions[:max_workflows]
             )
-            active_workflows.extend(orphan_workflows)
 
-            return active_workflows[:10]
+            if len(active_workflows) < max_workflows:
+                orphan_workflows = cls._find_orphan_subagent_workflows(
+                    conn, threshold_ms, loaded_parent_ids
+                )
+                active_workflows.extend(orphan_workflows)
+
+            return active_workflows[:max_workflows]
         finally:
-            conn.close()
+            if owns_conn:
+                conn.close()
 
     @classmethod
     def get_database_stats(cls, db_path: Optional[Path] = None) -> Dict[str, Any]:
@@ -740,7 +892,7 @@ class SQLiteProcessor:
             stats = []
             for tool_name, counts in tool_data.items():
                 total = counts['success'] + counts['failure']
-                stats.append(ToolUsageStats(
+                stats.append(ToolUsageStats.from_counts(
                     tool_name=tool_name,
                     total_calls=total,
                     success_count=counts['success'],
@@ -830,7 +982,7 @@ class SQLiteProcessor:
                 tool_stats = []
                 for tool_name, counts in tools.items():
                     total = counts['success'] + counts['failure']
-                    tool_stats.append(ToolUsageStats(
+                    tool_stats.append(ToolUsageStats.from_counts(
                         tool_name=tool_name,
                         total_calls=total,
                         success_count=counts['success'],
@@ -961,7 +1113,7 @@ class SQLiteProcessor:
                 except (OSError, ValueError):
                     pass
 
-            tokens = TokenUsage(
+            tokens = TokenUsage.from_counts(
                 input=max(0, row["input_tokens"] or 0),
                 output=max(0, row["output_tokens"] or 0),
                 cache_read=max(0, row["cache_read"] or 0),
@@ -1054,7 +1206,7 @@ class SQLiteProcessor:
 
             tool_stats = []
             for tool_row in tool_cursor:
-                tool_stats.append(ToolUsageStats(
+                tool_stats.append(ToolUsageStats.from_counts(
                     tool_name=tool_row["tool_name"],
                     total_calls=tool_row["total_calls"],
                     success_count=tool_row["success"],
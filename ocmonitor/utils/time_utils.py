@@ -2,7 +2,7 @@
 
 import statistics
 from datetime import datetime, date, timedelta
-from typing import List, Optional, TYPE_CHECKING, Tuple
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     from ..models.session import InteractionFile
@@ -360,4 +360,63 @@ def compute_p50_output_rate(files: List["InteractionFile"]) -> float:
             rates.append(f.tokens.output / duration_s)
     if not rates:
         return 0.0
-    return statistics.median(rates)
\ No newline at end of file
+    return statistics.median(rates)
+
+
+def compute_p50_output_rates_by_model(files: Iterable["InteractionFile"]) -> Dict[str, float]:
+    """Compute median (p50) output rate per model in a single pass.
+
+    Zero-token files are skipped. Each remaining file's rate is computed as it
+    is grouped, so only per-model rate lists are kept rather than file lists
+    that would be walked again. Models without eligible interactions map to 0.0.
+
+    Args:
+        files: InteractionFile objects to consider
+
+    Returns:
+        Dict mapping model_id to median output tokens per second
+    """
+    return compute_p50_output_rates_and_recent_by_model(files)[0]
+
+
+def compute_p50_output_rates_and_recent_by_model(
+    files: Iterable["InteractionFile"],
+) -> Tuple[Dict[str, float], Dict[str, "InteractionFile"]]:
+    """Compute per-model p50 output rates and most recent files in one pass.
+
+    Applies the same rules as compute_p50_output_rates_by_model. Recency is
+    judged by creation time, and the earliest file wins ties.
+
+    Args:
+        files: InteractionFile objects to consider
+
+    Returns:
+        Tuple of (median output tokens per second per model, most recently
+        created file per model), both in first-use order
+    """
+    rates_by_model: Dict[str, List[float]] = {}
+    most_recent: Dict[str, "InteractionFile"] = {}
+    recent_created: Dict[str, int] = {}
+    for f in files:
+        tokens = f.tokens
+        if tokens.total <= 0:
+            continue
+        model_id = f.model_id
+        time_data = f.time_data
+        created = time_data.created if time_data and time_data.created else 0
+        rates = rates_by_model.get(model_id)
+        if rates is None:
+            rates = rates_by_model[model_id] = []
+            most_recent[model_id] = f
+            recent_created[model_id] = created
+        elif created > recent_created[model_id]:
+            most_recent[model_id] = f
+            recent_created[model_id] = created
+        if f.is_rate_eligible:
+            rates.append(tokens.output / (time_data.duration_ms / 1000))
+
+    rates = {
+        model_id: statistics.median(model_rates) if model_rates else 0.0
+        for model_id, model_rates in rates_by_model.items()
+    }
+    return rates, most_recent
@@ -32,7 +32,7 @@ setup(
         "click>=8.0.0",
         "rich>=13.0.0",
         "pydantic>=2.0.0",
-        "toml>=0.10.0",
+        "tomli>=1.1.0; python_version < '3.11'",
         "prometheus_client>=0.17.0",
     ],
     extras_require={
@@ -133,3 +133,20 @@ def mock_session_directory(temp_directory):
     }))
     
     return sessions_dir
+
+
+@pytest.fixture
+def make_timed_session(tmp_path):
+    """Return a factory for single-interaction sessions with given times and tokens."""
+    from ocmonitor.models.session import InteractionFile, SessionData, TimeData, TokenUsage
+
+    def _make(session_id, created, completed, **tokens):
+        interaction = InteractionFile(
+            file_path=tmp_path / f"{session_id}.json",
+            session_id=session_id,
+            tokens=TokenUsage(**tokens),
+            time_data=TimeData(created=created, completed=completed),
+        )
+        return SessionData(session_id=session_id, files=[interaction])
+
+    return _make
@@ -0,0 +1,168 @@
+"""Tests for agent registry."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ocmonitor.services.agent_registry import AgentRegistry
+
+
+def write_agent(agents_dir, name, mode=None):
+    """Write an agent markdown file with optional mode frontmatter."""
+    path = agents_dir / f"{name}.md"
+    if mode is None:
+        path.write_text("# No frontmatter\n")
+    else:
+        path.write_text(f"---\ndescription: Test agent\nmode: {mode}\n---\nPrompt body\n")
+    return path
+
+
+class TestAgentRegistry:
+    """Tests for AgentRegistry agent discovery."""
+
+    @pytest.fixture
+    def agents_dir(self, tmp_path):
+        path = tmp_path / "agent"
+        path.mkdir()
+        return path
+
+    def test_builtin_agents_without_config_dir(self, tmp_path):
+        """Test that built-in agents are used when no config directory exists."""
+        registry = AgentRegistry(agents_dir=tmp_path / "missing")
+
+        assert registry.is_sub_agent("explore")
+        assert registry.is_main_agent("build")
+        assert not registry.is_sub_agent(None)
+        assert registry.is_main_agent(None)
+
+    def test_modes_from_frontmatter(self, agents_dir):
+        """Test that agents are classified by their frontmatter mode."""
+        write_agent(agents_dir, "Reviewer", "subagent")
+        write_agent(agents_dir, "lead", "primary")
+        write_agent(agents_dir, "plain")
+
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        assert registry.is_sub_agent("reviewer")
+        assert registry.is_sub_agent("REVIEWER")
+        assert not registry.is_main_agent("reviewer")
+        assert "lead" in registry.get_all_main_agents()
+        assert registry.is_main_agent("plain")
+        assert not registry.is_sub_agent("plain")
+
+    def test_unchanged_files_are_not_reparsed_on_reload(self, agents_dir):
+        """Test that reload only re-parses agent files whose mtime changed."""
+        write_agent(agents_dir, "reviewer", "subagent")
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        with patch("ocmonitor.services.agent_registry._read_frontmatter") as mock_read:
+            registry.reload()
+            mock_read.assert_not_called()
+        assert registry.is_sub_agent("reviewer")
+
+        path = write_agent(agents_dir, "reviewer", "primary")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        registry.reload()
+
+        assert not registry.is_sub_agent("reviewer")
+        assert "reviewer" in registry.get_all_main_agents()
+
+    def test_mode_read_without_yaml(self, agents_dir):
+        """Test that plain and quoted modes are read without a YAML parse."""
+        (agents_dir / "quoted.md").write_text("---\nmode: 'subagent'  # helper\n---\n")
+        write_agent(agents_dir, "plain", "subagent")
+
+        with patch("yaml.safe_load") as mock_load:
+            registry = AgentRegistry(agents_dir=agents_dir)
+            mock_load.assert_not_called()
+
+        assert registry.is_sub_agent("quoted")
+        assert registry.is_sub_agent("plain")
+
+    def test_frontmatter_longer_than_initial_read(self, agents_dir):
+        """Test that frontmatter extending past the first read is still parsed."""
+        long_description = "x" * 4096
+        (agents_dir / "verbose.md").write_text(
+            f"---\ndescription: {long_description}\nmode: subagent\n---\nBody\n"
+        )
+
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        assert registry.is_sub_agent("verbose")
+
+    def test_non_markdown_entries_are_ignored(self, agents_dir):
+        """Test that directories and non-.md files are skipped."""
+        (agents_dir / "notes.txt").write_text("---\nmode: subagent\n---\n")
+        (agents_dir / "folder.md").mkdir()
+
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        assert registry.get_all_sub_agents() == AgentRegistry.BUILTIN_SUB_AGENTS
+
+    def test_unusual_mode_syntax_falls_back_to_yaml(self, agents_dir):
+        """Test that frontmatter the regex cannot read is parsed as YAML."""
+        (agents_dir / "flow.md").write_text("---\n{description: x, mode: subagent}\n---\n")
+        (agents_dir / "nested.md").write_text("---\noptions:\n  mode: subagent\n---\n")
+
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        assert registry.is_sub_agent("flow")
+        assert not registry.is_sub_agent("nested")
+
+    def test_classify_matches_is_sub_agent(self, agents_dir):
+        """Test that classify agrees with is_sub_agent for all name kinds."""
+        from ocmonitor.services.agent_registry import AgentKind
+
+        write_agent(agents_dir, "reviewer", "subagent")
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        assert registry.classify("Reviewer") is AgentKind.SUB
+        assert registry.classify("explore") is AgentKind.SUB
+        assert registry.classify("build") is AgentKind.MAIN
+        assert registry.classify("unknown-agent") is AgentKind.MAIN
+        assert registry.classify(None) is AgentKind.MAIN
+        for name in ("Reviewer", "explore", "build", "unknown-agent", None):
+            assert registry.is_sub_agent(name) == (registry.classify(name) is AgentKind.SUB)
+
+    def test_classify_cache_cleared_on_reload(self, agents_dir):
+        """Test that memoized classifications are dropped when agents change."""
+        from ocmonitor.services.agent_registry import AgentKind
+
+        registry = AgentRegistry(agents_dir=agents_dir)
+        assert registry.classify("reviewer") is AgentKind.MAIN
+
+        write_agent(agents_dir, "reviewer", "subagent")
+        assert registry.classify("reviewer") is AgentKind.MAIN
+
+        registry.reload()
+        assert registry.classify("reviewer") is AgentKind.SUB
+
+    def test_maybe_reload_only_when_directory_changes(self, agents_dir):
+        """Test that maybe_reload skips the scan until the directory changes."""
+        registry = AgentRegistry(agents_dir=agents_dir)
+
+        with patch.object(registry, "_load_agents") as mock_load:
+            assert registry.maybe_reload() is False
+            mock_load.assert_not_called()
+
+        write_agent(agents_dir, "reviewer", "subagent")
+        stat = agents_dir.stat()
+        os.utime(agents_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert registry.maybe_reload() is True
+        assert registry.is_sub_agent("reviewer")
+        assert registry.maybe_reload() is False
+
+    def test_maybe_reload_when_directory_appears(self, tmp_path):
+        """Test that a directory created after startup is picked up."""
+        agents_dir = tmp_path / "agent"
+        registry = AgentRegistry(agents_dir=agents_dir)
+        assert registry.maybe_reload() is False
+
+        agents_dir.mkdir()
+        write_agent(agents_dir, "reviewer", "subagent")
+
+        assert registry.maybe_reload() is True
+        assert registry.is_sub_agent("reviewer")
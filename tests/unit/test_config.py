@@ -17,6 +17,7 @@ from ocmonitor.config import (
     Config,
     ModelPricing,
     ConfigManager,
+    PricingTable,
     opencode_storage_path,
 )
 import ocmonitor.config as config_module
@@ -193,6 +194,69 @@ class TestModelPricing:
         assert pricing.context_window == 200000
         assert pricing.session_quota == Decimal("6.0")
 
+    def test_per_token_rates(self):
+        """Test that per-token rates are exact for validated and constructed pricing."""
+        pricing_data = {
+            "input": 3.0, "output": 15.0, "cacheWrite": 3.75,
+            "cacheRead": 0.3, "contextWindow": 200000, "sessionQuota": 6.0
+        }
+        expected = (Decimal("0.000003"), Decimal("0.000015"), Decimal("0.00000375"), Decimal("0.0000003"))
+
+        assert ModelPricing(**pricing_data).per_token_rates == expected
+        assert config_module._construct_model_pricing(pricing_data).per_token_rates == expected
+
+    def test_int_token_rates(self):
+        """Test that integer rates are exact and absent when precision would be lost."""
+        pricing_data = {
+            "input": 3.0, "output": 15.0, "cacheWrite": 3.75,
+            "cacheRead": 0.3, "contextWindow": 200000, "sessionQuota": 6.0
+        }
+        pricing = ModelPricing(**pricing_data)
+
+        assert pricing.int_token_rates == (3_000_000, 15_000_000, 3_750_000, 300_000)
+        assert config_module._construct_model_pricing(pricing_data).int_token_rates == pricing.int_token_rates
+
+        fine_grained = dict(pricing_data, cacheWrite=1e-7)
+        assert ModelPricing(**fine_grained).int_token_rates is None
+
+    def test_construct_model_pricing_matches_validation(self):
+        """Test that the fast construction path matches full validation."""
+        pricing_data = {
+            "input": 0.1,
+            "output": 15,
+            "cacheWrite": 1e-7,
+            "cacheRead": 0.0,
+            "contextWindow": 200000,
+            "sessionQuota": 6.0
+        }
+
+        assert config_module._construct_model_pricing(pricing_data) == ModelPricing(**pricing_data)
+
+    def test_construct_model_pricing_defers_malformed_entries(self):
+        """Test that entries needing coercion are left for full validation."""
+        assert config_module._construct_model_pricing({
+            "input": "3.0", "output": 15.0, "cacheWrite": 3.75,
+            "cacheRead": 0.3, "contextWindow": 200000, "sessionQuota": 6.0
+        }) is None
+        assert config_module._construct_model_pricing({"input": 1.0, "output": 2.0}) is None
+
+    def test_validate_pricing_entries_skips_only_invalid(self):
+        """Test that one invalid entry does not drop the valid ones."""
+        entries = {
+            "string-prices": {
+                "input": "3.0", "output": "15.0", "cacheWrite": "3.75",
+                "cacheRead": "0.3", "contextWindow": "200000", "sessionQuota": "6.0"
+            },
+            "invalid-model": {"input": "not-a-number", "output": 2.0},
+        }
+
+        with pytest.warns(UserWarning, match="invalid-model"):
+            pricing = config_module._validate_pricing_entries(entries)
+
+        assert list(pricing) == ["string-prices"]
+        assert pricing["string-prices"].input == Decimal("3.0")
+        assert pricing["string-prices"].context_window == 200000
+
 
 class TestConfigManager:
     """Tests for ConfigManager class."""
@@ -280,6 +344,10 @@ config_file = "{models_file}"
         
         assert "test-model" in pricing
         assert pricing["test-model"].input == Decimal("1.0")
+        assert isinstance(pricing, PricingTable)
+
+        manager.reload()
+        assert manager.load_pricing_data() is not pricing
     
     def test_load_pricing_data_missing_file(self, temp_directory):
         """Test loading pricing data when file doesn't exist."""
@@ -431,9 +499,32 @@ class TestMergeModelPrices:
         # Remote cacheRead is preserved (not in local or user)
         assert result["model-x"]["cacheRead"] == 0.1
 
+    def test_merge_does_not_mutate_sources(self):
+        """Test that merging leaves the (possibly cached) source dicts untouched."""
+        from ocmonitor.config import merge_model_prices
+
+        remote = {"model-a": {"input": 1.0, "output": 10.0}, "model-r": {"input": 0.5}}
+        local = {"model-a": {"input": 2.0}, "model-b": {"input": 5.0}}
+        user = {"model-a": {"output": 20.0}}
+
+        result = merge_model_prices(local, user, remote)
+
+        assert list(result) == ["model-a", "model-r", "model-b"]
+        assert result["model-a"] == {"input": 2.0, "output": 20.0}
+        assert remote["model-a"] == {"input": 1.0, "output": 10.0}
+        assert local["model-a"] == {"input": 2.0}
+        assert user["model-a"] == {"output": 20.0}
+
 
 class TestLoadPricingDataWithRemote:
     """Tests for ConfigManager.load_pricing_data with remote fallback."""
+
+    @pytest.fixture(autouse=True)
+    def clear_remote_pricing_cache(self):
+        """Keep memoized remote pricing from leaking between tests."""
+        config_module._REMOTE_PRICING_CACHE.clear()
+        yield
+        config_module._REMOTE_PRICING_CACHE.clear()
     
     def test_user_file_missing_is_non_fatal(self, tmp_path):
         """Test that missing user file doesn't cause errors."""
@@ -490,6 +581,75 @@ remote_fallback = true
             pricing = manager.load_pricing_data(no_remote=False)
             mock_get.assert_called_once()
     
+    def test_remote_pricing_is_reused_across_managers(self, tmp_path):
+        """Test that the mapped remote payload is fetched once per process."""
+        models_file = tmp_path / "models.json"
+        models_file.write_text(json.dumps({}))
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(f"""
+[models]
+config_file = "{models_file}"
+remote_fallback = true
+remote_cache_path = "{tmp_path / 'models_dev_api.json'}"
+""")
+
+        payload = {"providers": {}}
+        with patch('ocmonitor.services.price_fetcher.get_remote_payload') as mock_get, \
+                patch('ocmonitor.services.price_fetcher.map_models_dev_to_local') as mock_map:
+            mock_get.return_value = payload
+            mock_map.return_value = {
+                "remote-model": {
+                    "input": 1.0, "output": 2.0, "cacheWrite": 1.5,
+                    "cacheRead": 0.1, "contextWindow": 1000, "sessionQuota": 5.0
+                }
+            }
+
+            first = ConfigManager(config_path=str(config_file)).load_pricing_data()
+            second_manager = ConfigManager(config_path=str(config_file))
+            second = second_manager.load_pricing_data()
+
+            mock_get.assert_called_once()
+            mock_map.assert_called_once_with(payload)
+
+            # An explicit reload drops the memo and maps the payload again
+            second_manager.reload()
+            second_manager.load_pricing_data()
+
+            assert mock_get.call_count == 2
+            assert mock_map.call_count == 2
+
+        assert "remote-model" in first
+        assert "remote-model" in second
+
+    def test_memoized_remote_pricing_skips_worker_thread(self, tmp_path):
+        """Test that no fetch worker is started while the remote memo is fresh."""
+        models_file = tmp_path / "models.json"
+        models_file.write_text(json.dumps({}))
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(f"""
+[models]
+config_file = "{models_file}"
+remote_fallback = true
+remote_cache_path = "{tmp_path / 'models_dev_api.json'}"
+""")
+        remote_raw = {
+            "remote-model": {
+                "input": 1.0, "output": 2.0, "cacheWrite": 1.5,
+                "cacheRead": 0.1, "contextWindow": 1000, "sessionQuota": 5.0
+            }
+        }
+        with patch('ocmonitor.services.price_fetcher.get_remote_payload', return_value={}), \
+                patch('ocmonitor.services.price_fetcher.map_models_dev_to_local', return_value=remote_raw):
+            ConfigManager(config_path=str(config_file)).load_pricing_data()
+
+        with patch('concurrent.futures.ThreadPoolExecutor') as mock_executor:
+            pricing = ConfigManager(config_path=str(config_file)).load_pricing_data()
+
+        mock_executor.assert_not_called()
+        assert "remote-model" in pricing
+
     def test_invalid_remote_entries_are_skipped_not_fatal(self, tmp_path):
         """Test that invalid pricing entries are skipped with warning."""
         models_file = tmp_path / "models.json"
@@ -522,6 +682,44 @@ remote_fallback = false
         assert "invalid-model" not in pricing
 
 
+class TestRawPricingFileCache:
+    """Tests for caching of parsed pricing files."""
+
+    def _write_models(self, path, input_price):
+        path.write_text(json.dumps({
+            "test-model": {
+                "input": input_price, "output": 2.0, "cacheWrite": 1.5,
+                "cacheRead": 0.1, "contextWindow": 1000, "sessionQuota": 5.0
+            }
+        }))
+        return path
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test that an unchanged pricing file is not re-parsed across managers."""
+        models_file = self._write_models(tmp_path / "models.json", 1.0)
+        config_path = str(tmp_path / "config.toml")
+
+        first = ConfigManager(config_path=config_path)._load_raw_pricing_file(str(models_file))
+        with patch('ocmonitor.utils.json_utils.loads') as mock_load:
+            second = ConfigManager(config_path=config_path)._load_raw_pricing_file(str(models_file))
+            mock_load.assert_not_called()
+
+        assert second is first
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test that a changed pricing file is parsed again."""
+        models_file = self._write_models(tmp_path / "models.json", 1.0)
+        manager = ConfigManager(config_path=str(tmp_path / "config.toml"))
+
+        assert manager._load_raw_pricing_file(str(models_file))["test-model"]["input"] == 1.0
+
+        self._write_models(models_file, 10.0)
+        stat = models_file.stat()
+        os.utime(models_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager._load_raw_pricing_file(str(models_file))["test-model"]["input"] == 10.0
+
+
 class TestMetricsConfig:
     """Tests for MetricsConfig model."""
 
@@ -0,0 +1,222 @@
+"""Tests for the live dashboard UI."""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ocmonitor.models.session import (
+    InteractionFile,
+    SessionData,
+    TimeData,
+    TokenUsage,
+)
+from ocmonitor.models.tool_usage import ModelToolUsage, ToolUsageStats
+from ocmonitor.ui.dashboard import DashboardUI, _trunc, _trunc_left
+
+
+def make_session(session_id="ses_1", inputs=(100,), model_id="claude-sonnet"):
+    """Build a session with one interaction per input token count."""
+    files = [
+        InteractionFile(
+            file_path=f"/tmp/{session_id}-{i}.json",
+            session_id=session_id,
+            model_id=model_id,
+            tokens=TokenUsage(input=tokens, output=10),
+            time_data=TimeData(created=1_000 * i, completed=1_000 * i + 500),
+        )
+        for i, tokens in enumerate(inputs, start=1)
+    ]
+    return SessionData(session_id=session_id, files=files)
+
+
+class TestDashboardPanelCache:
+    """Tests for reuse of unchanged dashboard panels."""
+
+    @pytest.fixture
+    def ui(self):
+        return DashboardUI()
+
+    def test_token_panel_reused_until_counts_change(self, ui):
+        """Test that the token panel is rebuilt only when its counts change."""
+        session = make_session()
+        first = ui.create_token_panel(session, session.files[0])
+
+        assert ui.create_token_panel(make_session(), session.files[0]) is first
+        assert ui.create_token_panel(make_session(inputs=(200,)), session.files[0]) is not first
+
+    def test_tool_panel_reused_for_equal_stats(self, ui):
+        """Test that the flat tool panel is keyed on the displayed stats."""
+        stats = [ToolUsageStats(tool_name="read", total_calls=4, success_count=4)]
+        first = ui.create_tool_panel(stats)
+
+        assert ui.create_tool_panel([s.model_copy() for s in stats]) is first
+        stats[0].success_count = 3
+        assert ui.create_tool_panel(stats) is not first
+
+    def test_layout_tree_persists_until_shape_changes(self, ui):
+        """Test that the layout is updated in place and restructured only on a shape change."""
+        session = make_session()
+        recent = session.files[-1]
+        stats = [ToolUsageStats(tool_name="read", total_calls=4, success_count=4)]
+
+        layout = ui.create_dashboard_layout(session, recent, {}, tool_stats=stats)
+        header_slot = layout["header"]
+        token_panel = layout["token"].renderable
+
+        updated = make_session(inputs=(200,))
+        assert ui.create_dashboard_layout(updated, updated.files[-1], {}, tool_stats=stats) is layout
+        assert layout["header"] is header_slot
+        assert layout["token"].renderable is not token_panel
+
+        with_controls = ui.create_dashboard_layout(updated, updated.files[-1], {}, tool_stats=stats, controls_hint="q quit")
+        assert with_controls is not layout
+        assert with_controls.get("controls") is not None
+
+    def test_model_panel_reused_until_breakdown_changes(self, ui):
+        """Test that the models panel is keyed on per-model figures, rates and context."""
+        session = make_session()
+        first = ui.create_model_panel(session, {})
+
+        assert ui.create_model_panel(make_session(), {}) is first
+        assert ui.create_model_panel(session, {}, {"claude-sonnet": 12.5}) is not first
+        assert ui.create_model_panel(make_session(inputs=(200,)), {}) is not first
+
+    def test_tool_grid_reused_until_stats_or_model_info_change(self, ui):
+        """Test that the tool grid is rebuilt only when a model's tools or figures change."""
+        def by_model(calls=4):
+            return [
+                ModelToolUsage(
+                    model_name=name,
+                    tool_stats=[ToolUsageStats(tool_name="read", total_calls=calls, success_count=calls)],
+                )
+                for name in ("alpha", "beta", "gamma")
+            ]
+
+        first = ui.create_tool_grid_panel(by_model()).renderable
+
+        assert ui.create_tool_grid_panel(by_model()).renderable is first
+        assert ui.create_tool_grid_panel(by_model(calls=5)).renderable is not first
+        rates = {"alpha": 3.0}
+        assert ui.create_tool_grid_panel(by_model(), per_model_output_rates=rates).renderable is not first
+
+    def test_tool_grid_reads_normalized_breakdown(self, ui):
+        """Test that grid headers take token totals and costs from the normalized breakdown."""
+        by_model = [
+            ModelToolUsage(model_name=name, tool_stats=[ToolUsageStats(tool_name="read", total_calls=1)])
+            for name in ("alpha", "beta")
+        ]
+        breakdown = {"alpha": {"tokens_total": 1234, "cost": Decimal("0.5")}}
+
+        with patch.object(ui, "create_model_tool_panel", wraps=ui.create_model_tool_panel) as mock_panel:
+            ui.create_tool_grid_panel(by_model, model_breakdown=breakdown)
+
+        alpha, beta = (call.kwargs for call in mock_panel.call_args_list)
+        assert (alpha["model_tokens"], alpha["model_cost"]) == (1234, Decimal("0.5"))
+        assert (beta["model_tokens"], beta["model_cost"]) == (None, None)
+
+class TestDashboardFormatting:
+    """Tests for cached number formatting and header templates."""
+
+    def test_cost_formatting_cached_per_amount(self):
+        """Test that the currency converter runs once per distinct amount."""
+        converter = MagicMock()
+        converter.format.side_effect = lambda amount: f"EUR {amount:.2f}"
+        ui = DashboardUI(currency_converter=converter)
+
+        assert ui._fmt_cost(Decimal("1.5")) == "EUR 1.50"
+        assert ui._fmt_cost(Decimal("1.50")) == "EUR 1.50"
+        assert ui._fmt_cost(Decimal("2")) == "EUR 2.00"
+        assert converter.format.call_count == 2
+
+    def test_int_formatting_uses_thousands_separators(self):
+        """Test that cached integer formatting matches the plain format spec."""
+        ui = DashboardUI()
+
+        assert ui._fmt_int(1234567) == "1,234,567"
+        assert ui._fmt_int(1234567) is ui._fmt_int(1234567)
+
+    def test_header_lists_session_details(self):
+        """Test that the session header template is filled in."""
+        ui = DashboardUI()
+        session = make_session(inputs=(1, 2, 3))
+
+        header = ui.create_header(session).renderable
+
+        assert "[dashboard.session]ses_1[/dashboard.session]" in header
+        assert "[metric.label]Interactions:[/metric.label] [metric.value]3[/metric.value]" in header
+
+    def test_header_and_status_share_frame_time(self):
+        """Test that one frame clock drives the header and the time section."""
+        ui = DashboardUI()
+        session = make_session()
+        frame = session.start_time + timedelta(hours=1, minutes=30, microseconds=7)
+
+        header = ui.create_header(session, now=frame).renderable
+        status = ui.create_status_panel(session, {}, now=frame).renderable
+
+        assert frame.strftime("%Y-%m-%d %H:%M:%S") in header
+        assert "[metric.value]1h 30m[/metric.value]" in status
+
+
+    def test_token_panel_templates(self):
+        """Test that the token panel lists recent and total counts with separators."""
+        ui = DashboardUI()
+        session = make_session(inputs=(1500, 2500))
+
+        with_recent = ui.create_token_panel(session, session.files[-1]).renderable
+        totals_only = DashboardUI().create_token_panel(session).renderable
+
+        assert with_recent.startswith("[dashboard.header]Recent Interaction[/dashboard.header]\n")
+        assert with_recent.endswith(totals_only)
+        assert totals_only.startswith("[dashboard.header]Session Totals[/dashboard.header]\n")
+        assert "[metric.value]4,000[/metric.value]" in totals_only
+        assert totals_only.endswith("[metric.tokens]4,020[/metric.tokens]")
+
+    def test_percentages_are_capped(self):
+        """Test that panel percentages are capped at 100 and zero without a maximum."""
+        assert DashboardUI._pct(Decimal("1.5"), Decimal("3")) == 50.0
+        assert DashboardUI._pct(250_000, 200_000) == 100.0
+        assert DashboardUI._pct(10, 0) == 0.0
+        assert DashboardUI().get_time_color(95.0) == "status.error"
+
+    def test_truncation_keeps_width(self):
+        """Test that long names are cut to the width with an ellipsis on the cut side."""
+        assert _trunc("read", 12) == "read"
+        assert _trunc("todowrite_extended", 12) == "todowrite..."
+        assert _trunc_left("very_long_interaction_file.json", 20) == "...raction_file.json"
+        assert len(_trunc_left("very_long_interaction_file.json", 20)) == 20
+
+    def test_color_tables_match_thresholds(self):
+        """Test that table color lookups keep the threshold boundaries."""
+        ui = DashboardUI()
+
+        assert ui.get_cost_color(49.99) == "status.success"
+        assert ui.get_context_color(50) == "status.warning"
+        assert ui.get_time_color(89.99) == "status.warning"
+        assert ui.get_time_color(150.0) == "status.error"
+        assert ui.get_tool_color(69.9) == "status.error"
+        assert ui.get_tool_color(70.0) == "status.warning"
+        assert ui.get_tool_color(100.0) == "status.success"
+
+class TestProgressBars:
+    """Tests for precomputed progress bars."""
+
+    @pytest.mark.parametrize("width", [8, 10, 12, 20, 15])
+    @pytest.mark.parametrize("percentage", [0, 37, 42.0, 49.6, 99.5, 100.0])
+    def test_compact_bar_matches_direct_rendering(self, width, percentage):
+        """Test that table lookups and the fallback render the same bar."""
+        filled = int(width * percentage / 100)
+        expected = "█" * filled + "░" * (width - filled) + f" {percentage:.0f}%"
+
+        assert DashboardUI().create_compact_progress_bar(percentage, width) == expected
+
+    @pytest.mark.parametrize("width", [12, 30, 40])
+    @pytest.mark.parametrize("percentage", [0, 33.3, 100, 120])
+    def test_progress_bar_matches_direct_rendering(self, width, percentage):
+        """Test that sliced bar cells match repeated characters, including overflow."""
+        filled = int(width * percentage / 100)
+        expected = f"[{'█' * filled}{'░' * (width - filled)}] {percentage:.1f}%"
+
+        assert DashboardUI().create_progress_bar(percentage, width) == expected
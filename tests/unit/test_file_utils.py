@@ -61,6 +61,18 @@ class TestNormalizeModelName:
         # Should extract base model name
         assert "claude-sonnet-4" in result
 
+    def test_normalize_results_are_cached(self):
+        """Test that repeated model IDs are served from the cache."""
+        FileProcessor._normalize_model_name.cache_clear()
+
+        first = FileProcessor._normalize_model_name("Claude-Opus-4-5-20251101")
+        second = FileProcessor._normalize_model_name("Claude-Opus-4-5-20251101")
+
+        assert first == second == "claude-opus-4.5"
+        info = FileProcessor._normalize_model_name.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
 
 class TestFindSessionDirectories:
     """Tests for find_session_directories method."""
@@ -288,6 +300,53 @@ class TestLoadAllSessions:
         
         assert len(result) == 3
 
+    def test_file_cache_reparses_only_changed_files(self, tmp_path):
+        """Test that cached loads parse only new or modified files."""
+        import os
+        from unittest.mock import patch
+        from ocmonitor.utils.file_utils import InteractionFileCache
+
+        session_dir = tmp_path / "ses_001"
+        session_dir.mkdir()
+        for name in ("inter_0001.json", "inter_0002.json"):
+            (session_dir / name).write_text(json.dumps({"tokens": {"input": 100, "output": 50}}))
+
+        cache = InteractionFileCache()
+        first = FileProcessor.load_all_sessions(str(tmp_path), file_cache=cache)
+        assert len(first[0].files) == 2
+
+        changed = session_dir / "inter_0002.json"
+        changed.write_text(json.dumps({"tokens": {"input": 300, "output": 50}}))
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with patch.object(
+            FileProcessor, "parse_interaction_file", wraps=FileProcessor.parse_interaction_file
+        ) as mock_parse:
+            second = FileProcessor.load_all_sessions(str(tmp_path), file_cache=cache)
+
+        assert mock_parse.call_count == 1
+        assert second[0].total_tokens.input == 400
+
+    def test_file_cache_drops_removed_files(self, tmp_path):
+        """Test that entries for deleted files are pruned."""
+        from ocmonitor.utils.file_utils import InteractionFileCache
+
+        session_dir = tmp_path / "ses_001"
+        session_dir.mkdir()
+        for name in ("inter_0001.json", "inter_0002.json"):
+            (session_dir / name).write_text(json.dumps({"tokens": {"input": 100, "output": 50}}))
+
+        cache = InteractionFileCache()
+        FileProcessor.load_all_sessions(str(tmp_path), file_cache=cache)
+        assert len(cache) == 2
+
+        (session_dir / "inter_0001.json").unlink()
+        result = FileProcessor.load_all_sessions(str(tmp_path), file_cache=cache)
+
+        assert len(cache) == 1
+        assert len(result[0].files) == 1
+
 
 class TestValidateSessionStructure:
     """Tests for validate_session_structure method."""
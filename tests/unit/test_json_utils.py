@@ -0,0 +1,52 @@
+"""Tests for JSON parsing helpers."""
+
+import pytest
+
+import ocmonitor.utils.json_utils as json_utils
+
+
+class TestLoads:
+    """Tests for json_utils.loads."""
+
+    def test_parses_bytes(self):
+        """Test that UTF-8 bytes are parsed."""
+        data = json_utils.loads('{"model": "claude-sonnet-4", "input": 3.0, "symbol": "€"}'.encode("utf-8"))
+        assert data == {"model": "claude-sonnet-4", "input": 3.0, "symbol": "€"}
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that invalid JSON raises a ValueError subclass."""
+        with pytest.raises(ValueError):
+            json_utils.loads(b"{not json")
+
+    def test_falls_back_to_stdlib_without_orjson(self, monkeypatch):
+        """Test that stdlib json is used when orjson is not installed."""
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        assert json_utils.loads(b'{"input": 1.5}') == {"input": 1.5}
+        with pytest.raises(ValueError):
+            json_utils.loads(b"{not json")
+
+
+class TestDumps:
+    """Tests for json_utils.dumps."""
+
+    def test_round_trips_through_loads(self):
+        """Test that dumped bytes parse back to the same data."""
+        data = {"payload": {"symbol": "€", "rates": [1.5, 2]}, "schema_version": 1}
+
+        encoded = json_utils.dumps(data, indent=True)
+
+        assert isinstance(encoded, bytes)
+        assert b"\n  " in encoded
+        assert json_utils.loads(encoded) == data
+
+    def test_falls_back_to_stdlib_without_orjson(self, monkeypatch):
+        """Test that stdlib json writes the same document without orjson."""
+        data = {"payload": {"symbol": "€"}}
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        encoded = json_utils.dumps(data, indent=True)
+
+        assert "€".encode("utf-8") in encoded
+        assert json_utils.loads(encoded) == data
+        assert json_utils.dumps(data) == '{"payload": {"symbol": "€"}}'.encode("utf-8")
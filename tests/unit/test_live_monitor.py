@@ -1,4 +1,5 @@
 import logging
+import os
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from ocmonitor.config import PathsConfig
@@ -713,6 +714,35 @@ class TestLiveMonitorValidation:
         assert result["valid"] is False
         assert result["info"]["files"]["available"] is False
 
+    def test_validate_monitoring_setup_reuses_probe_until_directory_changes(
+        self, monkeypatch, tmp_path
+    ):
+        sessions_dir = tmp_path / "message"
+        sessions_dir.mkdir()
+        monitor = LiveMonitor(pricing_data={})
+        find_sessions = MagicMock(return_value=[tmp_path / "session-1"])
+
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.SQLiteProcessor.find_database_path",
+            lambda: None,
+        )
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.FileProcessor.find_session_directories",
+            find_sessions,
+        )
+
+        first = monitor.validate_monitoring_setup(str(sessions_dir))
+        first["warnings"].append("caller-owned")
+        second = monitor.validate_monitoring_setup(str(sessions_dir))
+        assert find_sessions.call_count == 1
+        assert second["info"] == first["info"]
+        assert "caller-owned" not in second["warnings"]
+
+        stat = sessions_dir.stat()
+        os.utime(sessions_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        monitor.validate_monitoring_setup(str(sessions_dir))
+        assert find_sessions.call_count == 2
+
 
 class TestLiveMonitorToolStatsSourceSelection:
     """Tests for tool stats source selection in live monitor."""
@@ -874,7 +904,9 @@ class TestLiveMonitorSelection:
         ended_workflow = SimpleNamespace(workflow_id="wf-ended", end_time=1)
         monkeypatch.setattr(
             "ocmonitor.services.live_monitor.FileProcessor.load_all_sessions",
-            lambda base_path, limit=50: [SimpleNamespace(session_id="ses_1")],
+            lambda base_path, limit=50, file_cache=None: [
+                SimpleNamespace(session_id="ses_1")
+            ],
         )
         monkeypatch.setattr(
             monitor.session_grouper,
@@ -898,16 +930,42 @@ class TestLiveMonitorSelection:
         )
         monkeypatch.setattr(
             "ocmonitor.services.live_monitor.SQLiteProcessor.get_all_active_workflows",
-            lambda _: [],
+            lambda db_path=None, conn=None: [],
         )
         monkeypatch.setattr(
             "ocmonitor.services.live_monitor.SQLiteProcessor.get_most_recent_workflow",
-            lambda _: {"workflow_id": "wf-ended"},
+            lambda db_path=None, conn=None: {"workflow_id": "wf-ended"},
         )
 
         result = monitor._get_sqlite_active_workflows(allow_fallback=False)
         assert result == []
 
+    def test_sqlite_loader_reuses_one_connection(self, monkeypatch, tmp_path):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        db_path = tmp_path / "opencode.db"
+        db_path.touch()
+        seen_conns = []
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.SQLiteProcessor.find_database_path",
+            lambda: db_path,
+        )
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.SQLiteProcessor.get_all_active_workflows",
+            lambda db_path=None, conn=None: seen_conns.append(conn)
+            or [{"workflow_id": "wf-1"}],
+        )
+
+        monitor._get_sqlite_active_workflows()
+        monitor._get_sqlite_active_workflows()
+
+        assert seen_conns[0] is not None
+        assert seen_conns[0] is seen_conns[1]
+        assert seen_conns[0].execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+        monitor._close_polling_connection()
+        assert monitor._db_conn is None
+
     def test_handle_live_switch_command_show_does_not_switch(self):
         monitor = LiveMonitor(pricing_data={}, init_from_db=False)
         monitor._print_workflow_picker_table = MagicMock()
@@ -1365,3 +1423,402 @@ class TestHandleNavigationCommand:
         assert workflow_id == "wf-3"
         assert workflow == workflow_3
         assert selected == "wf-3"
+
+
+class TestWorkflowWrapper:
+    def _make_wrapper(self, sessions):
+        from ocmonitor.services.live_monitor import WorkflowWrapper
+
+        return WorkflowWrapper(
+            {
+                "main_session": sessions[0],
+                "sub_agents": sessions[1:],
+                "all_sessions": sessions,
+                "project_name": "project",
+                "display_title": "title",
+                "session_count": len(sessions),
+                "sub_agent_count": len(sessions) - 1,
+                "has_sub_agents": len(sessions) > 1,
+                "workflow_id": sessions[0].session_id,
+            },
+            {},
+        )
+
+    def test_aggregates_tokens_and_time_span(self, make_timed_session):
+        from datetime import datetime
+
+        main = make_timed_session("main", 2000, 5000, input=10, output=1)
+        sub = make_timed_session("sub", 1000, 9000, input=5, cache_read=3)
+
+        wrapper = self._make_wrapper([main, sub])
+
+        tokens = wrapper.total_tokens
+        assert (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read) == (
+            15,
+            1,
+            0,
+            3,
+        )
+        assert wrapper.start_time == datetime.fromtimestamp(1)
+        assert wrapper.end_time == datetime.fromtimestamp(9)
+        assert wrapper.duration_ms == 8000
+
+    def test_wrapper_has_no_instance_dict(self, make_timed_session):
+        main = make_timed_session("main", 2000, 5000, input=1)
+
+        wrapper = self._make_wrapper([main])
+
+        assert not hasattr(wrapper, "__dict__")
+        assert wrapper.calculate_total_cost() == 0
+
+    def test_total_cost_memoized_per_pricing(self, make_timed_session):
+        from decimal import Decimal
+
+        main = make_timed_session("main", 2000, 5000, input=10)
+        wrapper = self._make_wrapper([main])
+        pricing = {"model-a": MagicMock()}
+
+        with patch.object(
+            type(main), "calculate_total_cost", return_value=Decimal("1")
+        ) as mock_cost:
+            assert wrapper.calculate_total_cost(pricing) == Decimal("1")
+            assert wrapper.calculate_total_cost(pricing) == Decimal("1")
+            assert mock_cost.call_count == 1
+
+            wrapper.calculate_total_cost(dict(pricing))
+            assert mock_cost.call_count == 2
+
+    def test_open_sessions_leave_end_time_unset(self, make_timed_session):
+        main = make_timed_session("main", 2000, None, input=1)
+
+        wrapper = self._make_wrapper([main])
+
+        assert wrapper.end_time is None
+        assert wrapper.duration_ms is None
+        assert wrapper.duration_percentage == 0.0
+
+
+class TestRecentWorkflowFile:
+    def test_finds_newest_non_zero_file_across_sessions(self):
+        from ocmonitor.models.session import TokenUsage
+
+        def make_file(ts, tokens):
+            return SimpleNamespace(
+                modification_timestamp=float(ts),
+                tokens=TokenUsage(input=tokens),
+            )
+
+        older = make_file(100, 10)
+        newest_zero = make_file(300, 0)
+        newest = make_file(200, 5)
+        workflow = SimpleNamespace(
+            all_sessions=[
+                SimpleNamespace(files=[older]),
+                SimpleNamespace(files=[newest_zero, newest]),
+            ]
+        )
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        assert monitor._find_recent_workflow_file(workflow) is newest
+        assert (
+            monitor._find_recent_workflow_file(SimpleNamespace(all_sessions=[]))
+            is None
+        )
+
+    def test_per_model_context_streams_workflow_files(self):
+        from ocmonitor.models.session import TokenUsage
+
+        def make_file(model_id, ts, tokens):
+            return SimpleNamespace(
+                model_id=model_id,
+                modification_timestamp=float(ts),
+                tokens=TokenUsage(input=tokens),
+            )
+
+        workflow = SimpleNamespace(
+            all_sessions=[
+                SimpleNamespace(files=[make_file("m", 100, 10), make_file("n", 50, 7)]),
+                SimpleNamespace(files=[make_file("m", 300, 0), make_file("m", 200, 40)]),
+            ]
+        )
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        usage = monitor._get_per_model_context_usage(workflow)
+
+        assert usage["m"]["context_size"] == 40
+        assert usage["n"]["context_size"] == 7
+
+
+class TestOutputRateWindow:
+    def _write_interaction(self, tmp_path, name, output, age_seconds):
+        import json
+        import os
+        import time
+
+        from ocmonitor.models.session import InteractionFile, TimeData, TokenUsage
+
+        path = tmp_path / name
+        path.write_text(json.dumps({}))
+        mtime = time.time() - age_seconds
+        os.utime(path, (mtime, mtime))
+        return InteractionFile(
+            file_path=path,
+            session_id="ses_1",
+            tokens=TokenUsage(output=output),
+            time_data=TimeData(created=0, completed=1000),
+        )
+
+    def test_only_interactions_from_last_five_minutes_count(self, tmp_path):
+        from ocmonitor.models.session import SessionData
+
+        recent = self._write_interaction(tmp_path, "recent.json", 200, 10)
+        old = self._write_interaction(tmp_path, "old.json", 5000, 600)
+        session = SessionData(session_id="ses_1", files=[recent, old])
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        assert monitor._calculate_output_rate(session) == 200.0
+        assert old.modification_timestamp == old.file_path.stat().st_mtime
+
+    def test_falls_back_to_window_mean_without_eligible_interactions(self, tmp_path):
+        from ocmonitor.models.session import SessionData
+
+        first = self._write_interaction(tmp_path, "a.json", 30, 10)
+        second = self._write_interaction(tmp_path, "b.json", 50, 20)
+        first.finish_reason = second.finish_reason = "tool-calls"
+        session = SessionData(session_id="ses_1", files=[first, second])
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        assert monitor._calculate_output_rate(session) == 40.0
+
+
+class TestRenderSkipping:
+    def _session(self, session_id, files, tokens):
+        return SimpleNamespace(
+            session_id=session_id,
+            files=files,
+            total_tokens=SimpleNamespace(total=tokens),
+        )
+
+    def test_unchanged_workflow_is_not_rerendered(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        sessions = [self._session("ses_1", [1, 2], 100)]
+
+        assert monitor._should_render("wf", sessions, None, 5) is True
+        assert monitor._should_render("wf", sessions, None, 5) is False
+
+    def test_changes_trigger_render(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        sessions = [self._session("ses_1", [1], 100)]
+        monitor._should_render("wf", sessions, None, 5)
+
+        sessions[0].total_tokens.total = 150
+        assert monitor._should_render("wf", sessions, None, 5) is True
+        sessions.append(self._session("ses_2", [], 0))
+        assert monitor._should_render("wf", sessions, None, 5) is True
+        assert monitor._should_render("wf", sessions, "Status: Ready.", 5) is True
+        assert monitor._should_render("other", sessions, "Status: Ready.", 5) is True
+
+    def test_render_forced_each_refresh_interval(self, monkeypatch):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        sessions = [self._session("ses_1", [1], 100)]
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.time.time", lambda: now[0]
+        )
+
+        assert monitor._should_render("wf", sessions, None, 5) is True
+        now[0] += 1
+        assert monitor._should_render("wf", sessions, None, 5) is False
+        now[0] += 5
+        assert monitor._should_render("wf", sessions, None, 5) is True
+
+
+class TestSelectDescribedWorkflow:
+    def test_matches_most_recent_selection(self):
+        now = 1700000000
+        workflows = [
+            {
+                "workflow_id": f"wf-{idx}",
+                "main_session": MagicMock(
+                    session_id=f"wf-{idx}", files=[], start_time=now + offset
+                ),
+                "all_sessions": [],
+            }
+            for idx, offset in enumerate([-30, 10, 10, -5])
+        ]
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        descriptors = monitor._describe_sqlite_workflows(workflows)
+        selected = monitor._select_described_workflow(workflows, descriptors)
+
+        assert selected is workflows[1]
+        assert selected is monitor._select_most_recent_workflow(workflows)
+
+    def test_file_workflows_matched_by_attribute(self):
+        workflows = [
+            SimpleNamespace(workflow_id="wf-a"),
+            SimpleNamespace(workflow_id="wf-b"),
+        ]
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        selected = monitor._select_described_workflow(
+            workflows, [{"workflow_id": "wf-b"}, {"workflow_id": "wf-a"}]
+        )
+
+        assert selected is workflows[1]
+
+
+class TestRefreshDeadline:
+    def test_deadline_steps_from_previous_deadline(self, monkeypatch):
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.time.monotonic", lambda: 101.5
+        )
+
+        assert LiveMonitor._next_refresh_deadline(100.0, 5) == 105.0
+
+    def test_overrun_restarts_schedule_from_now(self, monkeypatch):
+        monkeypatch.setattr(
+            "ocmonitor.services.live_monitor.time.monotonic", lambda: 112.0
+        )
+
+        assert LiveMonitor._next_refresh_deadline(100.0, 5) == 117.0
+
+
+class TestSqliteContextUsage:
+    def _file(self, model_id, created, input_tokens):
+        from ocmonitor.models.session import TokenUsage
+
+        return SimpleNamespace(
+            model_id=model_id,
+            time_data=SimpleNamespace(created=created),
+            tokens=TokenUsage(input=input_tokens),
+            is_rate_eligible=False,
+        )
+
+    def test_latest_file_per_model_across_sessions(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        main = SimpleNamespace(
+            files=[self._file("m", 1, 100), self._file("n", 5, 7)]
+        )
+        sub = SimpleNamespace(files=[self._file("m", 3, 400), self._file("m", 9, 0)])
+
+        usage = monitor._get_sqlite_per_model_context_usage(
+            {"all_sessions": [main, sub]}
+        )
+
+        assert usage["m"]["context_size"] == 400
+        assert usage["n"]["context_size"] == 7
+
+    def test_workflow_without_token_files_has_no_usage(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        empty = SimpleNamespace(files=[self._file("m", 1, 0)])
+
+        assert monitor._get_sqlite_per_model_context_usage(
+            {"all_sessions": [empty]}
+        ) == {}
+
+    def test_scan_matches_separate_helpers(self):
+        from ocmonitor.models.session import InteractionFile, TimeData, TokenUsage
+
+        def interaction(model_id, created, output):
+            return InteractionFile(
+                file_path=f"{model_id}-{created}.json",
+                session_id="ses_1",
+                model_id=model_id,
+                tokens=TokenUsage(input=10, output=output),
+                time_data=TimeData(created=created, completed=created + 1000),
+            )
+
+        main = SimpleNamespace(
+            files=[interaction("m", 1_000, 100), interaction("n", 4_000, 50)]
+        )
+        sub = SimpleNamespace(
+            files=[interaction("m", 3_000, 300), interaction("m", 2_000, 200)]
+        )
+        workflow = {"all_sessions": [main, sub]}
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+
+        recent_file, rates, model_most_recent = monitor._scan_sqlite_workflow(workflow)
+
+        assert recent_file is main.files[1]
+        assert rates == {"m": 200.0, "n": 50.0}
+        assert model_most_recent == {"m": sub.files[0], "n": main.files[1]}
+
+
+class TestContextUsagePercentage:
+    def test_percentage_is_capped_and_memoized(self):
+        from ocmonitor.services.live_monitor import _context_usage_percentage
+
+        _context_usage_percentage.cache_clear()
+
+        assert _context_usage_percentage(50_000, 200_000) == 25.0
+        assert _context_usage_percentage(50_000, 200_000) == 25.0
+        assert _context_usage_percentage(300_000, 200_000) == 100.0
+        assert _context_usage_percentage(10, 0) == 0
+        assert _context_usage_percentage.cache_info().hits == 1
+
+
+class TestDatabaseSignature:
+    def test_signature_tracks_database_and_wal_writes(self, tmp_path):
+        db_path = tmp_path / "opencode.db"
+        db_path.write_bytes(b"db")
+
+        initial = LiveMonitor._database_signature(db_path)
+        assert initial[1] is None
+        assert LiveMonitor._database_signature(db_path) == initial
+
+        (tmp_path / "opencode.db-wal").write_bytes(b"frame")
+        with_wal = LiveMonitor._database_signature(db_path)
+        assert with_wal != initial
+
+        (tmp_path / "opencode.db-wal").write_bytes(b"frame-2")
+        assert LiveMonitor._database_signature(db_path) != with_wal
+
+    def test_missing_database_has_empty_signature(self, tmp_path):
+        assert LiveMonitor._database_signature(tmp_path / "missing.db") == (
+            None,
+            None,
+        )
+
+
+class TestLatestActivityCache:
+    def _file(self, created_ms):
+        return SimpleNamespace(time_data=SimpleNamespace(created=created_ms))
+
+    def test_activity_reused_until_main_session_grows(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        files = [self._file(1_000), self._file(5_000)]
+        main = SimpleNamespace(session_id="ses_main", files=files, start_time=None)
+        workflow = {"workflow_id": "wf-1", "main_session": main}
+
+        assert monitor._get_latest_sqlite_activity_ts(workflow) == 5.0
+
+        # Same interaction objects: the cached timestamp is returned unchanged
+        files[0].time_data.created = 9_000
+        assert monitor._get_latest_sqlite_activity_ts(workflow) == 5.0
+
+        files.append(self._file(7_000))
+        assert monitor._get_latest_sqlite_activity_ts(workflow) == 9.0
+
+    def test_file_workflow_activity_is_cached(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        first = SimpleNamespace(modification_timestamp=100.0)
+        main = SimpleNamespace(session_id="ses_main", files=[first])
+        workflow = SimpleNamespace(workflow_id="wf-1", main_session=main)
+
+        assert monitor._get_latest_file_activity_ts(workflow) == 100.0
+        main.files = [first, SimpleNamespace(modification_timestamp=250.0)]
+        assert monitor._get_latest_file_activity_ts(workflow) == 250.0
+
+    def test_file_workflow_activity_refreshed_when_file_rewritten(self):
+        monitor = LiveMonitor(pricing_data={}, init_from_db=False)
+        main = SimpleNamespace(
+            session_id="ses_main",
+            files=[SimpleNamespace(modification_timestamp=100.0)],
+        )
+        workflow = SimpleNamespace(workflow_id="wf-1", main_session=main)
+
+        assert monitor._get_latest_file_activity_ts(workflow) == 100.0
+        # A rewritten file is reloaded as a new interaction at the same count
+        main.files = [SimpleNamespace(modification_timestamp=300.0)]
+        assert monitor._get_latest_file_activity_ts(workflow) == 300.0
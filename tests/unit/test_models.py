@@ -6,7 +6,7 @@ from decimal import Decimal
 from datetime import datetime
 
 from ocmonitor.models.session import TokenUsage, TimeData, InteractionFile, SessionData
-from ocmonitor.config import ModelPricing
+from ocmonitor.config import ModelPricing, PricingTable
 
 
 class TestTokenUsage:
@@ -35,6 +35,23 @@ class TestTokenUsage:
         tokens = TokenUsage(input=0, output=0, cache_write=0, cache_read=0)
         assert tokens.total == 0
 
+    def test_model_dump_includes_total(self):
+        """Test that JSON reports still receive the total token count."""
+        tokens = TokenUsage(input=10, output=5)
+        assert tokens.model_dump()["total"] == 15
+
+    def test_from_counts_matches_constructor(self):
+        """Test that from_counts builds the same object as the constructor."""
+        tokens = TokenUsage.from_counts(input=10, output=5, cache_write=2, cache_read=1)
+        assert tokens == TokenUsage(input=10, output=5, cache_write=2, cache_read=1)
+        assert tokens.model_dump()["total"] == 18
+
+    def test_from_counts_validates_non_int_values(self):
+        """Test that from_counts falls back to validation for other values."""
+        assert TokenUsage.from_counts(input="7").input == 7
+        with pytest.raises(ValueError):
+            TokenUsage.from_counts(input=-1)
+
 
 class TestTimeData:
     """Tests for TimeData model."""
@@ -72,6 +89,11 @@ class TestTimeData:
         assert time_data.created_datetime is None
         assert time_data.completed_datetime is None
 
+    def test_from_timestamps(self):
+        """Test that from_timestamps matches the constructor."""
+        assert TimeData.from_timestamps(1000, 5000) == TimeData(created=1000, completed=5000)
+        assert TimeData.from_timestamps(created="1000").created == 1000
+
 
 class TestInteractionFile:
     """Tests for InteractionFile model."""
@@ -101,6 +123,18 @@ class TestInteractionFile:
         
         interaction = InteractionFile(file_path=test_file, session_id="ses_test")
         assert interaction.file_name == "interaction.json"
+
+    def test_modification_time_stats_file_once(self, tmp_path):
+        """Test that the file mtime is read once and then reused."""
+        test_file = tmp_path / "interaction.json"
+        test_file.write_text("{}")
+
+        interaction = InteractionFile(file_path=test_file, session_id="ses_test")
+        first = interaction.modification_time
+        assert first == datetime.fromtimestamp(test_file.stat().st_mtime)
+
+        test_file.unlink()
+        assert interaction.modification_time == first
     
     def test_project_name_with_path(self):
         """Test project name extraction from project path."""
@@ -188,6 +222,26 @@ class TestCalculateCost:
         # 1M input tokens at $1.00/1M = $1.00
         assert interaction.calculate_cost(pricing_data) == Decimal("1.0")
 
+    def test_local_pricing_is_exact_for_all_token_types(self, tmp_path, pricing_data):
+        """Costs stay exact Decimals when every token type is priced."""
+        interaction = self._make_interaction(
+            tmp_path,
+            input=123, output=45, cache_write=7, cache_read=3,
+        )
+        # 123 * 1.0 + 45 * 2.0 + 7 * 1.5 + 3 * 0.1 = 223.8 per million tokens
+        assert interaction.calculate_cost(pricing_data) == Decimal("0.0002238")
+
+    def test_local_pricing_exact_beyond_integer_rate_scale(self, tmp_path):
+        """Rates too fine for integer units still price exactly via Decimal."""
+        pricing = ModelPricing(
+            input=1e-7, output=2.0, cacheWrite=0.0, cacheRead=0.0,
+            contextWindow=1000, sessionQuota=1.0,
+        )
+        assert pricing.int_token_rates is None
+        interaction = self._make_interaction(tmp_path, model_id="fine-model", input=3, output=1)
+
+        assert interaction.calculate_cost({"fine-model": pricing}) == Decimal("0.0000020000003")
+
     def test_force_recalculate_ignores_stored_cost(self, tmp_path, pricing_data):
         """When force_recalculate=True, stored cost is ignored and pricing data is used."""
         interaction = self._make_interaction(
@@ -228,6 +282,66 @@ class TestCalculateCost:
         assert interaction.calculate_cost(pricing_data, force_recalculate=True) == Decimal("0.0")
 
 
+class TestPricingLookup:
+    """Tests for flexible model name matching in cost calculation."""
+
+    def _pricing(self, price):
+        return ModelPricing(
+            input=Decimal(price), output=Decimal("0"), cacheWrite=Decimal("0"),
+            cacheRead=Decimal("0"), contextWindow=200000, sessionQuota=Decimal("0"),
+        )
+
+    def _interaction(self, model_id):
+        return InteractionFile(
+            file_path=Path("/tmp/test.json"),
+            session_id="ses_test",
+            model_id=model_id,
+            tokens=TokenUsage(input=1000000),
+        )
+
+    def test_normalized_and_extended_names_match(self):
+        """Dated, dash-versioned and -extended model IDs resolve to base pricing."""
+        pricing_data = {"claude-opus-4.5": self._pricing("5.0")}
+
+        assert self._interaction("claude-opus-4-5-20251101").calculate_cost(pricing_data) == Decimal("5.0")
+        assert self._interaction("claude-opus-4.5-extended").calculate_cost(pricing_data) == Decimal("5.0")
+
+    def test_fuzzy_match_resolved_once_per_model(self, monkeypatch):
+        """Repeated lookups of the same model ID reuse the memoized match."""
+        import ocmonitor.models.session as session_module
+
+        calls = []
+        original = session_module._find_pricing_key
+
+        def counting_find(model_id, pricing_data):
+            calls.append(model_id)
+            return original(model_id, pricing_data)
+
+        monkeypatch.setattr(session_module, "_find_pricing_key", counting_find)
+        pricing_data = PricingTable({"claude-opus-4.5": self._pricing("5.0")})
+
+        for _ in range(3):
+            assert self._interaction("claude-opus-4-5-20251101").calculate_cost(pricing_data) == Decimal("5.0")
+        assert calls == ["claude-opus-4-5-20251101"]
+
+        # A different pricing table is never served from the previous memo
+        other_pricing = PricingTable({"claude-opus-4.5": self._pricing("7.0")})
+        assert self._interaction("claude-opus-4-5-20251101").calculate_cost(other_pricing) == Decimal("7.0")
+
+    def test_fuzzy_match_memo_cleared_when_table_changes(self):
+        """Replacing pricing entries in place drops memoized fuzzy matches."""
+        pricing_data = PricingTable({"claude-opus-4.5": self._pricing("5.0")})
+        interaction = self._interaction("claude-opus-4-5-20251101")
+        assert interaction.calculate_cost(pricing_data) == Decimal("5.0")
+
+        # Same length, different entries: the old key must not be reused
+        del pricing_data["claude-opus-4.5"]
+        pricing_data["claude-opus-4.5-extended"] = self._pricing("9.0")
+
+        assert pricing_data.key_memo == {}
+        assert interaction.calculate_cost(pricing_data) == Decimal("9.0")
+
+
 class TestSessionData:
     """Tests for SessionData model."""
 
@@ -266,7 +380,28 @@ class TestSessionData:
         assert session.session_id == "ses_test"
         assert session.session_title == "Test Session"
         assert len(session.files) == 1
-    
+
+    def test_project_name_most_common_first_seen_wins_ties(self, tmp_path):
+        """Test that the most common project wins and ties go to the first seen."""
+        def make(project_path):
+            return InteractionFile(
+                file_path=tmp_path / "inter.json",
+                session_id="ses_test",
+                project_path=project_path,
+            )
+
+        tied = SessionData(
+            session_id="ses_test",
+            files=[make("/p/alpha"), make("/p/beta"), make("/p/beta"), make(None), make("/p/alpha")],
+        )
+        assert tied.project_name == "alpha"
+
+        majority = SessionData(
+            session_id="ses_test",
+            files=[make("/p/alpha"), make("/p/beta"), make("/p/beta")],
+        )
+        assert majority.project_name == "beta"
+
     def test_total_tokens_aggregation(self, tmp_path):
         """Test that total tokens are aggregated across all interactions."""
         session_path = tmp_path / "ses_test"
@@ -295,7 +430,91 @@ class TestSessionData:
         assert session.total_tokens.cache_write == 300
         assert session.total_tokens.cache_read == 150
         assert session.total_tokens.total == 2750
-    
+
+    def test_aggregates_refresh_when_files_change(self, tmp_path):
+        """Test that cached session aggregates follow changes to the files list."""
+        session_path = tmp_path / "ses_test"
+        session_path.mkdir()
+
+        session = SessionData(
+            session_id="ses_test",
+            session_path=session_path,
+            files=[
+                InteractionFile(
+                    file_path=session_path / "inter_0001.json",
+                    session_id="ses_test",
+                    model_id="model-a",
+                    tokens=TokenUsage(input=100),
+                    time_data=TimeData(created=1704067200000, completed=1704067201000),
+                    project_path="/home/user/project-a",
+                )
+            ],
+        )
+
+        assert session.total_tokens.input == 100
+        assert session.models_used == ["model-a"]
+        assert session.total_processing_time_ms == 1000
+
+        session.files.append(
+            InteractionFile(
+                file_path=session_path / "inter_0002.json",
+                session_id="ses_test",
+                model_id="model-b",
+                tokens=TokenUsage(input=50),
+                time_data=TimeData(created=1704067100000, completed=1704067300000),
+                project_path="/home/user/project-b",
+            )
+        )
+
+        assert session.total_tokens.input == 150
+        assert sorted(session.models_used) == ["model-a", "model-b"]
+        assert session.start_time == datetime.fromtimestamp(1704067100)
+        assert session.end_time == datetime.fromtimestamp(1704067300)
+        assert session.total_processing_time_ms == 201000
+        assert session.project_name == "project-a"
+
+        session.files = []
+        assert session.total_tokens.total == 0
+        assert session.start_time is None
+        assert session.project_name == "Unknown"
+
+    def test_aggregates_refresh_after_file_replaced_in_place(self, tmp_path):
+        """Test that invalidating after an in-place replacement refreshes the aggregates."""
+        def interaction(input_tokens):
+            return InteractionFile(
+                file_path=tmp_path / "inter_0001.json",
+                session_id="ses_test",
+                tokens=TokenUsage(input=input_tokens),
+            )
+
+        session = SessionData(session_id="ses_test", files=[interaction(100)])
+        assert session.total_tokens.input == 100
+
+        session.files[0] = interaction(400)
+        session.invalidate_aggregates()
+        assert session.total_tokens.input == 400
+
+        session.files = [interaction(700)]
+        assert session.total_tokens.input == 700
+
+    def test_total_tokens_returns_independent_copy(self, tmp_path):
+        """Test that mutating the returned token totals does not affect the session."""
+        session = SessionData(
+            session_id="ses_test",
+            files=[
+                InteractionFile(
+                    file_path=tmp_path / "inter_0001.json",
+                    session_id="ses_test",
+                    tokens=TokenUsage(input=100),
+                )
+            ],
+        )
+
+        tokens = session.total_tokens
+        tokens.input += 1000
+
+        assert session.total_tokens.input == 100
+
     def test_session_path_validation_string(self, tmp_path):
         """Test that string session paths are converted to Path objects."""
         session_path = tmp_path / "ses_test"
@@ -375,6 +594,96 @@ class TestSessionData:
         # Recalculate: uses pricing data (1M input at $1/M + 1M output at $2/M = 3.0)
         assert session.calculate_total_cost(pricing_data, force_recalculate=True) == Decimal("3.0")
 
+    def test_session_total_cost_matches_per_file_costs(self, tmp_path, pricing_data):
+        """Session total equals the sum of per-file costs across mixed models and stored costs."""
+        session_path = tmp_path / "ses_test"
+        session_path.mkdir()
+
+        files = [
+            InteractionFile(
+                file_path=session_path / "inter_0001.json",
+                session_id="ses_test",
+                model_id="known-model",
+                tokens=TokenUsage(input=1234, output=567, cache_write=89, cache_read=10),
+            ),
+            InteractionFile(
+                file_path=session_path / "inter_0002.json",
+                session_id="ses_test",
+                model_id="known-model",
+                tokens=TokenUsage(input=4321, output=765, cache_write=98, cache_read=1),
+            ),
+            InteractionFile(
+                file_path=session_path / "inter_0003.json",
+                session_id="ses_test",
+                model_id="known-model",
+                tokens=TokenUsage(input=1000, output=1000),
+                raw_data={"cost": 0.0173},
+            ),
+            InteractionFile(
+                file_path=session_path / "inter_0004.json",
+                session_id="ses_test",
+                model_id="unpriced-model",
+                tokens=TokenUsage(input=1000000),
+            ),
+        ]
+
+        session = SessionData(session_id="ses_test", session_path=session_path, files=files)
+
+        for force in (False, True):
+            expected = sum((f.calculate_cost(pricing_data, force) for f in files), Decimal("0"))
+            assert session.calculate_total_cost(pricing_data, force) == expected
+
+    def test_session_model_breakdown_groups_by_model(self, tmp_path, pricing_data):
+        """Per-model files, tokens, durations and rates are aggregated separately."""
+        session_path = tmp_path / "ses_test"
+        session_path.mkdir()
+
+        def make(name, model_id, output, created, completed, finish_reason="stop"):
+            return InteractionFile(
+                file_path=session_path / name,
+                session_id="ses_test",
+                model_id=model_id,
+                tokens=TokenUsage(input=100, output=output),
+                time_data=TimeData(created=created, completed=completed),
+                finish_reason=finish_reason,
+            )
+
+        session = SessionData(
+            session_id="ses_test",
+            session_path=session_path,
+            files=[
+                make("inter_0001.json", "known-model", 200, 0, 2000),
+                make("inter_0002.json", "other-model", 50, 0, 1000),
+                make("inter_0003.json", "known-model", 50, 0, 500, finish_reason="tool-calls"),
+                make("inter_0004.json", "known-model", 300, 0, None),
+            ],
+        )
+
+        breakdown = session.get_model_breakdown(pricing_data)
+
+        assert set(breakdown) == {"known-model", "other-model"}
+        known = breakdown["known-model"]
+        assert known["files"] == 3
+        assert known["tokens"].input == 300
+        assert known["tokens"].output == 550
+        assert known["duration_ms"] == 2500
+        assert known["interaction_rates"] == [100.0]
+        other = breakdown["other-model"]
+        assert other["files"] == 1
+        assert other["tokens"].output == 50
+        assert other["duration_ms"] == 1000
+        assert other["interaction_rates"] == [50.0]
+        assert other["cost"] == Decimal("0.0")
+        assert known["cost"] == sum(
+            (f.calculate_cost(pricing_data) for f in session.files if f.model_id == "known-model"),
+            Decimal("0.0"),
+        )
+        assert known["cost"] + other["cost"] == session.calculate_total_cost(pricing_data)
+
+        # Rates are precomputed once; callers get their own list
+        known["interaction_rates"].append(1.0)
+        assert session.get_model_breakdown(pricing_data)["known-model"]["interaction_rates"] == [100.0]
+
     def test_session_model_breakdown_respects_force_recalculate(self, tmp_path, pricing_data):
         """Per-model cost totals in session model breakdown change with force_recalculate=True."""
         session_path = tmp_path / "ses_test"
@@ -630,3 +939,171 @@ class TestWorkflowForceRecalculate:
         # Recalculate: (1M input + 1M output at $3/M) + (0.5M input + 0.5M output at $3/M)
         # = $3.00 + $1.50 = $4.50
         assert workflow.calculate_total_cost(pricing_data, force_recalculate=True) == Decimal("4.5")
+
+    def test_aggregated_model_breakdown_matches_per_session_merge(self, tmp_path, pricing_data):
+        """Fused per-model totals equal merging each session's breakdown."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main_session = self._make_session(
+            tmp_path, session_id="ses_main", raw_data={"cost": 0.50}, input=1000, output=10
+        )
+        sub_known = self._make_session(tmp_path, session_id="ses_sub", input=2000, cache_read=300)
+        sub_other = self._make_session(
+            tmp_path, session_id="ses_other", model_id="other-model", input=7
+        )
+        workflow = SessionWorkflow(
+            workflow_id="ses_main",
+            main_session=main_session,
+            sub_agent_sessions=[sub_known, sub_other],
+        )
+
+        for force in (False, True):
+            expected = {}
+            for session in workflow.all_sessions:
+                for model, stats in session.get_model_breakdown(pricing_data, force).items():
+                    entry = expected.setdefault(model, {"tokens": 0, "cost": Decimal("0")})
+                    entry["tokens"] += stats["tokens"].total
+                    entry["cost"] += stats["cost"]
+
+            assert workflow.aggregated_model_breakdown(pricing_data, force) == expected
+
+
+class TestSessionWorkflow:
+    """Tests for SessionWorkflow aggregates."""
+
+    def test_aggregates_span_main_and_sub_agents(self, make_timed_session):
+        """Times and tokens cover the main session and every sub-agent."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000, input=10, output=1)
+        sub = make_timed_session("ses_sub", 1000, 9000, input=5, cache_read=3)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main, sub_agent_sessions=[sub])
+
+        assert workflow.start_time == datetime.fromtimestamp(1)
+        assert workflow.end_time == datetime.fromtimestamp(9)
+        tokens = workflow.total_tokens
+        assert (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read) == (15, 1, 0, 3)
+        assert tokens.total == 19
+
+    def test_aggregates_refresh_when_sub_agent_added(self, make_timed_session):
+        """Sub-agents appended after construction are included."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000, input=10)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main)
+        assert workflow.total_tokens.input == 10
+        assert workflow.end_time == datetime.fromtimestamp(5)
+
+        workflow.sub_agent_sessions.append(
+            make_timed_session("ses_sub", 3000, 8000, input=7)
+        )
+
+        assert workflow.total_tokens.input == 17
+        assert workflow.end_time == datetime.fromtimestamp(8)
+
+    def test_aggregates_refresh_when_sub_agent_file_replaced(self, make_timed_session):
+        """Replacing a file inside a sub-agent session updates the totals."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000, input=10)
+        sub = make_timed_session("ses_sub", 3000, 6000, input=5)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main, sub_agent_sessions=[sub])
+        assert workflow.total_tokens.input == 15
+        assert workflow.end_time == datetime.fromtimestamp(6)
+
+        sub.files[0] = make_timed_session("ses_sub", 3000, 9000, input=40).files[0]
+        sub.invalidate_aggregates()
+
+        assert workflow.total_tokens.input == 50
+        assert workflow.end_time == datetime.fromtimestamp(9)
+
+    def test_total_tokens_returns_independent_copy(self, make_timed_session):
+        """Mutating the returned TokenUsage does not affect later reads."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000, input=10)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main)
+
+        workflow.total_tokens.input = 999
+        assert workflow.total_tokens.input == 10
+
+    def test_times_skip_sessions_without_timing(self, tmp_path, make_timed_session):
+        """Sessions without timing data do not affect start and end times."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        untimed = SessionData(
+            session_id="ses_main",
+            files=[InteractionFile(file_path=tmp_path / "main.json", session_id="ses_main")],
+        )
+        sub = make_timed_session("ses_sub", 3000, 8000)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=untimed, sub_agent_sessions=[sub])
+
+        assert workflow.start_time == datetime.fromtimestamp(3)
+        assert workflow.end_time == datetime.fromtimestamp(8)
+
+        alone = SessionWorkflow(workflow_id="ses_main", main_session=untimed)
+        assert alone.start_time is None
+        assert alone.end_time is None
+
+    def test_all_sessions_sorted_by_start_and_refreshed(self, make_timed_session):
+        """all_sessions is chronological and picks up appended sub-agents."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000)
+        early = make_timed_session("ses_early", 1000, 1500)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main, sub_agent_sessions=[early])
+
+        ordered = workflow.all_sessions
+        assert [s.session_id for s in ordered] == ["ses_early", "ses_main"]
+        ordered.clear()
+        assert len(workflow.all_sessions) == 2
+
+        workflow.sub_agent_sessions.append(make_timed_session("ses_late", 3000, 4000))
+        assert [s.session_id for s in workflow.all_sessions] == ["ses_early", "ses_main", "ses_late"]
+
+    def test_all_sessions_refreshed_when_sub_agent_replaced_in_place(self, make_timed_session):
+        """Replacing a sub-agent with an equal-files session returns the new object."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000)
+        old = make_timed_session("ses_sub", 3000, 4000)
+        old.session_title = "old"
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main, sub_agent_sessions=[old])
+        assert workflow.all_sessions[1] is old
+
+        new = SessionData(session_id="ses_sub", files=old.files, session_title="new")
+        workflow.sub_agent_sessions[0] = new
+
+        assert workflow.all_sessions[1] is new
+        assert workflow.all_sessions[1].session_title == "new"
+
+    def test_workflow_without_sub_agents_uses_main_session(self, make_timed_session):
+        """A workflow with no sub-agents reports the main session's values."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000, input=10, output=2)
+        workflow = SessionWorkflow(workflow_id="ses_main", main_session=main)
+
+        assert workflow.start_time == main.start_time
+        assert workflow.end_time == main.end_time
+        assert workflow.all_sessions == [main]
+        tokens = workflow.total_tokens
+        assert (tokens.input, tokens.output) == (10, 2)
+        tokens.input = 99
+        assert workflow.total_tokens.input == 10
+        assert workflow._aggregates_cache is None
+
+    def test_all_sessions_matches_sort_for_ordered_and_unordered_sub_agents(self, make_timed_session):
+        """Merging into ordered sub-agents gives the same order as sorting."""
+        from ocmonitor.models.workflow import SessionWorkflow
+
+        main = make_timed_session("ses_main", 2000, 5000)
+        tie = make_timed_session("ses_tie", 2000, 2500)
+        early = make_timed_session("ses_early", 1000, 1500)
+        late = make_timed_session("ses_late", 3000, 4000)
+
+        for subs in ([early, tie, late], [late, early, tie]):
+            workflow = SessionWorkflow(workflow_id="ses_main", main_session=main, sub_agent_sessions=subs)
+            expected = sorted([main, *subs], key=lambda s: s.start_time)
+            assert [s.session_id for s in workflow.all_sessions] == [s.session_id for s in expected]
+            assert [s.session_id for s in workflow.all_sessions][:3] == ["ses_early", "ses_main", "ses_tie"]
@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from ocmonitor.services.price_fetcher import (
+    NOT_MODIFIED,
     acquire_lock,
     fetch_models_dev_json,
     get_remote_payload,
@@ -70,6 +71,54 @@ class TestFetchModelsDevJson:
         
         assert result is None
 
+    def test_conditional_fetch_sends_and_records_validators(self):
+        """Test that validators are sent and replaced by the response's."""
+        mock_response = Mock()
+        mock_response.read.return_value = b'{"providers": {}}'
+        mock_response.headers = {"ETag": '"v2"', "Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+        mock_cm = Mock()
+        mock_cm.__enter__ = Mock(return_value=mock_response)
+        mock_cm.__exit__ = Mock(return_value=False)
+        validators = {"etag": '"v1"'}
+
+        with patch('ocmonitor.services.price_fetcher.urlopen', return_value=mock_cm) as mock_open:
+            result = fetch_models_dev_json("https://models.dev/api.json", 8, validators)
+
+        request = mock_open.call_args[0][0]
+        assert request.get_header("If-none-match") == '"v1"'
+        assert result == {"providers": {}}
+        assert validators == {"etag": '"v2"', "last_modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+
+    def test_gzip_response_is_requested_and_decoded(self):
+        """Test that gzip is accepted and a gzip-encoded body is decompressed."""
+        import gzip
+
+        mock_response = Mock()
+        mock_response.read.return_value = gzip.compress(b'{"providers": {}}')
+        mock_response.headers = {"Content-Encoding": "gzip"}
+        mock_cm = Mock()
+        mock_cm.__enter__ = Mock(return_value=mock_response)
+        mock_cm.__exit__ = Mock(return_value=False)
+
+        with patch('ocmonitor.services.price_fetcher.urlopen', return_value=mock_cm) as mock_open:
+            result = fetch_models_dev_json("https://models.dev/api.json", timeout=8)
+
+        request = mock_open.call_args[0][0]
+        assert request.get_header("Accept-encoding") == "gzip"
+        assert result == {"providers": {}}
+
+    def test_not_modified_returns_sentinel(self):
+        """Test that a 304 response is reported as NOT_MODIFIED."""
+        from urllib.error import HTTPError
+
+        with patch(
+            'ocmonitor.services.price_fetcher.urlopen',
+            side_effect=HTTPError(None, 304, "Not Modified", None, None)
+        ):
+            result = fetch_models_dev_json("https://models.dev/api.json", 8, {"etag": '"v1"'})
+
+        assert result is NOT_MODIFIED
+
 
 class TestLoadCachedPayload:
     """Tests for load_cached_payload function."""
@@ -181,6 +230,34 @@ class TestLockMechanism:
         
         release_lock(lock_path)
 
+    def test_leftover_lock_file_does_not_block(self, tmp_path):
+        """Test that a lock file left by a crashed process is not a held lock."""
+        lock_path = tmp_path / "cache.lock"
+        lock_path.write_text("")
+
+        assert acquire_lock(lock_path, timeout=0.1) is True
+
+        release_lock(lock_path)
+        assert not lock_path.exists()
+
+    def test_waiter_acquires_after_release(self, tmp_path):
+        """Test that a waiting thread gets the lock once it is released."""
+        lock_path = tmp_path / "cache.lock"
+        assert acquire_lock(lock_path, timeout=0.5) is True
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(acquire_lock(lock_path, timeout=2.0))
+        )
+        thread.start()
+        time.sleep(0.05)
+        release_lock(lock_path)
+        thread.join()
+
+        assert results == [True]
+        assert lock_path.exists()
+        release_lock(lock_path)
+
 
 class TestGetRemotePayload:
     """Tests for get_remote_payload function."""
@@ -308,6 +385,97 @@ class TestGetRemotePayload:
         
         assert result is None
 
+    def test_not_modified_extends_cached_payload(self, tmp_path):
+        """Test that a 304 keeps the cached payload and pushes out its expiry."""
+        cache_path = tmp_path / "cache.json"
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        save_cached_payload_atomic(cache_path, {
+            "schema_version": 1,
+            "expires_at": past.isoformat(),
+            "etag": '"v1"',
+            "payload": {"test": "cached"},
+        })
+
+        with patch(
+            'ocmonitor.services.price_fetcher.fetch_models_dev_json',
+            return_value=NOT_MODIFIED
+        ) as mock_fetch:
+            result = get_remote_payload(
+                url="https://models.dev/api.json",
+                timeout=8,
+                cache_path=cache_path,
+                cache_ttl_hours=24,
+            )
+
+        assert mock_fetch.call_args[0][2] == {"etag": '"v1"'}
+        assert result == {"test": "cached"}
+        updated = load_cached_payload(cache_path)
+        assert updated["etag"] == '"v1"'
+        assert datetime.fromisoformat(updated["expires_at"]) > datetime.now(timezone.utc)
+
+    def test_unchanged_stale_cache_is_parsed_once(self, tmp_path):
+        """Test the cache is not re-read after locking when the file is unchanged."""
+        cache_path = tmp_path / "cache.json"
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        save_cached_payload_atomic(cache_path, {
+            "schema_version": 1,
+            "expires_at": past.isoformat(),
+            "payload": {"test": "stale"},
+        })
+
+        with patch(
+            'ocmonitor.services.price_fetcher.load_cached_payload',
+            wraps=load_cached_payload
+        ) as mock_load, patch(
+            'ocmonitor.services.price_fetcher.fetch_models_dev_json',
+            return_value=None
+        ):
+            result = get_remote_payload(
+                url="https://models.dev/api.json",
+                timeout=8,
+                cache_path=cache_path,
+                cache_ttl_hours=24,
+            )
+
+        assert mock_load.call_count == 1
+        assert result == {"test": "stale"}
+
+    def test_cache_refreshed_while_waiting_for_lock_is_reloaded(self, tmp_path):
+        """Test a cache rewritten by another process before locking is used."""
+        cache_path = tmp_path / "cache.json"
+        now = datetime.now(timezone.utc)
+        save_cached_payload_atomic(cache_path, {
+            "schema_version": 1,
+            "expires_at": (now - timedelta(hours=1)).isoformat(),
+            "payload": {"test": "stale"},
+        })
+
+        def refresh_then_lock(lock_path):
+            save_cached_payload_atomic(cache_path, {
+                "schema_version": 1,
+                "expires_at": (now + timedelta(hours=24)).isoformat(),
+                "payload": {"test": "fresh from other process"},
+            })
+            return True
+
+        with patch(
+            'ocmonitor.services.price_fetcher.acquire_lock',
+            side_effect=refresh_then_lock
+        ), patch(
+            'ocmonitor.services.price_fetcher.release_lock'
+        ), patch(
+            'ocmonitor.services.price_fetcher.fetch_models_dev_json'
+        ) as mock_fetch:
+            result = get_remote_payload(
+                url="https://models.dev/api.json",
+                timeout=8,
+                cache_path=cache_path,
+                cache_ttl_hours=24,
+            )
+
+        mock_fetch.assert_not_called()
+        assert result == {"test": "fresh from other process"}
+
 
 class TestMapModelsDevToLocal:
     """Tests for map_models_dev_to_local function."""
@@ -347,6 +515,33 @@ class TestMapModelsDevToLocal:
             assert result[key]["contextWindow"] == 128000
             assert result[key]["sessionQuota"] == 0.0
 
+    def test_bare_and_prefixed_keys_share_one_entry(self):
+        """Test both keys of a model alias the same pricing dict."""
+        payload = {
+            "providers": {
+                "openai": {"models": {"gpt-4": {"cost": {"prompt": 3.00}}}},
+                "azure": {"models": {"gpt-4": {"cost": {"prompt": 9.00}}}},
+            }
+        }
+
+        result = map_models_dev_to_local(payload)
+
+        assert result["gpt-4"] is result["openai/gpt-4"]
+        assert result["gpt-4"]["input"] == 3.00
+        assert result["azure/gpt-4"]["input"] == 9.00
+
+    def test_keys_are_lowercased_and_interned(self):
+        """Test generated keys are lowercase interned strings."""
+        import sys
+
+        payload = {"providers": {"OpenAI": {"models": {"GPT-4": {}}}}}
+
+        result = map_models_dev_to_local(payload)
+
+        assert set(result) == {"gpt-4", "openai/gpt-4"}
+        for key in result:
+            assert sys.intern(key) is key
+
     def test_map_missing_cost_fields_defaults_to_zero(self):
         """Test missing cost fields default to zero."""
         payload = {
@@ -0,0 +1,129 @@
+"""Tests for session grouper."""
+
+from ocmonitor.models.session import InteractionFile, SessionData, TimeData
+from ocmonitor.services.agent_registry import AgentRegistry
+from ocmonitor.services.session_grouper import SessionGrouper
+
+
+def make_session(session_id, start_ms, project="/work/alpha", agent="build"):
+    """Build a session with a single interaction starting at start_ms."""
+    interaction = InteractionFile(
+        file_path=f"/tmp/{session_id}.json",
+        session_id=session_id,
+        time_data=TimeData(created=start_ms, completed=start_ms + 1000),
+        project_path=project,
+        agent=agent,
+    )
+    return SessionData(session_id=session_id, files=[interaction], agent=agent)
+
+
+class TestSessionGrouper:
+    """Tests for SessionGrouper workflow grouping."""
+
+    def _grouper(self, tmp_path):
+        return SessionGrouper(AgentRegistry(agents_dir=tmp_path / "missing"))
+
+    def test_sub_agent_links_to_latest_earlier_main(self, tmp_path):
+        """Test that a sub-agent joins the closest main that started before it."""
+        sessions = [
+            make_session("main-old", 1_000),
+            make_session("main-new", 5_000),
+            make_session("main-later", 9_000),
+            make_session("sub", 6_000, agent="explore"),
+        ]
+
+        workflows = {w.workflow_id: w for w in self._grouper(tmp_path).group_sessions(sessions)}
+
+        assert [s.session_id for s in workflows["main-new"].sub_agent_sessions] == ["sub"]
+        assert workflows["main-old"].sub_agent_sessions == []
+        assert workflows["main-later"].sub_agent_sessions == []
+
+    def test_sub_agent_only_matches_same_project(self, tmp_path):
+        """Test that mains on other projects are never chosen as parents."""
+        sessions = [
+            make_session("main-alpha", 1_000),
+            make_session("main-beta", 5_000, project="/work/beta"),
+            make_session("sub", 6_000, agent="explore"),
+        ]
+
+        workflows = {w.workflow_id: w for w in self._grouper(tmp_path).group_sessions(sessions)}
+
+        assert [s.session_id for s in workflows["main-alpha"].sub_agent_sessions] == ["sub"]
+        assert workflows["main-beta"].sub_agent_sessions == []
+
+    def test_sub_agent_before_any_main_becomes_own_workflow(self, tmp_path):
+        """Test that sub-agents without an earlier main stay standalone."""
+        sessions = [
+            make_session("sub", 1_000, agent="explore"),
+            make_session("main", 5_000),
+        ]
+
+        workflows = {w.workflow_id: w for w in self._grouper(tmp_path).group_sessions(sessions)}
+
+        assert set(workflows) == {"sub", "main"}
+        assert workflows["main"].sub_agent_sessions == []
+
+    def test_equal_start_times_pick_first_main(self, tmp_path):
+        """Test that ties between mains resolve to the first in sort order."""
+        sessions = [
+            make_session("main-a", 5_000),
+            make_session("main-b", 5_000),
+            make_session("sub", 5_000, agent="explore"),
+        ]
+
+        workflows = {w.workflow_id: w for w in self._grouper(tmp_path).group_sessions(sessions)}
+
+        assert [s.session_id for s in workflows["main-a"].sub_agent_sessions] == ["sub"]
+        assert workflows["main-b"].sub_agent_sessions == []
+
+    def test_workflows_and_sub_agents_are_ordered_by_start_time(self, tmp_path):
+        """Test ordering of workflows (newest first) and sub-agents (oldest first)."""
+        sessions = [
+            make_session("sub-late", 8_000, agent="explore"),
+            make_session("main-new", 5_000),
+            make_session("sub-early", 6_000, agent="explore"),
+            make_session("main-old", 1_000),
+        ]
+
+        workflows = self._grouper(tmp_path).group_sessions(sessions)
+
+        assert [w.workflow_id for w in workflows] == ["main-new", "main-old"]
+        assert [s.session_id for s in workflows[0].sub_agent_sessions] == [
+            "sub-early",
+            "sub-late",
+        ]
+
+    def test_orphan_workflows_sorted_among_mains(self, tmp_path):
+        """Test orphan sub-agent workflows interleave with mains by start time."""
+        sessions = [
+            make_session("main-beta", 3_000, project="/work/beta"),
+            make_session("orphan", 2_000, project="/work/gamma", agent="explore"),
+            make_session("main-a", 1_000),
+            make_session("main-b", 1_000),
+            make_session("main-new", 4_000),
+        ]
+
+        workflows = self._grouper(tmp_path).group_sessions(sessions)
+
+        assert [w.workflow_id for w in workflows] == [
+            "main-new", "main-beta", "orphan", "main-a", "main-b"
+        ]
+
+    def test_reloaded_agents_change_grouping(self, tmp_path):
+        """Test that reloading agents is reflected in the next grouping."""
+        agents_dir = tmp_path / "agent"
+        agents_dir.mkdir()
+        grouper = SessionGrouper(AgentRegistry(agents_dir=agents_dir))
+        sessions = [
+            make_session("main", 1_000),
+            make_session("review", 2_000, agent="reviewer"),
+        ]
+
+        assert len(grouper.group_sessions(sessions)) == 2
+
+        (agents_dir / "reviewer.md").write_text("---\nmode: subagent\n---\n")
+        grouper.reload_agents()
+        workflows = grouper.group_sessions(sessions)
+
+        assert [w.workflow_id for w in workflows] == ["main"]
+        assert [s.session_id for s in workflows[0].sub_agent_sessions] == ["review"]
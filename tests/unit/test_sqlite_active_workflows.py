@@ -115,3 +115,93 @@ def test_get_all_active_workflows_orders_by_latest_parent_activity(tmp_path: Pat
     )
 
     assert [w["workflow_id"] for w in workflows[:2]] == ["older-parent", "newer-parent"]
+
+
+def _insert_session(conn, session_id, parent_id, created_ms, message_ms):
+    conn.execute(
+        "INSERT INTO session (id, project_id, parent_id, title, time_created, time_updated) VALUES (?, ?, ?, ?, ?, ?)",
+        (session_id, "proj", parent_id, session_id, created_ms, created_ms),
+    )
+    conn.execute(
+        "INSERT INTO message (id, session_id, time_created, time_updated, data) VALUES (?, ?, ?, ?, ?)",
+        (f"msg-{session_id}", session_id, message_ms, message_ms, _assistant_message()),
+    )
+
+
+def test_get_all_active_workflows_loads_sub_agents_in_bulk(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "opencode.db"
+    conn = sqlite3.connect(db_path)
+    _create_base_schema(conn)
+    now_ms = int(time.time() * 1000)
+    conn.execute(
+        "INSERT INTO project (id, worktree, name) VALUES (?, ?, ?)",
+        ("proj", "/tmp/project", "project"),
+    )
+    for parent in ("parent-a", "parent-b"):
+        _insert_session(conn, parent, None, now_ms - 10_000, now_ms - 1_000)
+        for idx in range(3):
+            _insert_session(
+                conn, f"{parent}-sub-{idx}", parent, now_ms - 9_000 + idx, now_ms
+            )
+    # Sub-agent whose parent has no token data
+    conn.execute(
+        "INSERT INTO session (id, project_id, parent_id, title, time_created, time_updated) VALUES (?, ?, ?, ?, ?, ?)",
+        ("acp-parent", "proj", None, "ACP", now_ms - 10_000, now_ms - 10_000),
+    )
+    _insert_session(conn, "orphan-sub", "acp-parent", now_ms - 8_000, now_ms)
+    conn.commit()
+    conn.close()
+
+    statements = []
+    original_get_connection = SQLiteProcessor._get_connection
+
+    def traced_connection(path):
+        traced = original_get_connection(path)
+        traced.set_trace_callback(statements.append)
+        return traced
+
+    monkeypatch.setattr(SQLiteProcessor, "_get_connection", traced_connection)
+
+    workflows = SQLiteProcessor.get_all_active_workflows(
+        db_path=db_path, active_threshold_minutes=60
+    )
+
+    by_id = {w["workflow_id"]: w for w in workflows}
+    assert set(by_id) == {"parent-a", "parent-b", "acp-parent"}
+    assert [s.session_id for s in by_id["parent-a"]["sub_agents"]] == [
+        "parent-a-sub-0",
+        "parent-a-sub-1",
+        "parent-a-sub-2",
+    ]
+    assert by_id["parent-b"]["session_count"] == 4
+    assert by_id["acp-parent"]["main_session"].session_id == "orphan-sub"
+    message_queries = [sql for sql in statements if "data FROM message" in sql]
+    assert len(message_queries) == 3
+
+
+def test_active_workflows_reuse_caller_connection(tmp_path: Path):
+    db_path = tmp_path / "opencode.db"
+    conn = sqlite3.connect(db_path)
+    _create_base_schema(conn)
+    now_ms = int(time.time() * 1000)
+    conn.execute(
+        "INSERT INTO project (id, worktree, name) VALUES (?, ?, ?)",
+        ("proj", "/tmp/project", "project"),
+    )
+    _insert_session(conn, "parent", None, now_ms - 10_000, now_ms - 1_000)
+    conn.commit()
+    conn.close()
+
+    polling_conn = SQLiteProcessor.open_polling_connection(db_path)
+    try:
+        first = SQLiteProcessor.get_all_active_workflows(conn=polling_conn)
+        second = SQLiteProcessor.get_all_active_workflows(conn=polling_conn)
+        recent = SQLiteProcessor.get_most_recent_workflow(conn=polling_conn)
+
+        assert [w["workflow_id"] for w in first] == ["parent"]
+        assert [w["workflow_id"] for w in second] == ["parent"]
+        assert recent["workflow_id"] == "parent"
+        # Connection is still open for the next refresh
+        assert polling_conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+    finally:
+        polling_conn.close()
@@ -362,6 +362,14 @@ class TestToolUsageStatsModel:
         assert stats.success_count == 0
         assert stats.failure_count == 0
 
+    def test_from_counts_matches_constructor(self):
+        """Test that from_counts builds the same object as the constructor."""
+        stats = ToolUsageStats.from_counts("bash", 3, 2, 1)
+        assert stats == ToolUsageStats(
+            tool_name="bash", total_calls=3, success_count=2, failure_count=1
+        )
+        assert ToolUsageStats.from_counts("bash", "3", 2, 1).total_calls == 3
+
 
 class TestLoadToolUsageByModelForSessions:
     """Tests for SQLiteProcessor.load_tool_usage_by_model_for_sessions."""
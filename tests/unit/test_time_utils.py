@@ -339,3 +339,61 @@ class TestCurrentRanges:
         assert isinstance(start, date)
         assert isinstance(end, date)
         assert (end - start).days == 6
+
+
+class TestComputeP50OutputRatesByModel:
+    """Tests for compute_p50_output_rates_by_model."""
+
+    def _file(self, model_id, output, duration_ms, finish_reason=None, input_tokens=0):
+        from ocmonitor.models.session import InteractionFile, TimeData, TokenUsage
+
+        return InteractionFile(
+            file_path="inter.json",
+            session_id="ses_1",
+            model_id=model_id,
+            tokens=TokenUsage(input=input_tokens, output=output),
+            time_data=TimeData(created=0, completed=duration_ms),
+            finish_reason=finish_reason,
+        )
+
+    def test_groups_rates_by_model(self):
+        """Test that medians are computed per model from eligible interactions."""
+        from ocmonitor.utils.time_utils import (
+            compute_p50_output_rate,
+            compute_p50_output_rates_by_model,
+        )
+
+        files = [
+            self._file("model-a", 100, 1000),
+            self._file("model-a", 300, 1000),
+            self._file("model-a", 900, 1000),
+            self._file("model-b", 50, 1000, finish_reason="tool-calls"),
+            self._file("model-c", 0, 0),
+        ]
+
+        result = compute_p50_output_rates_by_model(files)
+
+        assert result == {"model-a": 300.0, "model-b": 0.0}
+        assert result["model-a"] == compute_p50_output_rate(files[:3])
+
+    def test_reports_most_recent_file_per_model(self):
+        """Test that the newest file per model is returned alongside the rates."""
+        from ocmonitor.utils.time_utils import (
+            compute_p50_output_rates_and_recent_by_model,
+            compute_p50_output_rates_by_model,
+        )
+
+        files = [
+            self._file("model-a", 100, 1000),
+            self._file("model-b", 50, 1000),
+            self._file("model-a", 300, 1000),
+            self._file("model-a", 900, 1000),
+        ]
+        files[2].time_data.created = 500
+        files[3].time_data.created = 500
+
+        rates, most_recent = compute_p50_output_rates_and_recent_by_model(files)
+
+        assert rates == compute_p50_output_rates_by_model(files)
+        assert most_recent["model-a"] is files[2]
+        assert most_recent["model-b"] is files[1]